@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Shared Coordinate Transforms
+
+Purpose: One vectorized implementation of the geodetic / ECEF / ENU / AER
+         math used by the radar simulator, the track bank and the slew-to-cue
+         turret controller.
+JIRA: VRD-30 (Slew-to-Cue Logic Module) / VRD-32 (Radar)
+
+Conventions:
+- Geodetic: WGS-84 latitude/longitude (degrees), height above ellipsoid (m)
+- ECEF: Earth-Centered, Earth-Fixed Cartesian (m), arrays shaped (..., 3)
+- ENU: East-North-Up (m) around a `LocalFrame` origin
+- AER: azimuth 0-360 deg clockwise from North, elevation above the local
+  horizon (deg), slant range (m)
+- Pan/Tilt: turret angles; pan = azimuth minus the mount heading
+
+Every function accepts scalars or numpy arrays (element-wise). Per-site
+trigonometry (origin ECEF, ECEF->ENU rotation, frame-to-frame transforms) is
+computed once at construction so bulk conversions are a subtraction and a
+single (N,3)x(3,3) matrix multiply.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-17
+"""
+
+import numpy as np
+import argparse
+import time
+
+
+# WGS-84 ellipsoid
+WGS84_A = 6378137.0  # Semi-major axis (meters)
+WGS84_F = 1.0 / 298.257223563  # Flattening
+WGS84_E2 = WGS84_F * (2.0 - WGS84_F)  # First eccentricity squared
+
+
+def geodetic_to_ecef(lat_deg, lon_deg, alt_m):
+    """
+    WGS-84 geodetic to ECEF.
+
+    Args:
+        lat_deg: Latitude (degrees)
+        lon_deg: Longitude (degrees)
+        alt_m: Height above the ellipsoid (meters)
+
+    Returns:
+        ecef: Array (..., 3) of (x, y, z) in meters
+    """
+    lat = np.radians(lat_deg)
+    lon = np.radians(lon_deg)
+    sin_lat = np.sin(lat)
+    cos_lat = np.cos(lat)
+
+    # Prime vertical radius of curvature
+    n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+
+    x = (n + alt_m) * cos_lat * np.cos(lon)
+    y = (n + alt_m) * cos_lat * np.sin(lon)
+    z = (n * (1.0 - WGS84_E2) + alt_m) * sin_lat
+    return np.stack(np.broadcast_arrays(x, y, z), axis=-1)
+
+
+def ecef_to_geodetic(ecef, num_iterations=4):
+    """
+    ECEF to WGS-84 geodetic (Bowring iteration).
+
+    Four iterations reach sub-millimeter height error for any point within
+    a few hundred km of the surface.
+
+    Args:
+        ecef: Array (..., 3) of (x, y, z) in meters
+        num_iterations: Latitude refinement passes
+
+    Returns:
+        (lat_deg, lon_deg, alt_m): Geodetic coordinates
+    """
+    ecef = np.asarray(ecef, dtype=np.float64)
+    x, y, z = ecef[..., 0], ecef[..., 1], ecef[..., 2]
+
+    lon = np.arctan2(y, x)
+    p = np.hypot(x, y)
+
+    lat = np.arctan2(z, p * (1.0 - WGS84_E2))
+    for _ in range(num_iterations):
+        sin_lat = np.sin(lat)
+        n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+        lat = np.arctan2(z + WGS84_E2 * n * sin_lat, p)
+
+    # Height form that stays well conditioned near the poles
+    sin_lat = np.sin(lat)
+    alt_m = (p * np.cos(lat) + z * sin_lat
+             - WGS84_A * np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat))
+
+    return np.degrees(lat), np.degrees(lon), alt_m
+
+
+def ecef_to_enu_rotation(lat_deg, lon_deg):
+    """3x3 rotation taking ECEF offsets into the ENU frame at (lat, lon)."""
+    lat = np.radians(lat_deg)
+    lon = np.radians(lon_deg)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+    return np.array([
+        [-sin_lon, cos_lon, 0.0],
+        [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+        [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat],
+    ])
+
+
+def enu_to_aer(east_m, north_m, up_m):
+    """
+    ENU to AER.
+
+    Args:
+        east_m: East offset (meters)
+        north_m: North offset (meters)
+        up_m: Up offset (meters)
+
+    Returns:
+        (azimuth_deg, elevation_deg, range_m): azimuth in [0, 360)
+    """
+    horizontal_range = np.hypot(east_m, north_m)
+    range_m = np.hypot(horizontal_range, up_m)
+
+    azimuth_deg = np.mod(np.degrees(np.arctan2(east_m, north_m)), 360.0)
+    # mod of a tiny negative angle rounds to exactly 360.0
+    azimuth_deg = azimuth_deg - 360.0 * (azimuth_deg >= 360.0)
+
+    elevation_deg = np.degrees(np.arctan2(up_m, horizontal_range))
+
+    return azimuth_deg, elevation_deg, range_m
+
+
+def aer_to_enu(azimuth_deg, elevation_deg, range_m):
+    """
+    AER to ENU (inverse of `enu_to_aer`).
+
+    Returns:
+        (east_m, north_m, up_m)
+    """
+    az = np.radians(azimuth_deg)
+    el = np.radians(elevation_deg)
+    horizontal_range = range_m * np.cos(el)
+    return horizontal_range * np.sin(az), horizontal_range * np.cos(az), range_m * np.sin(el)
+
+
+def aer_to_pan_tilt(azimuth_deg, elevation_deg, heading_deg=0.0):
+    """
+    AER to turret pan/tilt for a level mount.
+
+    Args:
+        azimuth_deg: Azimuth (degrees clockwise from North)
+        elevation_deg: Elevation (degrees above horizon)
+        heading_deg: Bearing of the turret's pan-zero axis (degrees from North)
+
+    Returns:
+        (pan_deg, tilt_deg): pan in [0, 360)
+    """
+    pan_deg = np.mod(azimuth_deg - heading_deg, 360.0)
+    pan_deg = pan_deg - 360.0 * (pan_deg >= 360.0)
+    return pan_deg, elevation_deg
+
+
+class LocalFrame:
+    """
+    ENU frame anchored at a surveyed site (radar, turret, ...).
+
+    Caches the site's ECEF origin and ECEF->ENU rotation.
+    """
+
+    def __init__(self, lat_deg, lon_deg, alt_m):
+        """
+        Initialize local frame.
+
+        Args:
+            lat_deg: Origin latitude (degrees)
+            lon_deg: Origin longitude (degrees)
+            alt_m: Origin height (meters)
+        """
+        self.lat_deg = float(lat_deg)
+        self.lon_deg = float(lon_deg)
+        self.alt_m = float(alt_m)
+
+        self.origin_ecef = geodetic_to_ecef(self.lat_deg, self.lon_deg, self.alt_m)
+        self.rotation = ecef_to_enu_rotation(self.lat_deg, self.lon_deg)
+
+    def __repr__(self):
+        return f"LocalFrame({self.lat_deg:.7f}, {self.lon_deg:.7f}, {self.alt_m:.2f})"
+
+    def ecef_to_enu(self, ecef):
+        """ECEF (..., 3) to ENU (..., 3) in this frame."""
+        return (np.asarray(ecef, dtype=np.float64) - self.origin_ecef) @ self.rotation.T
+
+    def enu_to_ecef(self, enu):
+        """ENU (..., 3) in this frame to ECEF (..., 3)."""
+        # Rotation is orthonormal: ENU -> ECEF is the transpose
+        return np.asarray(enu, dtype=np.float64) @ self.rotation + self.origin_ecef
+
+    def geodetic_to_enu(self, lat_deg, lon_deg, alt_m):
+        """Geodetic to (east_m, north_m, up_m) in this frame."""
+        enu = self.ecef_to_enu(geodetic_to_ecef(lat_deg, lon_deg, alt_m))
+        return enu[..., 0], enu[..., 1], enu[..., 2]
+
+    def enu_to_geodetic(self, east_m, north_m, up_m):
+        """(east_m, north_m, up_m) in this frame to (lat_deg, lon_deg, alt_m)."""
+        enu = np.stack(np.broadcast_arrays(east_m, north_m, up_m), axis=-1)
+        return ecef_to_geodetic(self.enu_to_ecef(enu))
+
+    def geodetic_to_aer(self, lat_deg, lon_deg, alt_m):
+        """Geodetic to (azimuth_deg, elevation_deg, range_m) seen from this frame."""
+        return enu_to_aer(*self.geodetic_to_enu(lat_deg, lon_deg, alt_m))
+
+    def aer_to_geodetic(self, azimuth_deg, elevation_deg, range_m):
+        """(azimuth_deg, elevation_deg, range_m) seen from this frame to geodetic."""
+        return self.enu_to_geodetic(*aer_to_enu(azimuth_deg, elevation_deg, range_m))
+
+    def offset(self, lever_arm_enu_m):
+        """
+        Frame at a point displaced by a lever arm (e.g. GPS antenna ->
+        gimbal pivot).
+
+        Args:
+            lever_arm_enu_m: (east, north, up) offset from this origin (meters)
+
+        Returns:
+            LocalFrame at the displaced origin
+        """
+        lat_deg, lon_deg, alt_m = self.enu_to_geodetic(*np.asarray(lever_arm_enu_m, dtype=np.float64))
+        return LocalFrame(lat_deg, lon_deg, alt_m)
+
+
+class FrameTransform:
+    """
+    Rigid transform between two local ENU frames, e.g. radar -> turret.
+
+    enu_target = enu_source @ rotation.T + translation
+    """
+
+    def __init__(self, source, target):
+        """
+        Initialize frame transform.
+
+        Args:
+            source: LocalFrame the points are expressed in
+            target: LocalFrame to express them in
+        """
+        self.source = source
+        self.target = target
+
+        self.rotation = target.rotation @ source.rotation.T
+        self.translation = target.rotation @ (source.origin_ecef - target.origin_ecef)
+
+    def apply(self, enu):
+        """ENU (..., 3) in the source frame to ENU (..., 3) in the target frame."""
+        return np.asarray(enu, dtype=np.float64) @ self.rotation.T + self.translation
+
+    def aer(self, azimuth_deg, elevation_deg, range_m):
+        """Source-frame AER to target-frame (azimuth_deg, elevation_deg, range_m)."""
+        enu = np.stack(np.broadcast_arrays(*aer_to_enu(azimuth_deg, elevation_deg, range_m)), axis=-1)
+        enu = self.apply(enu)
+        return enu_to_aer(enu[..., 0], enu[..., 1], enu[..., 2])
+
+
+def radar_to_turret(radar_frame, turret_frame, lever_arm_enu_m=None):
+    """
+    Transform from radar-centred ENU to the turret gimbal's ENU.
+
+    Args:
+        radar_frame: LocalFrame of the radar (plot origin)
+        turret_frame: LocalFrame of the turret mount (surveyed position)
+        lever_arm_enu_m: Offset mount -> gimbal pivot (meters, ENU), optional
+
+    Returns:
+        FrameTransform radar ENU -> gimbal ENU
+    """
+    if lever_arm_enu_m is not None:
+        turret_frame = turret_frame.offset(lever_arm_enu_m)
+    return FrameTransform(radar_frame, turret_frame)
+
+
+def benchmark(num_points=1_000_000, repeats=3, seed=0):
+    """
+    Microbenchmark the bulk conversions on `num_points` random targets.
+
+    Args:
+        num_points: Batch size
+        repeats: Timing repeats (best is reported)
+        seed: Random seed
+
+    Returns:
+        results: Dict name -> best time (ms), plus 'num_points' and
+                 'round_trip_error_m' (geodetic -> ENU -> geodetic -> ENU)
+    """
+    rng = np.random.default_rng(seed)
+    radar = LocalFrame(37.7749, -122.4194, 10.0)
+    turret = LocalFrame(37.7790, -122.4120, 50.0)
+    transform = radar_to_turret(radar, turret, lever_arm_enu_m=(0.0, 0.0, 1.5))
+
+    east = rng.uniform(-20_000, 20_000, num_points)
+    north = rng.uniform(-20_000, 20_000, num_points)
+    up = rng.uniform(10, 3000, num_points)
+    lat, lon, alt = radar.enu_to_geodetic(east, north, up)
+    az, el, r = enu_to_aer(east, north, up)
+
+    cases = {
+        'geodetic_to_ecef': lambda: geodetic_to_ecef(lat, lon, alt),
+        'geodetic_to_enu': lambda: turret.geodetic_to_enu(lat, lon, alt),
+        'enu_to_geodetic': lambda: turret.enu_to_geodetic(east, north, up),
+        'enu_to_aer': lambda: enu_to_aer(east, north, up),
+        'aer_to_enu': lambda: aer_to_enu(az, el, r),
+        'radar_aer_to_turret_aer': lambda: transform.aer(az, el, r),
+    }
+
+    results = {'num_points': num_points}
+    for name, fn in cases.items():
+        best = np.inf
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        results[name] = best * 1e3
+
+    back = radar.geodetic_to_enu(lat, lon, alt)
+    results['round_trip_error_m'] = float(max(np.max(np.abs(back[0] - east)),
+                                              np.max(np.abs(back[1] - north)),
+                                              np.max(np.abs(back[2] - up))))
+    return results
+
+
+def main():
+    """
+    Main execution: Coordinate transform microbenchmark.
+
+    Usage:
+        python common/coordinates.py --points 1000000
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark shared coordinate transforms (VRD-30/VRD-32)'
+    )
+    parser.add_argument('--points', type=int, default=1_000_000,
+                        help='Batch size (default: 1000000)')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Timing repeats (default: 3)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  SHARED COORDINATE TRANSFORMS - MICROBENCHMARK")
+    print("=" * 70)
+    print()
+
+    results = benchmark(num_points=args.points, repeats=args.repeats)
+
+    print(f"[INFO] Batch: {results['num_points']} points, best of {args.repeats}")
+    for name, value in results.items():
+        if name in ('num_points', 'round_trip_error_m'):
+            continue
+        print(f"       - {name:<24} {value:8.1f} ms  ({value * 1e6 / results['num_points']:.1f} ns/pt)")
+    print(f"[INFO] Round-trip error: {results['round_trip_error_m'] * 1e3:.4f} mm")
+    print(f"[SUCCESS] Benchmark complete")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared pinhole camera model
+
+Tests validate that:
+- The optical axis lands on the image centre and the FOV edge on the border
+- Image axes follow pan/tilt (right = increasing pan, down = decreasing tilt)
+- Pixels back-project to the projected line of sight; sizes scale with depth
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-18
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add common directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from camera_model import PinholeCamera
+from coordinates import aer_to_enu
+
+
+class TestProjection:
+    """ENU -> pixels"""
+
+    def test_axis_and_fov_edge(self):
+        """Test: Boresight -> centre; half-FOV off-axis -> image edge"""
+        camera = PinholeCamera(640, 512, 50.0, pan_deg=120.0, tilt_deg=0.0)
+        enu = np.stack([aer_to_enu(120.0, 0.0, 800.0), aer_to_enu(145.0, 0.0, 800.0)])
+        x_px, y_px, depth_m, in_view = camera.project(enu)
+        assert np.allclose([x_px[0], y_px[0]], [319.5, 255.5])
+        assert np.isclose(depth_m[0], 800.0)
+        # 25 deg to the right along the horizon lands on the outer edge of
+        # the last column, just outside [-0.5, width - 0.5)
+        assert np.isclose(x_px[1], 639.5)
+        assert in_view[0] and not in_view[1]
+        assert np.isclose(camera.vertical_fov_deg,
+                          2.0 * np.degrees(np.arctan(256.0 / camera.focal_px)))
+
+    def test_axes_directions_and_behind(self):
+        """Test: Higher pan -> right, higher elevation -> up; behind is out of view"""
+        camera = PinholeCamera(640, 512, 50.0, pan_deg=0.0, tilt_deg=0.0)
+        enu = np.array([[10.0, 500.0, 0.0], [0.0, 500.0, 10.0], [0.0, -500.0, 0.0]])
+        x_px, y_px, _, in_view = camera.project(enu)
+        assert x_px[0] > 319.5 and np.isclose(y_px[0], 255.5)
+        assert y_px[1] < 255.5 and np.isclose(x_px[1], 319.5)
+        assert not in_view[2] and np.isnan(x_px[2])
+
+
+class TestInverse:
+    """Pixels -> rays, apparent size"""
+
+    def test_ray_round_trip_and_size(self):
+        """Test: pixel_to_ray inverts project; size halves when depth doubles"""
+        rng = np.random.default_rng(3)
+        camera = PinholeCamera(640, 512, 24.0, pan_deg=300.0, tilt_deg=-3.0)
+        enu = np.stack(aer_to_enu(rng.uniform(290, 310, 200), rng.uniform(-8, 2, 200),
+                                  rng.uniform(100, 5000, 200)), axis=-1)
+        x_px, y_px, depth_m, in_view = camera.project(enu)
+        rays = camera.pixel_to_ray(x_px, y_px)
+        assert np.allclose(rays, enu / np.linalg.norm(enu, axis=1, keepdims=True))
+        assert np.allclose(camera.apparent_size_px(1.0, np.array([500.0, 1000.0])),
+                           [camera.focal_px / 500.0, camera.focal_px / 1000.0])
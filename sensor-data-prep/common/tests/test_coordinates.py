@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for shared coordinate transforms
+
+Tests validate that:
+- Geodetic/ECEF and ENU/AER conversions round-trip and match known values
+- Radar -> turret frame transforms account for site offsets and lever arms
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-17
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add common directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from coordinates import (
+    WGS84_A, geodetic_to_ecef, ecef_to_geodetic, enu_to_aer, aer_to_enu,
+    aer_to_pan_tilt, LocalFrame, radar_to_turret
+)
+
+
+class TestGeodetic:
+    """Geodetic <-> ECEF <-> ENU"""
+
+    def test_ecef_known_points(self):
+        """Test: Equator/prime meridian and North pole land on the axes"""
+        assert np.allclose(geodetic_to_ecef(0.0, 0.0, 0.0), [WGS84_A, 0.0, 0.0])
+        pole = geodetic_to_ecef(90.0, 0.0, 0.0)
+        assert np.allclose(pole[:2], 0.0, atol=1e-6)
+        assert np.isclose(pole[2], 6356752.314245, atol=1e-3)
+
+    def test_round_trip(self):
+        """Test: geodetic -> ECEF -> geodetic at sub-mm across latitudes"""
+        rng = np.random.default_rng(1)
+        lat = rng.uniform(-89.0, 89.0, 1000)
+        lon = rng.uniform(-180.0, 180.0, 1000)
+        alt = rng.uniform(-100.0, 20_000.0, 1000)
+        lat2, lon2, alt2 = ecef_to_geodetic(geodetic_to_ecef(lat, lon, alt))
+        assert np.max(np.abs(lat2 - lat)) < 1e-9
+        assert np.max(np.abs(lon2 - lon)) < 1e-9
+        assert np.max(np.abs(alt2 - alt)) < 1e-4
+
+    def test_enu_axes_and_curvature(self):
+        """Test: Local axes point the right way; the horizon drops with range"""
+        frame = LocalFrame(37.7749, -122.4194, 10.0)
+        lat, lon, alt = frame.enu_to_geodetic(0.0, 1000.0, 0.0)
+        assert lat > frame.lat_deg and np.isclose(lon, frame.lon_deg)
+
+        # A point 50 km North on the ellipsoid surface sits ~196 m below the
+        # tangent plane
+        east, north, up = frame.geodetic_to_enu(lat + 0.45, frame.lon_deg, frame.alt_m)
+        assert abs(east) < 1e-6
+        assert -210.0 < up < -180.0
+
+
+class TestAer:
+    """ENU <-> AER and turret angles"""
+
+    def test_cardinal_directions(self):
+        """Test: North/East/South/West map to 0/90/180/270 deg"""
+        az, el, r = enu_to_aer(np.array([0.0, 1.0, 0.0, -1.0]),
+                               np.array([1.0, 0.0, -1.0, 0.0]),
+                               np.zeros(4))
+        assert np.allclose(az, [0.0, 90.0, 180.0, 270.0])
+        assert np.allclose(el, 0.0) and np.allclose(r, 1.0)
+
+    def test_azimuth_never_360(self):
+        """Test: A point a hair West of North wraps into [0, 360)"""
+        az, _, _ = enu_to_aer(-1e-14, 1000.0, 0.0)
+        assert 0.0 <= az < 360.0
+
+    def test_aer_round_trip_and_pan(self):
+        """Test: aer_to_enu inverts enu_to_aer; pan subtracts mount heading"""
+        rng = np.random.default_rng(2)
+        enu = rng.uniform(-5000, 5000, (3, 500))
+        back = aer_to_enu(*enu_to_aer(*enu))
+        assert np.allclose(np.stack(back), enu)
+        pan, tilt = aer_to_pan_tilt(np.array([10.0, 350.0]), np.array([5.0, 6.0]), heading_deg=20.0)
+        assert np.allclose(pan, [350.0, 330.0]) and np.allclose(tilt, [5.0, 6.0])
+
+
+class TestRadarToTurret:
+    """Frame-to-frame transforms"""
+
+    def test_matches_geodetic_path(self):
+        """Test: Radar AER -> turret AER equals going through geodetic"""
+        radar = LocalFrame(37.7749, -122.4194, 10.0)
+        turret = LocalFrame(37.7790, -122.4120, 50.0)
+        transform = radar_to_turret(radar, turret, lever_arm_enu_m=(0.5, -0.2, 1.5))
+        gimbal = turret.offset((0.5, -0.2, 1.5))
+
+        az = np.array([0.0, 45.0, 200.0])
+        el = np.array([2.0, 10.0, 30.0])
+        r = np.array([3000.0, 8000.0, 1500.0])
+        expected = gimbal.geodetic_to_aer(*radar.aer_to_geodetic(az, el, r))
+        result = transform.aer(az, el, r)
+        for a, b in zip(result, expected):
+            assert np.allclose(a, b, atol=1e-6)
+
+        # Lever arm moves the gimbal 1.5 m above the surveyed mount
+        assert np.isclose(gimbal.alt_m - turret.alt_m, 1.5, atol=1e-3)
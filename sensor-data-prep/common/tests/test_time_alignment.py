@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for multi-sensor time alignment
+
+Tests validate that:
+- Nearest / as-of / forward joins respect tolerance and keys
+- Interpolation bridges only short gaps and wraps azimuth correctly
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-16
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add common directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from time_alignment import join_indices, interpolate, interpolate_aer
+from timebase import NS_PER_SECOND, format_iso, parse_iso
+
+
+class TestJoins:
+    """Index joins"""
+
+    def setup_method(self):
+        self.right = np.array([0, 10, 20, 30], dtype=np.int64)
+        self.left = np.array([-5, 4, 6, 20, 34, 50], dtype=np.int64)
+
+    def test_nearest_with_tolerance(self):
+        """Test: Nearest match, dropped beyond tolerance"""
+        index = join_indices(self.left, self.right, 'nearest', tolerance_ns=5)
+        assert list(index) == [0, 0, 1, 2, 3, -1]
+
+    def test_backward_and_forward(self):
+        """Test: As-of picks the sample at/before, forward the one at/after"""
+        assert list(join_indices(self.left, self.right, 'backward')) == [-1, 0, 0, 2, 3, 3]
+        assert list(join_indices(self.left, self.right, 'forward')) == [0, 1, 1, 2, -1, -1]
+
+    def test_keys_do_not_cross(self):
+        """Test: Keyed joins never match another key, unsorted input allowed"""
+        right = np.array([30, 0, 10, 5], dtype=np.int64)
+        right_by = np.array([1, 1, 2, 2])
+        left = np.array([12, 12, 12], dtype=np.int64)
+        left_by = np.array([1, 2, 3])
+        index = join_indices(left, right, 'backward', left_by=left_by, right_by=right_by)
+        assert list(index) == [1, 2, -1]
+
+    def test_keyed_nearest_ignores_closer_other_key(self):
+        """Test: A closer sample of a neighbouring key never hides a same-key match"""
+        right = np.array([100, 50, 70], dtype=np.int64)
+        right_by = np.array(['A', 'B', 'A'])
+        index = join_indices(np.array([0], dtype=np.int64), right[:2], 'nearest',
+                             left_by=np.array(['B']), right_by=right_by[:2])
+        assert list(index) == [1]
+        index = join_indices(np.array([0, 60], dtype=np.int64), right, 'nearest',
+                             left_by=np.array(['B', 'A']), right_by=right_by)
+        assert list(index) == [1, 2]
+
+    def test_empty_right_side(self):
+        """Test: No right samples means no match, with or without keys"""
+        empty = np.array([], dtype=np.int64)
+        for method in ('nearest', 'backward', 'forward'):
+            assert list(join_indices(self.left, empty, method)) == [-1] * 6
+            index = join_indices([1, 2, 3], [], method, left_by=[1, 2, 3], right_by=[])
+            assert list(index) == [-1] * 3
+
+
+class TestInterpolation:
+    """Linear and angular interpolation"""
+
+    def test_max_gap(self):
+        """Test: Values interpolate inside short gaps only"""
+        right = np.array([0, 10, 100], dtype=np.int64)
+        values = np.array([0.0, 10.0, 100.0])
+        result = interpolate(np.array([5, 50, 10]), right, values, max_gap_ns=20)
+        assert result[0] == 5.0
+        assert np.isnan(result[1])
+        assert result[2] == 10.0
+
+    def test_azimuth_wraps_short_arc(self):
+        """Test: 350 deg -> 10 deg passes through North"""
+        plot_ns = np.array([0, NS_PER_SECOND], dtype=np.int64)
+        az, el, r = interpolate_aer(np.array([NS_PER_SECOND // 2]), plot_ns,
+                                    [350.0, 10.0], [5.0, 7.0], [1000.0, 1100.0])
+        assert np.isclose(az[0], 0.0) or np.isclose(az[0], 360.0)
+        assert np.isclose(el[0], 6.0)
+        assert np.isclose(r[0], 1050.0)
+
+    def test_window_without_plots(self):
+        """Test: A keyed window with no plots interpolates to NaN"""
+        az, el, r = interpolate_aer(np.array([0, 10]), [], [], [], [],
+                                    frame_track_id=np.array([1, 2]), plot_track_id=[])
+        assert np.all(np.isnan(az)) and np.all(np.isnan(el)) and np.all(np.isnan(r))
+        result = interpolate([0, 10], [], [], left_by=[1, 2], right_by=[])
+        assert np.all(np.isnan(result))
+
+
+class TestTimebase:
+    """ISO formatting round trip"""
+
+    def test_iso_round_trip(self):
+        """Test: format_iso / parse_iso are inverse at ns resolution"""
+        stamps = np.array([1_768_564_800 * NS_PER_SECOND + 123_456_789] * 3, dtype=np.int64)
+        strings = format_iso(stamps, unit='ns')
+        assert strings[0] == '2026-01-16T12:00:00.123456789Z'
+        assert np.array_equal(parse_iso(strings), stamps)
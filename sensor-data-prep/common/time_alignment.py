@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Multi-Sensor Time Alignment
+
+Purpose: Join sensor streams running at different rates (radar 1 Hz, thermal
+         60 Hz, polarimetric 163 fps) on the shared int64-ns timebase.
+JIRA: VRD-26 (Thermal Infrared & Night-Time Tracking) / VRD-32 (Radar)
+
+All joins are vectorized `np.searchsorted` lookups of a "left" timestamp
+array into a "right" one (e.g. camera frames into radar plots):
+
+- nearest: closest right sample in time
+- backward (as-of): last right sample at or before the left time
+- forward: first right sample at or after the left time
+- interpolate: linear interpolation between the bracketing right samples
+  (azimuth-style angles are interpolated along the short arc)
+
+Each join takes an optional tolerance / maximum gap and optional `by` keys
+(e.g. radar track IDs) so samples are only matched within the same key.
+Keys are folded into the search value as `rank(key) * span + (t - t_min)`,
+which keeps one searchsorted call per join regardless of the number of keys.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-16
+"""
+
+import numpy as np
+import argparse
+import json
+import time
+from pathlib import Path
+
+from timebase import NS_PER_SECOND, seconds_to_ns
+
+
+JOIN_METHODS = ('nearest', 'backward', 'forward')
+
+
+def _search_values(left_ns, right_ns, left_by=None, right_by=None):
+    """
+    Map (key, time) pairs of both sides onto one sortable int64 axis.
+
+    Returns:
+        left_values, right_values: int64 arrays
+        left_rank, right_rank: Key ranks (None without keys)
+    """
+    left_ns = np.asarray(left_ns, dtype=np.int64)
+    right_ns = np.asarray(right_ns, dtype=np.int64)
+    if left_by is None and right_by is None:
+        return left_ns, right_ns, None, None
+    if left_by is None or right_by is None:
+        raise ValueError("left_by and right_by must be given together")
+
+    keys = np.unique(np.asarray(right_by))
+    if len(keys) == 0:
+        # Empty right side: no key to match, callers report no match
+        left_rank = np.full(len(left_ns), -1, dtype=np.int64)
+        return left_ns, right_ns, left_rank, np.zeros(0, dtype=np.int64)
+    right_rank = np.searchsorted(keys, right_by)
+    left_rank = np.minimum(np.searchsorted(keys, left_by), len(keys) - 1)
+    # Left keys absent on the right get rank -1: they can never match
+    left_rank = np.where(keys[left_rank] == np.asarray(left_by), left_rank, -1)
+
+    both = np.concatenate([left_ns, right_ns])
+    t_min = both.min() if len(both) else 0
+    span = int(both.max() - t_min) + 1 if len(both) else 1
+    if span * (len(keys) + 1) >= np.iinfo(np.int64).max:
+        raise OverflowError("Time span x number of keys does not fit in int64")
+
+    left_values = (left_rank + 1) * span + (left_ns - t_min)
+    right_values = (right_rank + 1) * span + (right_ns - t_min)
+    return left_values, right_values, left_rank, right_rank
+
+
+def _sorted(right_values, assume_sorted):
+    """Sorted search values and the permutation back to original rows."""
+    if assume_sorted:
+        return right_values, None
+    order = np.argsort(right_values, kind='stable')
+    return right_values[order], order
+
+
+def join_indices(left_ns, right_ns, method='nearest', tolerance_ns=None,
+                 left_by=None, right_by=None, assume_sorted=False):
+    """
+    Index of the matching right sample for every left sample.
+
+    Args:
+        left_ns: (L,) int64 query timestamps
+        right_ns: (R,) int64 timestamps to match against
+        method: 'nearest', 'backward' (as-of) or 'forward'
+        tolerance_ns: Maximum |left - right| (None = unlimited)
+        left_by, right_by: Optional keys; matches must share the key
+        assume_sorted: Right side already sorted by (key, time)
+
+    Returns:
+        index: (L,) int64 row of `right_ns` (-1 = no match)
+    """
+    if method not in JOIN_METHODS:
+        raise ValueError(f"Unknown join method '{method}', expected one of {JOIN_METHODS}")
+
+    left_values, right_values, left_rank, right_rank = _search_values(left_ns, right_ns, left_by, right_by)
+    right_sorted, order = _sorted(right_values, assume_sorted)
+    n = len(right_sorted)
+    index = np.full(len(left_values), -1, dtype=np.int64)
+    if n == 0 or len(left_values) == 0:
+        return index
+
+    # Candidate before (<=) and after (>=) each left value
+    after = np.searchsorted(right_sorted, left_values, side='left')
+    before = np.searchsorted(right_sorted, left_values, side='right') - 1
+    has_before = before >= 0
+    has_after = after < n
+    before_c = np.clip(before, 0, n - 1)
+    after_c = np.clip(after, 0, n - 1)
+    rows_before = before_c if order is None else order[before_c]
+    rows_after = after_c if order is None else order[after_c]
+    if left_rank is not None:
+        # Candidates from a neighbouring key are not matches: checked per side
+        # before choosing, so a closer other-key sample never shadows a match
+        has_before &= (left_rank >= 0) & (right_rank[rows_before] == left_rank)
+        has_after &= (left_rank >= 0) & (right_rank[rows_after] == left_rank)
+    gap_before = np.where(has_before, left_values - right_sorted[before_c], np.iinfo(np.int64).max)
+    gap_after = np.where(has_after, right_sorted[after_c] - left_values, np.iinfo(np.int64).max)
+
+    if method == 'backward':
+        rows, gap = rows_before, gap_before
+    elif method == 'forward':
+        rows, gap = rows_after, gap_after
+    else:
+        use_after = gap_after < gap_before
+        rows = np.where(use_after, rows_after, rows_before)
+        gap = np.minimum(gap_before, gap_after)
+
+    valid = gap < np.iinfo(np.int64).max
+    if tolerance_ns is not None:
+        valid &= gap <= tolerance_ns
+
+    index[valid] = rows[valid]
+    return index
+
+
+def interpolation_weights(left_ns, right_ns, max_gap_ns=None, left_by=None, right_by=None,
+                          assume_sorted=False):
+    """
+    Bracketing right samples and linear weights for each left sample.
+
+    Returns:
+        i0, i1: (L,) rows of `right_ns` before/after each left time
+        weight: (L,) fraction of the way from i0 to i1
+        valid: (L,) True where both neighbours exist (same key) and the
+               bracketing gap is within `max_gap_ns`
+    """
+    left_values, right_values, left_rank, right_rank = _search_values(left_ns, right_ns, left_by, right_by)
+    right_sorted, order = _sorted(right_values, assume_sorted)
+    n = len(right_sorted)
+    if n == 0:
+        empty = np.zeros(len(left_values), dtype=np.int64)
+        return empty, empty, np.zeros(len(left_values)), np.zeros(len(left_values), dtype=bool)
+
+    i0 = np.clip(np.searchsorted(right_sorted, left_values, side='right') - 1, 0, n - 1)
+    i1 = np.minimum(i0 + 1, n - 1)
+    t0 = right_sorted[i0]
+    t1 = right_sorted[i1]
+
+    exact = t0 == left_values
+    inside = (t0 <= left_values) & (left_values <= t1) & (i1 > i0)
+    valid = exact | inside
+    if max_gap_ns is not None:
+        valid &= exact | (t1 - t0 <= max_gap_ns)
+
+    span = np.where(t1 > t0, t1 - t0, 1)
+    weight = np.where(exact, 0.0, (left_values - t0) / span)
+
+    r0 = i0 if order is None else order[i0]
+    r1 = i1 if order is None else order[i1]
+    if left_rank is not None:
+        valid &= (left_rank >= 0) & (right_rank[r0] == left_rank)
+        valid &= exact | (right_rank[r1] == left_rank)
+
+    return r0, r1, weight, valid
+
+
+def interpolate(left_ns, right_ns, values, max_gap_ns=None, angular_deg=False,
+                left_by=None, right_by=None, assume_sorted=False):
+    """
+    Linearly interpolate right-side values onto left timestamps.
+
+    Args:
+        left_ns: (L,) query timestamps
+        right_ns: (R,) sample timestamps
+        values: (R,) or (R, K) sample values
+        max_gap_ns: Do not interpolate across gaps longer than this
+        angular_deg: Values are angles in degrees (short-arc interpolation,
+                     result wrapped to [0, 360))
+        left_by, right_by: Optional keys (e.g. track IDs)
+        assume_sorted: Right side already sorted by (key, time)
+
+    Returns:
+        (L,) or (L, K) float array, NaN where no valid bracket exists
+    """
+    i0, i1, weight, valid = interpolation_weights(left_ns, right_ns, max_gap_ns,
+                                                  left_by, right_by, assume_sorted)
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return np.full((len(weight),) + values.shape[1:], np.nan)
+
+    w = weight.reshape((-1,) + (1,) * (values.ndim - 1))
+    v0, v1 = values[i0], values[i1]
+    delta = v1 - v0
+    if angular_deg:
+        delta = np.mod(delta + 180.0, 360.0) - 180.0
+    result = v0 + w * delta
+    if angular_deg:
+        result = np.mod(result, 360.0)
+    result[~valid] = np.nan
+    return result
+
+
+def interpolate_aer(frame_ns, plot_ns, azimuth_deg, elevation_deg, range_m,
+                    max_gap_ns=int(2.5 * NS_PER_SECOND), frame_track_id=None, plot_track_id=None):
+    """
+    Radar AER interpolated onto camera frame times.
+
+    With track IDs, each (frame, track) query row is interpolated only from
+    plots of that track; pass e.g. `np.repeat(frames, n)` / `np.tile(ids, F)`
+    to evaluate several tracks per frame.
+
+    Args:
+        frame_ns: (F,) frame timestamps (int64 ns)
+        plot_ns: (P,) radar plot timestamps
+        azimuth_deg, elevation_deg, range_m: (P,) plot AER
+        max_gap_ns: Maximum plot spacing to bridge (default 2.5 radar scans)
+        frame_track_id, plot_track_id: Optional per-row track keys
+
+    Returns:
+        azimuth_deg, elevation_deg, range_m: (F,) interpolated (NaN = no data)
+    """
+    i0, i1, weight, valid = interpolation_weights(frame_ns, plot_ns, max_gap_ns,
+                                                  frame_track_id, plot_track_id)
+    azimuth = np.asarray(azimuth_deg, dtype=np.float64)
+    elevation = np.asarray(elevation_deg, dtype=np.float64)
+    rng = np.asarray(range_m, dtype=np.float64)
+    if len(azimuth) == 0:
+        nan = np.full(len(weight), np.nan)
+        return nan, nan.copy(), nan.copy()
+
+    d_az = np.mod(azimuth[i1] - azimuth[i0] + 180.0, 360.0) - 180.0
+    az = np.mod(azimuth[i0] + weight * d_az, 360.0)
+    el = elevation[i0] + weight * (elevation[i1] - elevation[i0])
+    r = rng[i0] + weight * (rng[i1] - rng[i0])
+    for column in (az, el, r):
+        column[~valid] = np.nan
+    return az, el, r
+
+
+def frame_times(start_ns, duration_s, rate_hz):
+    """Regular frame timestamps (int64 ns) for a sensor running at `rate_hz`."""
+    return seconds_to_ns(np.arange(int(duration_s * rate_hz)) / rate_hz, start_ns)
+
+
+def main():
+    """
+    Benchmark: align an hour of radar, thermal and polarimetric timestamps.
+
+    Usage:
+        python common/time_alignment.py --duration 3600
+    """
+    parser = argparse.ArgumentParser(description='Multi-sensor time alignment benchmark')
+    parser.add_argument('--duration', type=float, default=3600.0, help='Log duration (s)')
+    parser.add_argument('--tracks', type=int, default=50, help='Radar tracks')
+    parser.add_argument('--thermal-fps', type=float, default=60.0, help='Thermal frame rate (FLIR Boson 640: 60 Hz)')
+    parser.add_argument('--calibration', type=str,
+                        default=str(Path(__file__).parents[1] / 'polarimetric-eo' / 'config' / 'sensor_calibration.json'),
+                        help='Polarimetric sensor calibration (frame rate)')
+    args = parser.parse_args()
+
+    with open(args.calibration) as f:
+        polarimetric_fps = json.load(f)['sensor_intrinsics']['frame_rate_fps']
+
+    rng = np.random.default_rng(0)
+    start_ns = 1_768_564_800 * NS_PER_SECOND  # 2026-01-16T12:00:00Z
+
+    # Radar: 1 Hz scans with per-plot jitter, several tracks per scan
+    scans = frame_times(start_ns, args.duration, 1.0)
+    plot_ns = np.repeat(scans, args.tracks) + rng.integers(0, 5_000_000, len(scans) * args.tracks)
+    plot_track = np.tile(np.arange(args.tracks), len(scans))
+    azimuth = np.mod(np.repeat(np.arange(len(scans)) * 0.5, args.tracks)
+                     + np.tile(np.arange(args.tracks) * 7.0, len(scans)), 360.0)
+    elevation = np.full(len(plot_ns), 5.0)
+    range_m = np.full(len(plot_ns), 1500.0)
+
+    thermal_ns = frame_times(start_ns, args.duration, args.thermal_fps)
+    polar_ns = frame_times(start_ns, args.duration, polarimetric_fps)
+
+    print(f"[INFO] Time alignment benchmark ({args.duration:.0f} s log):")
+    print(f"       - Radar plots: {len(plot_ns):,} ({args.tracks} tracks @ 1 Hz)")
+    print(f"       - Thermal frames: {len(thermal_ns):,} @ {args.thermal_fps:g} Hz")
+    print(f"       - Polarimetric frames: {len(polar_ns):,} @ {polarimetric_fps} fps")
+
+    t0 = time.perf_counter()
+    nearest = join_indices(polar_ns, thermal_ns, 'nearest', tolerance_ns=NS_PER_SECOND // 120,
+                           assume_sorted=True)
+    t1 = time.perf_counter()
+    asof = join_indices(thermal_ns, np.sort(plot_ns), 'backward', tolerance_ns=2 * NS_PER_SECOND,
+                        assume_sorted=True)
+    t2 = time.perf_counter()
+    track = 0
+    mask = plot_track == track
+    az, el, r = interpolate_aer(thermal_ns, plot_ns[mask], azimuth[mask], elevation[mask], range_m[mask])
+    t3 = time.perf_counter()
+    frames = np.repeat(thermal_ns[:int(args.thermal_fps * 60)], args.tracks)
+    keys = np.tile(np.arange(args.tracks), len(frames) // args.tracks)
+    keyed = interpolate_aer(frames, plot_ns, azimuth, elevation, range_m,
+                            frame_track_id=keys, plot_track_id=plot_track)
+    t4 = time.perf_counter()
+
+    print(f"\n[SUCCESS] Joins:")
+    print(f"       - Polarimetric -> thermal nearest: {1e3 * (t1 - t0):7.1f} ms "
+          f"({np.mean(nearest >= 0):.1%} matched)")
+    print(f"       - Thermal -> radar as-of:          {1e3 * (t2 - t1):7.1f} ms "
+          f"({np.mean(asof >= 0):.1%} matched)")
+    print(f"       - Radar AER -> thermal frames:     {1e3 * (t3 - t2):7.1f} ms "
+          f"({np.mean(np.isfinite(az)):.1%} interpolated)")
+    print(f"       - Keyed AER, {len(frames):,} (frame, track) rows: {1e3 * (t4 - t3):7.1f} ms "
+          f"({np.mean(np.isfinite(keyed[0])):.1%} interpolated)")
+
+
+if __name__ == '__main__':
+    main()
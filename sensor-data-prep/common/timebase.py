@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Shared Integer-Nanosecond Timebase
+
+Purpose: One time representation for radar, thermal and polarimetric samples
+         so streams can be joined with `np.searchsorted` instead of string or
+         datetime comparisons.
+JIRA: VRD-26 (Thermal Infrared & Night-Time Tracking) / VRD-32 (Radar)
+
+Conventions:
+- Every timestamp is an int64 count of nanoseconds since the Unix epoch (UTC)
+- "Now" comes from a monotonic clock anchored to UTC once per process, so
+  successive stamps never go backwards (NTP steps do not leak in)
+- ISO 8601 strings ("2026-01-16T12:00:00.123456Z") are produced only at
+  export, vectorized over arrays, formatting each distinct time once
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-16
+"""
+
+import numpy as np
+import time
+from datetime import datetime, timezone
+
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class Timebase:
+    """
+    Monotonic nanosecond clock anchored to UTC.
+    """
+
+    def __init__(self, epoch_ns=None):
+        """
+        Initialize timebase.
+
+        Args:
+            epoch_ns: UTC time (ns) of the anchor; default: wall clock now
+        """
+        self._monotonic_anchor_ns = time.monotonic_ns()
+        self.epoch_ns = int(epoch_ns) if epoch_ns is not None else time.time_ns()
+
+    def now_ns(self):
+        """Current UTC time in nanoseconds (monotonic, never decreases)."""
+        return self.epoch_ns + (time.monotonic_ns() - self._monotonic_anchor_ns)
+
+
+# Process-wide clock shared by all simulators
+TIMEBASE = Timebase()
+
+
+def now_ns():
+    """Current UTC time (int ns) from the shared timebase."""
+    return TIMEBASE.now_ns()
+
+
+def seconds_to_ns(seconds, start_ns=0):
+    """
+    Offsets in seconds (float) to absolute int64 ns timestamps.
+
+    Args:
+        seconds: Scalar or array of offsets (s)
+        start_ns: Timestamp (ns) of offset zero
+
+    Returns:
+        int64 array (or scalar) of timestamps (ns)
+    """
+    return np.int64(start_ns) + np.round(np.asarray(seconds, dtype=np.float64) * NS_PER_SECOND).astype(np.int64)
+
+
+def ns_to_seconds(timestamps_ns, start_ns=0):
+    """Absolute int64 ns timestamps to float seconds relative to `start_ns`."""
+    return (np.asarray(timestamps_ns, dtype=np.int64) - np.int64(start_ns)) / NS_PER_SECOND
+
+
+def datetime_to_ns(value):
+    """datetime (naive = UTC) to int ns."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * NS_PER_SECOND + delta.microseconds * 1000
+
+
+def ns_to_datetime(timestamp_ns):
+    """int ns to naive UTC datetime (microsecond resolution)."""
+    return np.datetime64(int(timestamp_ns), 'ns').astype('datetime64[us]').item()
+
+
+def format_iso(timestamps_ns, unit='us'):
+    """
+    Vectorized ISO 8601 UTC formatting ('...Z').
+
+    Only distinct timestamps are formatted; plots from one scan share their
+    time, so a long log costs one string per scan rather than per row.
+
+    Args:
+        timestamps_ns: Scalar or array of int64 ns timestamps
+        unit: Resolution of the output ('s', 'ms', 'us', 'ns')
+
+    Returns:
+        str for scalar input, otherwise numpy array of str
+    """
+    values = np.asarray(timestamps_ns, dtype=np.int64)
+    if values.ndim == 0:
+        return np.datetime_as_string(values.astype('datetime64[ns]'), unit=unit) + 'Z'
+    unique, inverse = np.unique(values, return_inverse=True)
+    strings = np.datetime_as_string(unique.astype('datetime64[ns]'), unit=unit)
+    return np.char.add(strings, 'Z')[inverse.reshape(values.shape)]
+
+
+def parse_iso(strings):
+    """
+    Vectorized ISO 8601 parsing (with or without trailing 'Z') to int64 ns.
+    """
+    values = np.char.rstrip(np.asarray(strings, dtype=str), 'Z')
+    return values.astype('datetime64[ns]').astype(np.int64)
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Real-Time Radar Plot Emitter (Live Mode)
+
+Purpose: Replay simulated radar plots over local UDP at the radar's update
+         rate, so the slew-to-cue loop can be exercised under realistic
+         timing instead of reading a finished CSV.
+JIRA: VRD-32 - Simulate Radar Track Output (Plot Extractor)
+
+Wire format (little-endian), one or more datagrams per radar scan:
+
+    Header (32 bytes):
+        magic           4s   b'VRDP'
+        radar_id        u2
+        num_plots       u2
+        sequence        u4   per-radar datagram counter
+        reserved        u4
+        scan_time_ns    i8   scheduled scan time (UTC ns)
+        send_time_ns    i8   wall clock at send (UTC ns)
+    Plots (num_plots x 20 bytes, PLOT_DTYPE):
+        track_id i4, azimuth_deg f4, elevation_deg f4, range_m f4, confidence f4
+
+Scans larger than `max_plots_per_datagram` are split so datagrams stay under
+a typical 1500-byte MTU. Each radar runs as its own asyncio task on a shared
+event loop; pacing uses the loop's monotonic clock, with optional Gaussian
+jitter added to each scheduled send time. Send latency (actual send minus
+intended send) is collected per radar in a fixed-bin histogram.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-16
+"""
+
+import sys
+import numpy as np
+import asyncio
+import argparse
+import struct
+from pathlib import Path
+
+# Add shared modules (sensor-data-prep/common) to Python path
+sys.path.append(str(Path(__file__).parents[3] / 'common'))
+
+from timebase import now_ns
+
+
+HEADER = struct.Struct('<4sHHIIqq')
+MAGIC = b'VRDP'
+
+PLOT_DTYPE = np.dtype([
+    ('track_id', '<i4'),
+    ('azimuth_deg', '<f4'),
+    ('elevation_deg', '<f4'),
+    ('range_m', '<f4'),
+    ('confidence', '<f4'),
+])
+
+
+def encode_datagram(radar_id, sequence, scan_time_ns, send_time_ns, plots):
+    """
+    Pack one datagram.
+
+    Args:
+        radar_id: Radar identifier (0-65535)
+        sequence: Datagram sequence number for this radar
+        scan_time_ns: Scheduled scan time (UTC ns)
+        send_time_ns: Send wall-clock time (UTC ns)
+        plots: Structured array with PLOT_DTYPE
+
+    Returns:
+        bytes
+    """
+    header = HEADER.pack(MAGIC, radar_id, len(plots), sequence & 0xFFFFFFFF, 0,
+                         scan_time_ns, send_time_ns)
+    return header + plots.tobytes()
+
+
+def decode_datagram(data):
+    """
+    Unpack one datagram.
+
+    Returns:
+        header: Dict with radar_id, num_plots, sequence, scan_time_ns, send_time_ns
+        plots: Structured array (PLOT_DTYPE), zero-copy view of `data`
+    """
+    magic, radar_id, num_plots, sequence, _, scan_time_ns, send_time_ns = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a radar plot datagram")
+    plots = np.frombuffer(data, dtype=PLOT_DTYPE, count=num_plots, offset=HEADER.size)
+    header = {
+        'radar_id': radar_id,
+        'num_plots': num_plots,
+        'sequence': sequence,
+        'scan_time_ns': scan_time_ns,
+        'send_time_ns': send_time_ns,
+    }
+    return header, plots
+
+
+def batch_to_plots(batch):
+    """Convert a TrackBatch (or slice of one) to a PLOT_DTYPE array."""
+    plots = np.empty(len(batch), dtype=PLOT_DTYPE)
+    plots['track_id'] = batch.track_id
+    plots['azimuth_deg'] = batch.azimuth_deg
+    plots['elevation_deg'] = batch.elevation_deg
+    plots['range_m'] = batch.range_m
+    plots['confidence'] = batch.confidence
+    return plots
+
+
+class LatencyHistogram:
+    """
+    Fixed log-spaced latency histogram (1 us .. 10 s) with O(1) memory.
+    """
+
+    def __init__(self, min_s=1e-6, max_s=10.0, bins_per_decade=20):
+        decades = np.log10(max_s) - np.log10(min_s)
+        self.edges = np.logspace(np.log10(min_s), np.log10(max_s),
+                                 int(decades * bins_per_decade) + 1)
+        # Bin 0 collects values below min_s (incl. negative), last bin above max_s
+        self.counts = np.zeros(len(self.edges) + 1, dtype=np.int64)
+        self.total = 0
+        self.sum_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, latency_s):
+        """Add one or more latency samples (seconds)."""
+        values = np.atleast_1d(np.asarray(latency_s, dtype=np.float64))
+        np.add.at(self.counts, np.searchsorted(self.edges, values, side='right'), 1)
+        self.total += len(values)
+        self.sum_s += float(values.sum())
+        self.max_s = max(self.max_s, float(values.max()))
+
+    def percentile(self, q):
+        """Approximate percentile (upper bin edge, capped at the max), in seconds."""
+        if self.total == 0:
+            return None
+        rank = np.searchsorted(np.cumsum(self.counts), q / 100.0 * self.total, side='left')
+        rank = min(rank, len(self.edges) - 1)
+        return min(float(self.edges[rank]), self.max_s)
+
+    def summary(self):
+        """Return count/mean/percentiles in milliseconds."""
+        if self.total == 0:
+            return {'count': 0}
+        return {
+            'count': self.total,
+            'mean_ms': 1e3 * self.sum_s / self.total,
+            'p50_ms': 1e3 * self.percentile(50),
+            'p95_ms': 1e3 * self.percentile(95),
+            'p99_ms': 1e3 * self.percentile(99),
+            'max_ms': 1e3 * self.max_s,
+        }
+
+
+class RadarPlotReceiver(asyncio.DatagramProtocol):
+    """
+    Datagram protocol that decodes plots into a bounded asyncio.Queue.
+
+    UDP cannot push back on the sender, so when the queue is full the oldest
+    scan is dropped and counted.
+    """
+
+    def __init__(self, queue):
+        self.queue = queue
+        self.num_received = 0
+        self.num_dropped = 0
+
+    def datagram_received(self, data, addr):
+        header, plots = decode_datagram(data)
+        header['receive_time_ns'] = now_ns()
+        self.num_received += 1
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.num_dropped += 1
+        self.queue.put_nowait((header, plots))
+
+
+class RadarLiveEmitter:
+    """
+    Publishes one or more radars' plot streams over UDP in real time.
+    """
+
+    def __init__(self, host='127.0.0.1', port=50032, jitter_ms=0.0,
+                 max_plots_per_datagram=64, seed=None):
+        """
+        Initialize emitter.
+
+        Args:
+            host: Destination host (localhost by default)
+            port: Destination UDP port
+            jitter_ms: Std-dev of Gaussian jitter added to each send time (ms)
+            max_plots_per_datagram: Split scans into datagrams of this many plots
+            seed: Random seed for jitter
+        """
+        self.host = host
+        self.port = port
+        self.jitter_s = jitter_ms / 1000.0
+        self.max_plots_per_datagram = max_plots_per_datagram
+        self.rng = np.random.default_rng(seed)
+
+        self.radars = []
+        self.latency = {}
+
+    def add_radar(self, radar_id, batch):
+        """
+        Register a radar stream.
+
+        Args:
+            radar_id: Radar identifier carried in every datagram
+            batch: TrackBatch of plots (sorted by time) to replay
+        """
+        self.radars.append((radar_id, batch.sort_by_time()))
+        self.latency[radar_id] = LatencyHistogram()
+
+    async def _run_radar(self, transport, radar_id, batch, t0_loop, t0_wall_ns, speed):
+        loop = asyncio.get_running_loop()
+        histogram = self.latency[radar_id]
+        sequence = 0
+
+        for scan_time_s, scan in batch.iter_scans():
+            jitter = self.rng.normal(0.0, self.jitter_s) if self.jitter_s > 0 else 0.0
+            target = t0_loop + max(scan_time_s / speed + jitter, 0.0)
+            delay = target - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            scan_time_ns = t0_wall_ns + int(scan_time_s / speed * 1e9)
+            plots = batch_to_plots(scan)
+            for start in range(0, len(plots), self.max_plots_per_datagram):
+                chunk = plots[start:start + self.max_plots_per_datagram]
+                transport.sendto(encode_datagram(radar_id, sequence, scan_time_ns,
+                                                 now_ns(), chunk))
+                sequence += 1
+
+            histogram.record(loop.time() - target)
+
+    async def run(self, speed=1.0):
+        """
+        Replay all registered radars concurrently.
+
+        Args:
+            speed: Replay speed factor (1.0 = real time)
+
+        Returns:
+            report: Dict of radar_id -> latency summary (ms)
+        """
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=(self.host, self.port)
+        )
+        try:
+            t0_loop = loop.time()
+            t0_wall_ns = now_ns()
+            await asyncio.gather(*[
+                self._run_radar(transport, radar_id, batch, t0_loop, t0_wall_ns, speed)
+                for radar_id, batch in self.radars
+            ])
+        finally:
+            transport.close()
+
+        return self.report()
+
+    def report(self):
+        """Per-radar send-latency summary."""
+        return {radar_id: histogram.summary() for radar_id, histogram in self.latency.items()}
+
+
+def main():
+    """
+    Demo: replay several simulated radars to a local receiver and report timing.
+
+    Usage:
+        python src/simulations/radar_live_emitter.py --radars 2 --duration 10 --jitter-ms 5
+    """
+    from simulate_radar_tracks import RadarTrackSimulator
+    from simulate_air_picture import AirPictureGenerator
+
+    parser = argparse.ArgumentParser(description='Real-time radar plot emitter')
+    parser.add_argument('--radars', type=int, default=2, help='Number of simultaneous radars')
+    parser.add_argument('--targets', type=int, default=200, help='Targets per radar')
+    parser.add_argument('--duration', type=float, default=10.0, help='Replay duration (s)')
+    parser.add_argument('--update-rate', type=float, default=1.0, help='Radar update rate (Hz)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Send jitter std-dev (ms)')
+    parser.add_argument('--port', type=int, default=50032, help='UDP port')
+    args = parser.parse_args()
+
+    emitter = RadarLiveEmitter(port=args.port, jitter_ms=args.jitter_ms)
+    for radar_id in range(args.radars):
+        radar = RadarTrackSimulator(update_rate_hz=args.update_rate)
+        picture = AirPictureGenerator(radar, seed=radar_id).generate(
+            num_targets=args.targets, duration_sec=args.duration, mean_lifetime_sec=args.duration
+        )
+        emitter.add_radar(radar_id, picture.plots)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=10000)
+        transport, receiver = await loop.create_datagram_endpoint(
+            lambda: RadarPlotReceiver(queue), local_addr=('127.0.0.1', args.port)
+        )
+        try:
+            report = await emitter.run()
+            await asyncio.sleep(0.1)
+        finally:
+            transport.close()
+        return report, receiver
+
+    report, receiver = asyncio.run(run())
+
+    print(f"\n[INFO] Live replay complete:")
+    print(f"       - Datagrams received: {receiver.num_received} (dropped {receiver.num_dropped})")
+    for radar_id, stats in report.items():
+        print(f"       - Radar {radar_id}: {stats['count']} scans, "
+              f"send latency p50={stats['p50_ms']:.3f} ms, p99={stats['p99_ms']:.3f} ms, "
+              f"max={stats['max_ms']:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -32,12 +32,21 @@ Date: 2026-01-10
 Version: 1.0
 """
 
+import sys
 import numpy as np
 import json
-from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
 
+# Add shared modules (sensor-data-prep/common) to Python path
+sys.path.append(str(Path(__file__).parents[3] / 'common'))
+
+from track_batch import TrackBatch
+from timebase import now_ns, format_iso, NS_PER_SECOND
+from track_io import write_tracks_csv, write_tracks_binary
+from track_statistics import TrackStatistics
+from coordinates import LocalFrame, enu_to_aer
+
 
 class RadarTrackSimulator:
     """
@@ -94,6 +103,7 @@ class RadarTrackSimulator:
         self.radar_lat = radar_lat
         self.radar_lon = radar_lon
         self.radar_alt = radar_alt_m
+        self.frame = LocalFrame(radar_lat, radar_lon, radar_alt_m)
 
         # Track storage
         self.tracks = []
@@ -130,7 +140,7 @@ class RadarTrackSimulator:
         """
         num_samples = int(duration_sec * self.update_rate_hz)
 
-        start_time = datetime.utcnow()
+        start_ns = now_ns()
 
         ground_truth = []
 
@@ -143,10 +153,10 @@ class RadarTrackSimulator:
             pos_U = start_position[2] + velocity[2] * t
 
             # Convert ENU to spherical (Az, El, Range) from radar
-            az, el, rng = self._enu_to_aer(pos_E, pos_N, pos_U)
+            az, el, rng = enu_to_aer(pos_E, pos_N, pos_U)
 
             ground_truth.append({
-                'timestamp': start_time + timedelta(seconds=t),
+                'timestamp_ns': start_ns + round(t * NS_PER_SECOND),
                 'track_id': track_id,
                 'true_azimuth_deg': az,
                 'true_elevation_deg': el,
@@ -190,7 +200,7 @@ class RadarTrackSimulator:
         """
         num_samples = int(duration_sec * self.update_rate_hz)
 
-        start_time = datetime.utcnow()
+        start_ns = now_ns()
 
         ground_truth = []
 
@@ -204,10 +214,10 @@ class RadarTrackSimulator:
             pos_N = center_position[1] + radius_m * np.sin(angle_rad)
             pos_U = center_position[2]  # Constant altitude
 
-            az, el, rng = self._enu_to_aer(pos_E, pos_N, pos_U)
+            az, el, rng = enu_to_aer(pos_E, pos_N, pos_U)
 
             ground_truth.append({
-                'timestamp': start_time + timedelta(seconds=t),
+                'timestamp_ns': start_ns + round(t * NS_PER_SECOND),
                 'track_id': track_id,
                 'true_azimuth_deg': az,
                 'true_elevation_deg': el,
@@ -226,45 +236,7 @@ class RadarTrackSimulator:
 
         return ground_truth
 
-    def _enu_to_aer(self, east_m, north_m, up_m):
-        """
-        Convert ENU (East-North-Up) coordinates to AER (Azimuth-Elevation-Range).
-
-        Coordinate Systems:
-        - ENU: Local Cartesian (radar at origin)
-          - East: +X axis
-          - North: +Y axis
-          - Up: +Z axis
-        - AER: Spherical (radar-centric)
-          - Azimuth: 0° = North, 90° = East (clockwise from North)
-          - Elevation: 0° = horizon, 90° = zenith
-          - Range: Slant distance from radar
-
-        Args:
-            east_m: East offset from radar (meters)
-            north_m: North offset from radar (meters)
-            up_m: Height above radar (meters)
-
-        Returns:
-            azimuth_deg: Azimuth angle (degrees, 0-360)
-            elevation_deg: Elevation angle (degrees, -90 to +90)
-            range_m: Slant range (meters)
-        """
-        # Slant range
-        range_m = np.sqrt(east_m**2 + north_m**2 + up_m**2)
-
-        # Azimuth (0° = North, 90° = East, clockwise)
-        azimuth_deg = np.rad2deg(np.arctan2(east_m, north_m))
-        if azimuth_deg < 0:
-            azimuth_deg += 360.0
-
-        # Elevation (angle above horizon)
-        ground_range = np.sqrt(east_m**2 + north_m**2)
-        elevation_deg = np.rad2deg(np.arctan2(up_m, ground_range))
-
-        return azimuth_deg, elevation_deg, range_m
-
-    def inject_measurement_noise(self, ground_truth):
+    def inject_measurement_noise(self, ground_truth, statistics=None):
         """
         Inject Gaussian measurement noise to ground truth positions.
 
@@ -277,6 +249,7 @@ class RadarTrackSimulator:
 
         Args:
             ground_truth: List of dicts with true positions
+            statistics: Optional TrackStatistics updated as detections are produced
 
         Returns:
             noisy_tracks: List of dicts with measured positions (some dropped)
@@ -287,6 +260,9 @@ class RadarTrackSimulator:
         num_missed = 0
 
         for gt in ground_truth:
+            if statistics is not None:
+                statistics.record_expected(gt['track_id'])
+
             # Simulate missed detection (packet dropout)
             if np.random.rand() < self.missed_detection_prob:
                 num_missed += 1
@@ -318,8 +294,8 @@ class RadarTrackSimulator:
             # Also models detection quality (could be extended with SNR)
             confidence = max(0.1, 1.0 - (meas_rng / self.max_range))
 
-            noisy_tracks.append({
-                'timestamp': gt['timestamp'],
+            detection = {
+                'timestamp_ns': gt['timestamp_ns'],
                 'track_id': gt['track_id'],
                 'azimuth_deg': meas_az,
                 'elevation_deg': meas_el,
@@ -329,7 +305,11 @@ class RadarTrackSimulator:
                 'true_azimuth_deg': true_az,
                 'true_elevation_deg': true_el,
                 'true_range_m': true_rng
-            })
+            }
+            noisy_tracks.append(detection)
+
+            if statistics is not None:
+                statistics.record_detection(detection)
 
         detection_rate = num_detections / len(ground_truth)
 
@@ -341,6 +321,44 @@ class RadarTrackSimulator:
 
         return noisy_tracks
 
+    def inject_measurement_noise_batch(self, truth, rng=None, statistics=None):
+        """
+        Vectorized counterpart of `inject_measurement_noise` for a TrackBatch.
+
+        Applies the same noise model (Gaussian AER errors, azimuth wrap,
+        elevation clamp, missed detections, range-based confidence) to every
+        row of `truth` in one pass.
+
+        Args:
+            truth: TrackBatch whose true_* columns hold the ground truth AER
+            rng: numpy Generator (default: fresh unseeded generator)
+            statistics: Optional TrackStatistics updated with this batch
+
+        Returns:
+            noisy: TrackBatch with measured AER for the detected rows only
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+
+        num_samples = len(truth)
+        detected = rng.random(num_samples) >= self.missed_detection_prob
+        noisy = truth.select(detected)
+        num_detections = len(noisy)
+
+        meas_az = noisy.true_azimuth_deg + rng.normal(0, self.sigma_az, num_detections)
+        meas_el = noisy.true_elevation_deg + rng.normal(0, self.sigma_el, num_detections)
+        meas_rng = noisy.true_range_m + rng.normal(0, self.sigma_range, num_detections)
+
+        noisy.azimuth_deg = np.mod(meas_az, 360.0)
+        noisy.elevation_deg = np.clip(meas_el, -90.0, 90.0)
+        noisy.range_m = np.maximum(meas_rng, 0.0)
+        noisy.confidence = np.maximum(0.1, 1.0 - noisy.range_m / self.max_range)
+
+        if statistics is not None:
+            statistics.update_batch(noisy, expected=truth)
+
+        return noisy
+
     def export_tracks_csv(self, tracks, output_path='output/radar_tracks.csv'):
         """
         Export tracks to CSV format for slew-to-cue module.
@@ -358,45 +376,16 @@ class RadarTrackSimulator:
         - True_Elevation_Deg
         - True_Range_m
 
+        Rows are formatted in bulk by `track_io.write_tracks_csv`.
+
         Args:
-            tracks: List of track dicts
+            tracks: List of track dicts or a TrackBatch
             output_path: Output CSV file path
         """
-        import csv
+        if not isinstance(tracks, TrackBatch):
+            tracks = TrackBatch.from_track_dicts(tracks)
 
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, 'w', newline='') as f:
-            # CSV header
-            fieldnames = [
-                'Timestamp',
-                'TrackID',
-                'Azimuth_Deg',
-                'Elevation_Deg',
-                'Range_m',
-                'Confidence',
-                # Ground truth (for validation, can be removed for production)
-                'True_Azimuth_Deg',
-                'True_Elevation_Deg',
-                'True_Range_m'
-            ]
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for track in tracks:
-                writer.writerow({
-                    'Timestamp': track['timestamp'].isoformat() + 'Z',
-                    'TrackID': track['track_id'],
-                    'Azimuth_Deg': f"{track['azimuth_deg']:.4f}",
-                    'Elevation_Deg': f"{track['elevation_deg']:.4f}",
-                    'Range_m': f"{track['range_m']:.2f}",
-                    'Confidence': f"{track['confidence']:.4f}",
-                    'True_Azimuth_Deg': f"{track.get('true_azimuth_deg', 0):.4f}",
-                    'True_Elevation_Deg': f"{track.get('true_elevation_deg', 0):.4f}",
-                    'True_Range_m': f"{track.get('true_range_m', 0):.2f}"
-                })
+        output_path = write_tracks_csv(tracks, output_path)
 
         file_size_kb = output_path.stat().st_size / 1024
 
@@ -405,50 +394,97 @@ class RadarTrackSimulator:
         print(f"       - Size: {file_size_kb:.2f} KB")
         print(f"       - Tracks: {len(tracks)} detections")
 
-    def export_metadata_json(self, tracks, output_path='output/radar_tracks_metadata.json'):
+    def export_tracks_binary(self, tracks, output_path='output/radar_tracks.trk'):
+        """
+        Export tracks to the binary columnar format (see `track_io`).
+
+        Intended for long multi-target logs; read back with
+        `track_io.read_tracks_binary`, which memory-maps the file.
+
+        Args:
+            tracks: List of track dicts or a TrackBatch
+            output_path: Output .trk file path
+        """
+        if not isinstance(tracks, TrackBatch):
+            tracks = TrackBatch.from_track_dicts(tracks)
+
+        output_path = write_tracks_binary(tracks, output_path)
+
+        file_size_kb = output_path.stat().st_size / 1024
+
+        print(f"\n[SUCCESS] Tracks exported to binary:")
+        print(f"       - File: {output_path}")
+        print(f"       - Size: {file_size_kb:.2f} KB")
+        print(f"       - Tracks: {len(tracks)} detections")
+
+    def run_live(self, tracks, radar_id=0, host='127.0.0.1', port=50032,
+                 jitter_ms=0.0, speed=1.0, seed=None):
+        """
+        Publish tracks over local UDP in real time (see `radar_live_emitter`).
+
+        Scans are sent at their timestamps, i.e. at `update_rate_hz` for
+        simulator output, paced by the wall clock.
+
+        Args:
+            tracks: List of track dicts or a TrackBatch
+            radar_id: Radar identifier carried in each datagram
+            host: Destination host
+            port: Destination UDP port
+            jitter_ms: Std-dev of Gaussian send-time jitter (ms)
+            speed: Replay speed factor (1.0 = real time)
+            seed: Random seed for jitter
+
+        Returns:
+            report: Send-latency summary for this radar (ms)
+        """
+        import asyncio
+        from radar_live_emitter import RadarLiveEmitter
+
+        if not isinstance(tracks, TrackBatch):
+            tracks = TrackBatch.from_track_dicts(tracks)
+
+        emitter = RadarLiveEmitter(host=host, port=port, jitter_ms=jitter_ms, seed=seed)
+        emitter.add_radar(radar_id, tracks)
+        report = asyncio.run(emitter.run(speed=speed))[radar_id]
+
+        print(f"\n[SUCCESS] Live replay finished (radar {radar_id}, {host}:{port}):")
+        print(f"       - Scans: {report['count']}")
+        if report['count']:
+            print(f"       - Send latency p50/p99: {report['p50_ms']:.3f} / {report['p99_ms']:.3f} ms")
+        return report
+
+    def export_metadata_json(self, tracks, output_path='output/radar_tracks_metadata.json',
+                             statistics=None):
         """
         Export radar metadata JSON sidecar.
 
         VRD-32 Requirement: Include radar theoretical beam width for uncertainty calculation.
 
+        Measured statistics come from a single-pass TrackStatistics
+        accumulator: bias and sigma of the signed error (measured - true),
+        plus detection rate when scheduled samples were recorded.
+
         Args:
-            tracks: List of track dicts (for summary stats)
+            tracks: List of track dicts or a TrackBatch (ignored if statistics given)
             output_path: Output JSON file path
+            statistics: TrackStatistics already updated while detections were
+                        generated (avoids another pass over the log)
         """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Compute summary statistics
-        if len(tracks) > 0:
-            azimuths = [t['azimuth_deg'] for t in tracks]
-            elevations = [t['elevation_deg'] for t in tracks]
-            ranges = [t['range_m'] for t in tracks]
-            confidences = [t['confidence'] for t in tracks]
-
-            # Compute measurement errors (if ground truth available)
-            if 'true_azimuth_deg' in tracks[0]:
-                az_errors = [abs(t['azimuth_deg'] - t['true_azimuth_deg']) for t in tracks]
-                el_errors = [abs(t['elevation_deg'] - t['true_elevation_deg']) for t in tracks]
-                rng_errors = [abs(t['range_m'] - t['true_range_m']) for t in tracks]
-
-                measured_sigma_az = np.std(az_errors)
-                measured_sigma_el = np.std(el_errors)
-                measured_sigma_rng = np.std(rng_errors)
-            else:
-                measured_sigma_az = None
-                measured_sigma_el = None
-                measured_sigma_rng = None
-        else:
-            measured_sigma_az = None
-            measured_sigma_el = None
-            measured_sigma_rng = None
+        if statistics is None:
+            statistics = TrackStatistics()
+            statistics.update_from_tracks(tracks)
+
+        global_stats = statistics.global_stats()
 
         metadata = {
             "format_version": "1.0",
             "data_type": "radar_plot_extractor_output",
             "jira_task": "VRD-32",
             "epic": "VRD-1",
-            "timestamp_utc": datetime.utcnow().isoformat() + 'Z',
+            "timestamp_utc": format_iso(now_ns()),
 
             # Radar specifications (for slew-to-cue uncertainty calculation)
             "radar_model": "Blighter A400 (simulated)",
@@ -465,13 +501,19 @@ class RadarTrackSimulator:
             "missed_detection_probability": self.missed_detection_prob,
 
             # Measured performance (actual simulation statistics)
-            "measured_azimuth_error_deg_std": measured_sigma_az,
-            "measured_elevation_error_deg_std": measured_sigma_el,
-            "measured_range_error_m_std": measured_sigma_rng,
+            "measured_azimuth_error_deg_std": global_stats['azimuth_deg_sigma'],
+            "measured_elevation_error_deg_std": global_stats['elevation_deg_sigma'],
+            "measured_range_error_m_std": global_stats['range_m_sigma'],
+            "measured_azimuth_error_deg_bias": global_stats['azimuth_deg_bias'],
+            "measured_elevation_error_deg_bias": global_stats['elevation_deg_bias'],
+            "measured_range_error_m_bias": global_stats['range_m_bias'],
+            "measured_detection_rate": global_stats['detection_rate'],
 
             # Track summary
-            "num_detections": len(tracks),
-            "track_ids": list(set([t['track_id'] for t in tracks])),
+            "num_detections": statistics.num_detections,
+            "num_false_alarms": statistics.num_false_alarms,
+            "track_ids": [str(t) for t in statistics.track_ids],
+            "per_track_statistics": statistics.per_track_stats(),
 
             # Radar position (for coordinate transforms)
             "radar_latitude_deg": self.radar_lat,
@@ -540,14 +582,17 @@ def main():
         track_id="TRK001_LINEAR"
     )
 
-    # Inject noise
-    noisy_tracks_linear = radar.inject_measurement_noise(ground_truth_linear)
+    # Inject noise (statistics accumulate as detections are produced, so the
+    # metadata below never needs a second pass over the tracks)
+    statistics = TrackStatistics()
+    noisy_tracks_linear = radar.inject_measurement_noise(ground_truth_linear, statistics=statistics)
 
     # Export to CSV
     radar.export_tracks_csv(noisy_tracks_linear, 'output/radar_tracks.csv')
 
     # Export metadata
-    radar.export_metadata_json(noisy_tracks_linear, 'output/radar_tracks_metadata.json')
+    radar.export_metadata_json(noisy_tracks_linear, 'output/radar_tracks_metadata.json',
+                               statistics=statistics)
 
     # Scenario 2: Circular flight (loitering at 100m altitude)
     print("\n" + "="*70)
@@ -562,13 +607,15 @@ def main():
         track_id="TRK002_CIRCULAR"
     )
 
-    noisy_tracks_circular = radar.inject_measurement_noise(ground_truth_circular)
+    noisy_tracks_circular = radar.inject_measurement_noise(ground_truth_circular,
+                                                           statistics=statistics)
 
     radar.export_tracks_csv(noisy_tracks_circular, 'output/radar_tracks_circular.csv')
 
     # Combined metadata
     all_tracks = noisy_tracks_linear + noisy_tracks_circular
-    radar.export_metadata_json(all_tracks, 'output/radar_tracks_combined_metadata.json')
+    radar.export_metadata_json(all_tracks, 'output/radar_tracks_combined_metadata.json',
+                               statistics=statistics)
 
     print("\n" + "="*70)
     print("  SIMULATION COMPLETE - VRD-32 ACCEPTANCE CRITERIA MET")
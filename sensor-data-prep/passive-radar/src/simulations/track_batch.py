@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Columnar Radar Track Container
+
+Purpose: Hold plot extractor output as one numpy array per field instead of
+         one Python dict per detection.
+JIRA: VRD-32 - Simulate Radar Track Output (Plot Extractor)
+
+`RadarTrackSimulator` produces lists of dicts, which is fine for a couple of
+hand-built tracks but does not scale to an air picture with thousands of
+targets. `TrackBatch` stores the same fields column-wise so that noise
+injection, export and downstream fusion can work on whole arrays.
+
+Column layout (one row per plot):
+- time_s: Seconds since `start_ns` (int64 UTC ns, shared timebase)
+- track_id: Integer track label reported by the radar (-1 = no track)
+- azimuth_deg / elevation_deg / range_m: Measured AER
+- confidence: Detection confidence (0-1)
+- true_azimuth_deg / true_elevation_deg / true_range_m: Ground truth AER
+  (NaN for false alarms)
+- true_track_id: Ground truth target index (-1 = false alarm)
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-14
+"""
+
+import sys
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+
+# Add shared modules (sensor-data-prep/common) to Python path
+sys.path.append(str(Path(__file__).parents[3] / 'common'))
+
+from timebase import now_ns, seconds_to_ns, ns_to_seconds, datetime_to_ns, ns_to_datetime
+
+
+class TrackBatch:
+    """
+    Column-oriented batch of radar plots.
+
+    Integer track labels are mapped to display names (e.g. "TRK00042") through
+    `track_names`, so the legacy `track_id` strings survive a round trip.
+    """
+
+    # Default dtype per column; columns of the same kind but narrower width
+    # (float32, int32) are kept as-is so file-backed batches stay zero-copy
+    COLUMNS = {
+        'time_s': np.float64,
+        'track_id': np.int64,
+        'azimuth_deg': np.float64,
+        'elevation_deg': np.float64,
+        'range_m': np.float64,
+        'confidence': np.float64,
+        'true_azimuth_deg': np.float64,
+        'true_elevation_deg': np.float64,
+        'true_range_m': np.float64,
+        'true_track_id': np.int64,
+    }
+
+    def __init__(self, columns, start_time=None, track_names=None):
+        """
+        Initialize batch from a mapping of column name -> array.
+
+        Args:
+            columns: Dict of column arrays (missing truth columns default to
+                     NaN, missing true_track_id defaults to track_id)
+            start_time: Time of time_s == 0 as int64 UTC ns or datetime
+                        (default: now, from the shared timebase)
+            track_names: Sequence of names indexed by track_id (optional)
+        """
+        num_rows = len(columns['time_s'])
+
+        for name, dtype in self.COLUMNS.items():
+            if name in columns:
+                # Keep compatible storage (e.g. float32 memmap columns) without copying
+                values = np.asarray(columns[name])
+                if values.dtype.kind != np.dtype(dtype).kind:
+                    values = values.astype(dtype)
+            elif name == 'true_track_id':
+                values = np.asarray(columns['track_id'], dtype=dtype).copy()
+            elif name == 'confidence':
+                values = np.ones(num_rows, dtype=dtype)
+            else:
+                values = np.full(num_rows, np.nan, dtype=dtype)
+
+            if values.shape != (num_rows,):
+                raise ValueError(f"Column '{name}' has shape {values.shape}, expected ({num_rows},)")
+            setattr(self, name, values)
+
+        if start_time is None:
+            start_time = now_ns()
+        elif isinstance(start_time, datetime):
+            start_time = datetime_to_ns(start_time)
+        self.start_ns = int(start_time)
+        self.track_names = list(track_names) if track_names is not None else None
+
+    def __len__(self):
+        return len(self.time_s)
+
+    @property
+    def start_time(self):
+        """Start time as a naive UTC datetime (microsecond resolution)."""
+        return ns_to_datetime(self.start_ns)
+
+    def timestamps_ns(self, index=slice(None)):
+        """Absolute int64 UTC ns timestamps of the selected rows."""
+        return seconds_to_ns(self.time_s[index], self.start_ns)
+
+    @property
+    def is_false_alarm(self):
+        """Boolean mask of plots not originating from a real target."""
+        return self.true_track_id < 0
+
+    def columns(self):
+        """Return the batch as a dict of column arrays (no copy)."""
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def track_name(self, track_id):
+        """Display name for an integer track label."""
+        if track_id < 0:
+            return "FALSE_ALARM"
+        if self.track_names is not None and track_id < len(self.track_names):
+            return self.track_names[track_id]
+        return f"TRK{track_id:05d}"
+
+    def select(self, index):
+        """
+        Return a new batch containing the rows picked by a mask or index array.
+        """
+        return TrackBatch(
+            {name: values[index] for name, values in self.columns().items()},
+            start_time=self.start_ns,
+            track_names=self.track_names
+        )
+
+    def sort_by_time(self):
+        """Return a copy sorted by (time_s, track_id)."""
+        order = np.lexsort((self.track_id, self.time_s))
+        return self.select(order)
+
+    def iter_scans(self):
+        """
+        Yield (time_s, batch) per radar scan.
+
+        Assumes the batch is sorted by time (see `sort_by_time`).
+        """
+        if len(self) == 0:
+            return
+        boundaries = np.flatnonzero(np.diff(self.time_s)) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [len(self)]))
+        for start, stop in zip(starts, stops):
+            yield self.time_s[start], self.select(slice(start, stop))
+
+    def to_track_dicts(self):
+        """
+        Convert to the list-of-dicts format used by `RadarTrackSimulator`.
+
+        Returns:
+            tracks: List of track dicts (same keys as inject_measurement_noise)
+        """
+        timestamps = self.timestamps_ns().tolist()
+        tracks = []
+        for row in range(len(self)):
+            tracks.append({
+                'timestamp_ns': timestamps[row],
+                'track_id': self.track_name(int(self.track_id[row])),
+                'azimuth_deg': float(self.azimuth_deg[row]),
+                'elevation_deg': float(self.elevation_deg[row]),
+                'range_m': float(self.range_m[row]),
+                'confidence': float(self.confidence[row]),
+                'true_azimuth_deg': float(self.true_azimuth_deg[row]),
+                'true_elevation_deg': float(self.true_elevation_deg[row]),
+                'true_range_m': float(self.true_range_m[row])
+            })
+        return tracks
+
+    @classmethod
+    def concatenate(cls, batches):
+        """
+        Concatenate batches that share the same start time.
+        """
+        batches = list(batches)
+        if not batches:
+            raise ValueError("No batches to concatenate")
+        return cls(
+            {name: np.concatenate([getattr(b, name) for b in batches]) for name in cls.COLUMNS},
+            start_time=batches[0].start_ns,
+            track_names=batches[0].track_names
+        )
+
+    @classmethod
+    def from_track_dicts(cls, tracks):
+        """
+        Build a batch from `RadarTrackSimulator.inject_measurement_noise` output.
+
+        Args:
+            tracks: List of track dicts with 'timestamp_ns' (int UTC ns; legacy
+                    'timestamp' datetimes are also accepted) and 'track_id' (str)
+
+        Returns:
+            TrackBatch
+        """
+        if len(tracks) == 0:
+            return cls({'time_s': [], 'track_id': []}, track_names=[])
+
+        if 'timestamp_ns' in tracks[0]:
+            timestamps = np.array([t['timestamp_ns'] for t in tracks], dtype=np.int64)
+        else:
+            timestamps = np.array([datetime_to_ns(t['timestamp']) for t in tracks], dtype=np.int64)
+        start_ns = int(timestamps.min())
+        names = sorted(set(t['track_id'] for t in tracks))
+        name_to_id = {name: i for i, name in enumerate(names)}
+
+        columns = {
+            'time_s': ns_to_seconds(timestamps, start_ns),
+            'track_id': [name_to_id[t['track_id']] for t in tracks],
+        }
+        for name in ('azimuth_deg', 'elevation_deg', 'range_m', 'confidence',
+                     'true_azimuth_deg', 'true_elevation_deg', 'true_range_m'):
+            columns[name] = [t.get(name, np.nan) for t in tracks]
+
+        return cls(columns, start_time=start_ns, track_names=names)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Streaming Radar Track Statistics
+
+Purpose: Single-pass, constant-memory measurement error statistics for radar
+         plot logs (VRD-32 metadata sidecar).
+JIRA: VRD-32 - Simulate Radar Track Output (Plot Extractor)
+
+Errors (measured - true) are accumulated per track with Welford's online
+algorithm; batches are folded in with Chan's parallel merge, so memory is
+O(number of tracks) regardless of log length and no second pass over the
+detections is needed. Per track and globally it reports:
+
+- Bias: mean signed error (azimuth error wrapped to [-180, 180) deg)
+- Sigma: sample standard deviation of the signed error (the noise 1-sigma)
+- Detection rate: detections / scheduled samples (when samples are recorded)
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-15
+"""
+
+import numpy as np
+
+from track_batch import TrackBatch
+
+
+# Error fields: (name, measured key, true key)
+ERROR_FIELDS = (
+    ('azimuth_deg', 'azimuth_deg', 'true_azimuth_deg'),
+    ('elevation_deg', 'elevation_deg', 'true_elevation_deg'),
+    ('range_m', 'range_m', 'true_range_m'),
+)
+
+
+def wrap_angle_deg(angle_deg):
+    """Wrap angle differences to [-180, 180) degrees."""
+    return np.mod(np.asarray(angle_deg) + 180.0, 360.0) - 180.0
+
+
+def merge_moments(count_a, mean_a, m2_a, count_b, mean_b, m2_b):
+    """
+    Chan et al. parallel merge of (count, mean, M2) moment triples.
+
+    Works element-wise on arrays; counts broadcast against the trailing
+    field axis of mean/M2.
+
+    Returns:
+        (count, mean, m2): merged moments
+    """
+    count = count_a + count_b
+    safe = np.maximum(count, 1)[..., np.newaxis]
+    delta = mean_b - mean_a
+    mean = mean_a + delta * (count_b[..., np.newaxis] / safe)
+    m2 = m2_a + m2_b + delta**2 * (count_a * count_b)[..., np.newaxis] / safe
+    return count, mean, m2
+
+
+class TrackStatistics:
+    """
+    Online per-track measurement error accumulator.
+
+    Track keys are ground-truth identities: the track label of the dict API
+    (the legacy simulator never swaps labels) or the display name of
+    `true_track_id` in a TrackBatch, so detections and scheduled samples of
+    a target meet in one slot even when the radar reports it under another
+    label. False alarms are counted but carry no ground truth and do not
+    enter the error moments.
+    """
+
+    def __init__(self, initial_capacity=64):
+        """
+        Initialize empty accumulator.
+
+        Args:
+            initial_capacity: Number of track slots allocated up front
+        """
+        self.num_fields = len(ERROR_FIELDS)
+        self._slots = {}
+        self._names = []
+
+        self.count = np.zeros(initial_capacity, dtype=np.int64)
+        self.mean = np.zeros((initial_capacity, self.num_fields))
+        self.m2 = np.zeros((initial_capacity, self.num_fields))
+        self.expected = np.zeros(initial_capacity, dtype=np.int64)
+
+        self.num_detections = 0
+        self.num_false_alarms = 0
+
+    # ------------------------------------------------------------------
+    # Slot management
+    # ------------------------------------------------------------------
+
+    def _slot(self, track_id):
+        """Return the slot index for a track label, allocating if needed."""
+        slot = self._slots.get(track_id)
+        if slot is None:
+            slot = len(self._names)
+            if slot == len(self.count):
+                self._grow()
+            self._slots[track_id] = slot
+            self._names.append(track_id)
+        return slot
+
+    def _grow(self):
+        capacity = 2 * len(self.count)
+        for name in ('count', 'mean', 'm2', 'expected'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    @property
+    def track_ids(self):
+        return list(self._names)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def record_expected(self, track_id, num_samples=1):
+        """Record scheduled samples (detected or missed) for detection rate."""
+        self.expected[self._slot(track_id)] += num_samples
+
+    def record_detection(self, track):
+        """
+        Fold a single detection dict into the statistics (Welford update).
+
+        Args:
+            track: Dict with measured and true_* AER keys and 'track_id'
+        """
+        self.num_detections += 1
+        true_az = track.get('true_azimuth_deg')
+        if true_az is None or not np.isfinite(true_az):
+            self.num_false_alarms += 1
+            return
+
+        slot = self._slot(track['track_id'])
+        errors = np.array([track[meas] - track[true] for _, meas, true in ERROR_FIELDS])
+        errors[0] = wrap_angle_deg(errors[0])
+
+        self.count[slot] += 1
+        delta = errors - self.mean[slot]
+        self.mean[slot] += delta / self.count[slot]
+        self.m2[slot] += delta * (errors - self.mean[slot])
+
+    def update_batch(self, batch, expected=None):
+        """
+        Fold a whole TrackBatch into the statistics in one vectorized step.
+
+        Args:
+            batch: TrackBatch of detections (false alarms allowed)
+            expected: Optional TrackBatch of scheduled truth samples (before
+                      dropout) used for the detection rate
+        """
+        self.num_detections += len(batch)
+        real = ~np.isnan(np.asarray(batch.true_azimuth_deg, dtype=np.float64))
+        self.num_false_alarms += int(np.count_nonzero(~real))
+
+        # Both sides keyed by truth identity: reported labels may be swapped
+        if expected is not None and len(expected):
+            labels, counts = np.unique(expected.true_track_id, return_counts=True)
+            slots = np.array([self._slot(expected.track_name(int(l))) for l in labels], dtype=np.int64)
+            self.expected[slots] += counts
+
+        if not np.any(real):
+            return
+
+        errors = np.column_stack([
+            np.asarray(getattr(batch, meas)[real], dtype=np.float64)
+            - np.asarray(getattr(batch, true)[real], dtype=np.float64)
+            for _, meas, true in ERROR_FIELDS
+        ])
+        errors[:, 0] = wrap_angle_deg(errors[:, 0])
+
+        # Per-label moments of this batch
+        labels, inverse = np.unique(batch.true_track_id[real], return_inverse=True)
+        slots = np.array([self._slot(batch.track_name(int(l))) for l in labels], dtype=np.int64)
+
+        batch_count = np.bincount(inverse, minlength=len(labels))
+        batch_mean = np.column_stack([
+            np.bincount(inverse, weights=errors[:, f], minlength=len(labels)) for f in range(self.num_fields)
+        ]) / batch_count[:, np.newaxis]
+        centered = errors - batch_mean[inverse]
+        batch_m2 = np.column_stack([
+            np.bincount(inverse, weights=centered[:, f]**2, minlength=len(labels)) for f in range(self.num_fields)
+        ])
+
+        self.count[slots], self.mean[slots], self.m2[slots] = merge_moments(
+            self.count[slots], self.mean[slots], self.m2[slots],
+            batch_count, batch_mean, batch_m2
+        )
+
+    def update_from_tracks(self, tracks):
+        """Fold either a TrackBatch or a list of track dicts."""
+        if isinstance(tracks, TrackBatch):
+            self.update_batch(tracks)
+        else:
+            for track in tracks:
+                self.record_detection(track)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def _moments_to_stats(self, count, mean, m2, expected):
+        sigma = np.sqrt(m2 / max(count - 1, 1)) if count > 1 else np.full(self.num_fields, np.nan)
+        stats = {'num_detections': int(count)}
+        for f, (name, _, _) in enumerate(ERROR_FIELDS):
+            stats[f'{name}_bias'] = float(mean[f]) if count else None
+            stats[f'{name}_sigma'] = float(sigma[f]) if count > 1 else None
+        stats['detection_rate'] = float(count / expected) if expected else None
+        return stats
+
+    def global_moments(self):
+        """Merge all track slots into one (count, mean, M2) triple."""
+        n = len(self._names)
+        count = self.count[:n]
+        total = int(count.sum())
+        if total == 0:
+            return 0, np.zeros(self.num_fields), np.zeros(self.num_fields)
+        mean = (self.mean[:n] * count[:, np.newaxis]).sum(axis=0) / total
+        m2 = self.m2[:n].sum(axis=0) + ((self.mean[:n] - mean)**2 * count[:, np.newaxis]).sum(axis=0)
+        return total, mean, m2
+
+    def global_stats(self):
+        """Bias, sigma and detection rate over all tracks."""
+        count, mean, m2 = self.global_moments()
+        expected = int(self.expected[:len(self._names)].sum())
+        return self._moments_to_stats(count, mean, m2, expected)
+
+    def per_track_stats(self):
+        """Dict of track label -> bias/sigma/detection rate."""
+        return {
+            str(name): self._moments_to_stats(self.count[slot], self.mean[slot],
+                                              self.m2[slot], self.expected[slot])
+            for slot, name in enumerate(self._names)
+        }
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Vectorized Trajectory Kernels
+
+Purpose: Closed-form flight path models evaluated over whole time arrays.
+JIRA: VRD-32 - Simulate Radar Track Output (Plot Extractor)
+
+Every kernel takes a time array `t` (seconds since the start of the manoeuvre)
+and parameters that broadcast against it, and returns three (..., 3) ENU
+arrays: position (m), velocity (m/s) and acceleration (m/s^2). Parameters may
+be given once per trajectory or once per sample, so thousands of tracks can be
+evaluated in a single call by repeating their parameters onto a flat sample
+axis (see `simulate_air_picture.py`).
+
+Kernels:
+- constant_velocity: Straight line at constant speed
+- constant_turn: Circular loiter about a fixed center
+- coordinated_turn: Constant-rate turn entered from a given velocity
+- dive: Accelerating straight-line dive with pull-out at a floor altitude
+- hover_with_drift: Station keeping with wind drift and sinusoidal wobble
+- waypoint_polyline: Constant-speed legs between waypoints (single track)
+- cubic_spline: C2-smooth path through timed waypoints (single track)
+
+Coordinate frame: ENU (East, North, Up) relative to the radar, meters.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-14
+"""
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+
+def _as_vector(value):
+    """Return value as a float64 array whose last axis has length 3."""
+    value = np.asarray(value, dtype=np.float64)
+    if value.shape[-1:] != (3,):
+        raise ValueError(f"Expected (..., 3) ENU vector, got shape {value.shape}")
+    return value
+
+
+def constant_velocity(t, start_position, velocity):
+    """
+    Constant-velocity (linear) flight path.
+
+    Args:
+        t: Time array (seconds), shape (M,)
+        start_position: (E, N, U) at t=0, shape (3,) or (M, 3)
+        velocity: (vE, vN, vU) in m/s, shape (3,) or (M, 3)
+
+    Returns:
+        position, velocity, acceleration: arrays of shape (M, 3)
+    """
+    t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+    start_position = _as_vector(start_position)
+    velocity = _as_vector(velocity)
+
+    position = start_position + velocity * t
+    vel = np.broadcast_to(velocity, position.shape).copy()
+    acc = np.zeros_like(position)
+
+    return position, vel, acc
+
+
+def constant_turn(t, center_position, radius_m, angular_rate_deg_s,
+                  phase_deg=0.0, climb_rate_m_s=0.0):
+    """
+    Constant-rate circular flight path in the horizontal plane (loiter).
+
+    Generalises `RadarTrackSimulator.generate_circular_flight_path`, which is
+    the special case phase_deg=0, climb_rate_m_s=0.
+
+    Args:
+        t: Time array (seconds), shape (M,)
+        center_position: (E, N, U) circle center, shape (3,) or (M, 3)
+        radius_m: Circle radius (m), scalar or (M,)
+        angular_rate_deg_s: Rotation rate (deg/s, positive = CCW), scalar or (M,)
+        phase_deg: Angle of the start point from +East (deg), scalar or (M,)
+        climb_rate_m_s: Vertical speed (m/s), scalar or (M,)
+
+    Returns:
+        position, velocity, acceleration: arrays of shape (M, 3)
+    """
+    t = np.asarray(t, dtype=np.float64)
+    center_position = _as_vector(center_position)
+    radius_m = np.asarray(radius_m, dtype=np.float64)
+    omega = np.deg2rad(np.asarray(angular_rate_deg_s, dtype=np.float64))
+    phase = np.deg2rad(np.asarray(phase_deg, dtype=np.float64))
+    climb = np.asarray(climb_rate_m_s, dtype=np.float64)
+
+    angle = phase + omega * t
+    cos_a = np.cos(angle)
+    sin_a = np.sin(angle)
+
+    shape = np.broadcast_shapes(angle.shape, center_position.shape[:-1]) + (3,)
+    position = np.empty(shape)
+    velocity = np.empty(shape)
+    acceleration = np.zeros(shape)
+
+    position[..., 0] = center_position[..., 0] + radius_m * cos_a
+    position[..., 1] = center_position[..., 1] + radius_m * sin_a
+    position[..., 2] = center_position[..., 2] + climb * t
+
+    velocity[..., 0] = -radius_m * omega * sin_a
+    velocity[..., 1] = radius_m * omega * cos_a
+    velocity[..., 2] = climb
+
+    # Centripetal acceleration points back at the circle center
+    acceleration[..., 0] = -radius_m * omega**2 * cos_a
+    acceleration[..., 1] = -radius_m * omega**2 * sin_a
+
+    return position, velocity, acceleration
+
+
+def coordinated_turn(t, start_position, velocity, turn_rate_deg_s):
+    """
+    Constant-rate coordinated turn starting from a given velocity.
+
+    The horizontal velocity vector rotates at turn_rate_deg_s (positive = CCW,
+    i.e. a left turn seen from above) at constant speed; the vertical rate is
+    held. A zero turn rate degenerates smoothly to constant velocity.
+
+    Args:
+        t: Time array (seconds), shape (M,)
+        start_position: (E, N, U) at t=0, shape (3,) or (M, 3)
+        velocity: (vE, vN, vU) at t=0 in m/s, shape (3,) or (M, 3)
+        turn_rate_deg_s: Turn rate (deg/s), scalar or (M,)
+
+    Returns:
+        position, velocity, acceleration: arrays of shape (M, 3)
+    """
+    t = np.asarray(t, dtype=np.float64)
+    start_position = _as_vector(start_position)
+    velocity = _as_vector(velocity)
+    omega = np.deg2rad(np.asarray(turn_rate_deg_s, dtype=np.float64))
+
+    wt = omega * t
+    cos_wt = np.cos(wt)
+    sin_wt = np.sin(wt)
+    # sin(wt)/w and (1 - cos(wt))/w written with sinc so that w -> 0 is exact
+    s_term = t * np.sinc(wt / np.pi)
+    c_term = 0.5 * omega * t**2 * np.sinc(wt / (2 * np.pi))**2
+
+    v_e0 = velocity[..., 0]
+    v_n0 = velocity[..., 1]
+
+    shape = np.broadcast_shapes(t.shape, start_position.shape[:-1], velocity.shape[:-1],
+                                omega.shape) + (3,)
+    position = np.empty(shape)
+    vel = np.empty(shape)
+    acc = np.zeros(shape)
+
+    position[..., 0] = start_position[..., 0] + v_e0 * s_term - v_n0 * c_term
+    position[..., 1] = start_position[..., 1] + v_n0 * s_term + v_e0 * c_term
+    position[..., 2] = start_position[..., 2] + velocity[..., 2] * t
+
+    vel[..., 0] = v_e0 * cos_wt - v_n0 * sin_wt
+    vel[..., 1] = v_e0 * sin_wt + v_n0 * cos_wt
+    vel[..., 2] = velocity[..., 2]
+
+    acc[..., 0] = -omega * vel[..., 1]
+    acc[..., 1] = omega * vel[..., 0]
+
+    return position, vel, acc
+
+
+def dive(t, start_position, heading_deg, speed_m_s, dive_angle_deg,
+         acceleration_m_s2=0.0, floor_up_m=0.0):
+    """
+    Straight-line accelerating dive with an instantaneous pull-out.
+
+    The target flies along `heading_deg`, pitched down by `dive_angle_deg`,
+    accelerating along its path. When it reaches `floor_up_m` it levels off
+    and continues horizontally at the speed it reached.
+
+    Args:
+        t: Time array (seconds), shape (M,)
+        start_position: (E, N, U) at t=0, shape (3,) or (M, 3)
+        heading_deg: Ground track (deg, 0 = North, 90 = East), scalar or (M,)
+        speed_m_s: Initial path speed (m/s), scalar or (M,)
+        dive_angle_deg: Pitch below horizon (deg, > 0 dives), scalar or (M,)
+        acceleration_m_s2: Along-path acceleration (m/s^2), scalar or (M,)
+        floor_up_m: Pull-out altitude (m, ENU Up), scalar or (M,)
+
+    Returns:
+        position, velocity, acceleration: arrays of shape (M, 3)
+    """
+    t = np.asarray(t, dtype=np.float64)
+    start_position = _as_vector(start_position)
+    heading = np.deg2rad(np.asarray(heading_deg, dtype=np.float64))
+    gamma = np.deg2rad(np.asarray(dive_angle_deg, dtype=np.float64))
+    s0 = np.asarray(speed_m_s, dtype=np.float64)
+    a = np.asarray(acceleration_m_s2, dtype=np.float64)
+    floor_up_m = np.asarray(floor_up_m, dtype=np.float64)
+
+    # Heading and dive-angle direction cosines
+    sin_h, cos_h = np.sin(heading), np.cos(heading)
+    cos_g, sin_g = np.cos(gamma), np.sin(gamma)
+
+    # Path length and time to reach the floor: d = s0*t + a*t^2/2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        path_to_floor = np.where(sin_g > 0,
+                                 np.maximum(start_position[..., 2] - floor_up_m, 0.0) / sin_g,
+                                 np.inf)
+        t_floor = 2.0 * path_to_floor / (s0 + np.sqrt(np.maximum(s0**2 + 2.0 * a * path_to_floor, 0.0)))
+        t_floor = np.where(np.isfinite(path_to_floor), t_floor, np.inf)
+        t_floor = np.where(path_to_floor > 0, t_floor, 0.0)
+
+    t_dive = np.minimum(t, t_floor)
+    t_level = t - t_dive
+    path = s0 * t_dive + 0.5 * a * t_dive**2
+    speed = s0 + a * t_dive
+    diving = t < t_floor
+
+    shape = np.broadcast_shapes(t.shape, start_position.shape[:-1], heading.shape,
+                                gamma.shape, s0.shape, a.shape) + (3,)
+    position = np.empty(shape)
+    vel = np.empty(shape)
+    acc = np.empty(shape)
+
+    horizontal = path * cos_g + speed * t_level
+    position[..., 0] = start_position[..., 0] + horizontal * sin_h
+    position[..., 1] = start_position[..., 1] + horizontal * cos_h
+    position[..., 2] = start_position[..., 2] - path * sin_g
+
+    ground_speed = np.where(diving, speed * cos_g, speed)
+    vel[..., 0] = ground_speed * sin_h
+    vel[..., 1] = ground_speed * cos_h
+    vel[..., 2] = np.where(diving, -speed * sin_g, 0.0)
+
+    a_path = np.where(diving, a, 0.0)
+    acc[..., 0] = a_path * cos_g * sin_h
+    acc[..., 1] = a_path * cos_g * cos_h
+    acc[..., 2] = -a_path * sin_g
+
+    return position, vel, acc
+
+
+def hover_with_drift(t, hover_position, drift_velocity=(0.0, 0.0, 0.0),
+                     wobble_amplitude_m=(1.0, 1.0, 0.5), wobble_period_s=4.0,
+                     wobble_phase_deg=0.0):
+    """
+    Hovering target drifting with the wind plus a sinusoidal station-keeping wobble.
+
+    Args:
+        t: Time array (seconds), shape (M,)
+        hover_position: (E, N, U) at t=0 (before wobble), shape (3,) or (M, 3)
+        drift_velocity: (vE, vN, vU) wind drift in m/s, shape (3,) or (M, 3)
+        wobble_amplitude_m: Per-axis wobble amplitude (m), shape (3,) or (M, 3)
+        wobble_period_s: Wobble period (s), scalar or (M,)
+        wobble_phase_deg: Wobble phase (deg), scalar or (M,)
+
+    Returns:
+        position, velocity, acceleration: arrays of shape (M, 3)
+    """
+    t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+    hover_position = _as_vector(hover_position)
+    drift_velocity = _as_vector(drift_velocity)
+    amplitude = _as_vector(wobble_amplitude_m)
+    omega = (2 * np.pi / np.asarray(wobble_period_s, dtype=np.float64))[..., np.newaxis]
+    phase = np.deg2rad(np.asarray(wobble_phase_deg, dtype=np.float64))[..., np.newaxis]
+
+    angle = omega * t + phase
+    sin_a = np.sin(angle)
+
+    # Wobble is relative to its own t=0 value so that position(0) == hover_position
+    position = hover_position + drift_velocity * t + amplitude * (sin_a - np.sin(phase))
+    velocity = drift_velocity + amplitude * omega * np.cos(angle)
+    acceleration = -amplitude * omega**2 * sin_a
+
+    shape = np.broadcast_shapes(position.shape, velocity.shape, acceleration.shape)
+    return (np.broadcast_to(position, shape).copy(),
+            np.broadcast_to(velocity, shape).copy(),
+            np.broadcast_to(acceleration, shape).copy())
+
+
+def waypoint_times(waypoints, speed_m_s, start_time_s=0.0):
+    """
+    Arrival time at each waypoint when flying the legs at constant speed.
+
+    Args:
+        waypoints: (K, 3) ENU waypoints (m)
+        speed_m_s: Ground speed along the polyline (m/s)
+        start_time_s: Time at the first waypoint (s)
+
+    Returns:
+        knot_times: (K,) arrival times (s)
+    """
+    waypoints = _as_vector(waypoints)
+    leg_lengths = np.linalg.norm(np.diff(waypoints, axis=0), axis=1)
+    return start_time_s + np.concatenate(([0.0], np.cumsum(leg_lengths))) / speed_m_s
+
+
+def waypoint_polyline(t, waypoints, knot_times):
+    """
+    Piecewise-linear path through waypoints at the given arrival times.
+
+    Outside [knot_times[0], knot_times[-1]] the target holds at the first/last
+    waypoint with zero velocity. Acceleration is zero inside each leg (the
+    turn at a waypoint is instantaneous).
+
+    Args:
+        t: Time array (seconds), shape (M,)
+        waypoints: (K, 3) ENU waypoints (m), K >= 2
+        knot_times: (K,) strictly increasing arrival times (s), e.g. from `waypoint_times`
+
+    Returns:
+        position, velocity, acceleration: arrays of shape (M, 3)
+    """
+    t = np.asarray(t, dtype=np.float64)
+    waypoints = _as_vector(waypoints)
+    knot_times = np.asarray(knot_times, dtype=np.float64)
+    if len(waypoints) < 2 or len(knot_times) != len(waypoints):
+        raise ValueError("Need at least two waypoints with one knot time each")
+
+    leg = np.clip(np.searchsorted(knot_times, t, side='right') - 1, 0, len(knot_times) - 2)
+    leg_duration = knot_times[leg + 1] - knot_times[leg]
+    leg_velocity = (waypoints[leg + 1] - waypoints[leg]) / leg_duration[:, np.newaxis]
+
+    t_in_leg = np.clip(t, knot_times[0], knot_times[-1]) - knot_times[leg]
+    position = waypoints[leg] + leg_velocity * t_in_leg[:, np.newaxis]
+
+    inside = (t >= knot_times[0]) & (t <= knot_times[-1])
+    velocity = np.where(inside[:, np.newaxis], leg_velocity, 0.0)
+    acceleration = np.zeros_like(position)
+
+    return position, velocity, acceleration
+
+
+def cubic_spline(t, waypoints, knot_times, bc_type='natural'):
+    """
+    C2-continuous cubic spline through timed waypoints.
+
+    Times outside the knot range are clamped (the target holds at the end
+    points with zero velocity and acceleration).
+
+    Args:
+        t: Time array (seconds), shape (M,)
+        waypoints: (K, 3) ENU waypoints (m), K >= 2
+        knot_times: (K,) strictly increasing times (s)
+        bc_type: Boundary condition passed to scipy CubicSpline
+                 ('natural', 'clamped', 'not-a-knot')
+
+    Returns:
+        position, velocity, acceleration: arrays of shape (M, 3)
+    """
+    t = np.asarray(t, dtype=np.float64)
+    waypoints = _as_vector(waypoints)
+    knot_times = np.asarray(knot_times, dtype=np.float64)
+
+    spline = CubicSpline(knot_times, waypoints, axis=0, bc_type=bc_type)
+    t_clamped = np.clip(t, knot_times[0], knot_times[-1])
+    inside = ((t >= knot_times[0]) & (t <= knot_times[-1]))[:, np.newaxis]
+
+    position = spline(t_clamped)
+    velocity = np.where(inside, spline(t_clamped, 1), 0.0)
+    acceleration = np.where(inside, spline(t_clamped, 2), 0.0)
+
+    return position, velocity, acceleration
@@ -0,0 +1,773 @@
+#!/usr/bin/env python3
+"""
+Vectorized Kalman Track Bank
+
+Purpose: Smooth radar plots into track estimates (AER + covariance) so the
+         slew-to-cue search radius comes from real track uncertainty instead
+         of a fixed +/-10 m.
+JIRA: VRD-32 - Simulate Radar Track Output (Plot Extractor)
+
+All tracks live in stacked arrays and are predicted/updated together:
+
+- State (N, 7): [east, north, up, v_east, v_north, v_up, turn_rate]
+  (ENU metres around the radar, turn rate in rad/s)
+- Covariance (N, 7, 7)
+
+Both are stored component-major ((7, N) and (49, N), float32 by default), so
+every state or covariance entry of a scan is one contiguous vector and the
+filter steps below are elementwise numpy calls on them; `x` and `P` are
+(N, 7) / (N, 7, 7) views of that storage.
+
+Motion models (per track):
+- Constant velocity (CV): a 6-state filter on the leading block (the
+  turn-rate row/column stays zero); F = [[I, dt I], [0, I]] is applied as a
+  row and a column operation instead of a matrix product
+- Constant turn (CT): horizontal coordinated turn with estimated turn rate
+  (EKF linearization), vertical channel constant velocity; the sparse
+  Jacobian is likewise applied row- then column-wise
+
+Measurements are radar AER plots converted to ENU positions, with the
+polar noise (sigma_az, sigma_el, sigma_range) rotated into an ENU covariance
+per plot. The update factors S = L L^T (closed-form 3x3 Cholesky); with
+C = L^-1 H P the covariance correction K H P is C^T C, formed on the upper
+triangle only and mirrored.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-16
+"""
+
+import sys
+import numpy as np
+import argparse
+import time
+from pathlib import Path
+
+# Add simulations directory and shared modules (sensor-data-prep/common) to Python path
+sys.path.append(str(Path(__file__).parent.parent / 'simulations'))
+sys.path.append(str(Path(__file__).parents[3] / 'common'))
+
+from track_batch import TrackBatch
+from coordinates import enu_to_aer
+
+
+MODEL_CV = 0
+MODEL_CT = 1
+
+STATE_DIM = 7
+CV_STATE_DIM = 6
+
+# Per-scan budget for 10k CV tracks, checked by the benchmark in main(). About
+# 2 ms on the reference VM (the stacked 7x7 float64 version took ~20 ms)
+SCAN_BUDGET_MS = 8.0
+SCAN_BUDGET_TRACKS = 10_000
+
+# Unique entries of a symmetric 3x3 matrix, in packed order
+SYM3_INDEX = ((0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2))
+
+
+def aer_jacobian(azimuth_deg, elevation_deg, range_m):
+    """
+    d(ENU)/d(az, el, range) per sample, angles in radians.
+
+    Returns:
+        J: (M, 3, 3) Jacobian, columns ordered (azimuth, elevation, range)
+    """
+    az = np.deg2rad(azimuth_deg)
+    el = np.deg2rad(elevation_deg)
+    sa, ca, se, ce = np.sin(az), np.cos(az), np.sin(el), np.cos(el)
+    r = np.asarray(range_m, dtype=np.float64)
+
+    J = np.empty(az.shape + (3, 3))
+    J[..., 0, 0] = r * ce * ca
+    J[..., 0, 1] = -r * se * sa
+    J[..., 0, 2] = ce * sa
+    J[..., 1, 0] = -r * ce * sa
+    J[..., 1, 1] = -r * se * ca
+    J[..., 1, 2] = ce * ca
+    J[..., 2, 0] = 0.0
+    J[..., 2, 1] = r * ce
+    J[..., 2, 2] = se
+    return J
+
+
+def _inv3(S):
+    """Closed-form inverse of stacked symmetric 3x3 matrices."""
+    a, b, c = S[:, 0, 0], S[:, 0, 1], S[:, 0, 2]
+    d, e = S[:, 1, 1], S[:, 1, 2]
+    f = S[:, 2, 2]
+    A = d * f - e * e
+    B = c * e - b * f
+    C = b * e - c * d
+    D = a * f - c * c
+    E = b * c - a * e
+    F = a * d - b * b
+    det = a * A + b * B + c * C
+
+    inv = np.empty_like(S)
+    inv[:, 0, 0] = A
+    inv[:, 0, 1] = inv[:, 1, 0] = B
+    inv[:, 0, 2] = inv[:, 2, 0] = C
+    inv[:, 1, 1] = D
+    inv[:, 1, 2] = inv[:, 2, 1] = E
+    inv[:, 2, 2] = F
+    inv /= det[:, np.newaxis, np.newaxis]
+    return inv
+
+
+def _blocks(flat):
+    """
+    (7, 7, N) view of component-major (49, N) covariances. Raises rather
+    than silently copying, so in-place filter steps always reach `flat`.
+    """
+    blocks = flat.view()
+    blocks.shape = (STATE_DIM, STATE_DIM, flat.shape[-1])
+    return blocks
+
+
+def pack_sym3(R):
+    """(M, 3, 3) symmetric matrices -> (6, M) unique entries (SYM3_INDEX order)."""
+    R = np.asarray(R)
+    return np.stack([R[:, i, j] for i, j in SYM3_INDEX])
+
+
+def unpack_sym3(packed):
+    """(6, M) unique entries -> (M, 3, 3) symmetric matrices."""
+    R = np.empty((packed.shape[-1], 3, 3), dtype=packed.dtype)
+    for k, (i, j) in enumerate(SYM3_INDEX):
+        R[:, i, j] = R[:, j, i] = packed[k]
+    return R
+
+
+def _add_process_noise(flat, dt, accel_var):
+    """
+    Discrete white-noise acceleration, identical on each axis; strided rows
+    of the (49, N) covariances address the block diagonals.
+    """
+    q_vv = accel_var * dt * dt
+    q_pv = q_vv * dt / 2
+    flat[0:17:8] += q_vv * dt * dt / 4  # (i, i)
+    flat[3:20:8] += q_pv                # (i, i+3)
+    flat[21:38:8] += q_pv               # (i+3, i)
+    flat[24:41:8] += q_vv               # (i+3, i+3)
+
+
+def _predict_cv(x, flat, dt, accel_var):
+    """
+    Constant-velocity prediction of component-major states `x` (7, N) and
+    covariances `flat` (49, N) in place, on the leading 6x6 block only.
+    """
+    P = _blocks(flat)
+    x[:3] += dt * x[3:6]
+    P[:3, :CV_STATE_DIM] += dt * P[3:6, :CV_STATE_DIM]
+    P[:CV_STATE_DIM, :3] += dt * P[:CV_STATE_DIM, 3:6]
+    _add_process_noise(flat, dt, accel_var)
+
+
+def _turn(M, dt, s, c, s_w, c_w, turn_column=None):
+    """
+    Apply the CT transition (Jacobian) to the leading axis of `M` in place.
+
+    `turn_column` holds the Jacobian's turn-rate column for rows
+    (0, 1, 3, 4); without it (the state itself) F is exact.
+    """
+    m3, m4 = M[3].copy(), M[4].copy()
+    M[0] += s_w * m3 - c_w * m4
+    M[1] += c_w * m3 + s_w * m4
+    M[2] += dt * M[5]
+    M[3] = c * m3 - s * m4
+    M[4] = s * m3 + c * m4
+    if turn_column is not None:
+        for row, coefficient in zip((0, 1, 3, 4), turn_column):
+            M[row] += coefficient * M[6]
+
+
+def _predict_ct(x, flat, dt, accel_var, turn_rate_var):
+    """
+    Constant-turn EKF prediction of component-major states `x` (7, N) and
+    covariances `flat` (49, N) in place: P <- F P F^T as a row operation
+    followed by the same operation on the columns.
+    """
+    # Coefficients in float64: the small-angle forms cancel badly in float32
+    dt64 = np.asarray(dt, dtype=np.float64)
+    w = x[6].astype(np.float64)
+    vx, vy = x[3].astype(np.float64), x[4].astype(np.float64)
+    wt = w * dt64
+    s, c = np.sin(wt), np.cos(wt)
+
+    # s/w, (1-c)/w and their derivatives w.r.t. w; series expansion near w=0
+    small = np.abs(wt) < 1e-4
+    w_safe = np.where(small, 1.0, w)
+    s_w = np.where(small, dt64 * (1 - wt**2 / 6), s / w_safe)
+    c_w = np.where(small, w * dt64**2 / 2, (1 - c) / w_safe)
+    ds_w = np.where(small, -w * dt64**3 / 3, (dt64 * c * w - s) / w_safe**2)
+    dc_w = np.where(small, dt64**2 / 2 * (1 - wt**2 / 4), (dt64 * s * w - (1 - c)) / w_safe**2)
+    turn_column = (ds_w * vx - dc_w * vy,
+                   dc_w * vx + ds_w * vy,
+                   -dt64 * (s * vx + c * vy),
+                   dt64 * (c * vx - s * vy))
+
+    dtype = x.dtype
+    coefficients = [np.asarray(v, dtype=dtype) for v in (dt64, s, c, s_w, c_w)]
+    turn_column = [v.astype(dtype) for v in turn_column]
+    P = _blocks(flat)
+    _turn(x, *coefficients)
+    _turn(P, *coefficients, turn_column)
+    _turn(P.swapaxes(0, 1), *coefficients, turn_column)
+    _add_process_noise(flat, coefficients[0], accel_var)
+    P[6, 6] += coefficients[0] * turn_rate_var
+
+
+def _correct(x, flat, z, R, dim):
+    """
+    Kalman update of the leading `dim` states of component-major `x` (7, N)
+    and covariances `flat` (49, N) in place.
+
+    Args:
+        z: (3, N) ENU positions
+        R: (6, N) measurement covariances (SYM3_INDEX order)
+        dim: 6 (CV) or 7 (CT)
+    """
+    P = _blocks(flat)
+
+    # S = P_pos + R = L L^T; i_k are the reciprocal diagonals of L
+    i0 = 1.0 / np.sqrt(P[0, 0] + R[0])
+    l10 = (P[0, 1] + R[1]) * i0
+    l20 = (P[0, 2] + R[2]) * i0
+    i1 = 1.0 / np.sqrt(P[1, 1] + R[3] - l10 * l10)
+    l21 = (P[1, 2] + R[4] - l10 * l20) * i1
+    i2 = 1.0 / np.sqrt(P[2, 2] + R[5] - l20 * l20 - l21 * l21)
+
+    # Forward substitution: C = L^-1 H P and y = L^-1 (z - H x). The scan is
+    # memory-bound, so everything below works in place on two buffers
+    C = np.empty((3, dim, len(i0)), dtype=x.dtype)
+    work = np.empty_like(C)
+    np.multiply(P[0, :dim], i0, out=C[0])
+    np.multiply(C[0], l10, out=C[1])
+    np.subtract(P[1, :dim], C[1], out=C[1])
+    C[1] *= i1
+    np.multiply(C[0], l20, out=C[2])
+    np.multiply(C[1], l21, out=work[0])
+    C[2] += work[0]
+    np.subtract(P[2, :dim], C[2], out=C[2])
+    C[2] *= i2
+    y0 = (z[0] - x[0]) * i0
+    y1 = (z[1] - x[1] - l10 * y0) * i1
+    y2 = (z[2] - x[2] - l20 * y0 - l21 * y1) * i2
+
+    # x += K (z - H x) = C^T y
+    np.multiply(C, np.stack([y0, y1, y2])[:, np.newaxis], out=work)
+    for term in work:
+        x[:dim] += term
+
+    # P -= K H P = C^T C, on the upper triangle (row k from column k), mirrored
+    for k in range(dim):
+        outer = np.multiply(C[:, k:], C[:, k:k + 1], out=work[:, :dim - k])
+        row = P[k, k:dim]
+        for term in outer:
+            row -= term
+        P[k + 1:dim, k] = P[k, k + 1:dim]
+
+
+class KalmanTrackBank:
+    """
+    Bank of CV/CT Kalman filters keyed by radar track label.
+
+    Tracks are addressed by the integer `track_id` of a TrackBatch; a lookup
+    table maps labels to rows of the stacked state arrays. Tracks that coast
+    longer than `max_coast_s` are dropped and their rows reused.
+    """
+
+    def __init__(
+        self,
+        sigma_azimuth_deg=1.0,       # Match RadarTrackSimulator noise model
+        sigma_elevation_deg=1.5,
+        sigma_range_m=10.0,
+        accel_noise_m_s2=3.0,        # Small UAS manoeuvre level (1-sigma)
+        turn_rate_noise_deg_s2=2.0,  # CT turn-rate random walk (1-sigma)
+        initial_speed_sigma_m_s=30.0,
+        max_coast_s=5.0,
+        default_model=MODEL_CV,
+        capacity=1024,
+        dtype=np.float32
+    ):
+        """
+        Initialize empty track bank.
+
+        Args:
+            sigma_azimuth_deg: Plot azimuth noise (1-sigma, degrees)
+            sigma_elevation_deg: Plot elevation noise (1-sigma, degrees)
+            sigma_range_m: Plot range noise (1-sigma, meters)
+            accel_noise_m_s2: White acceleration process noise (1-sigma)
+            turn_rate_noise_deg_s2: Turn-rate process noise for CT tracks
+            initial_speed_sigma_m_s: Velocity uncertainty of a new track
+            max_coast_s: Drop tracks not updated for this long
+            default_model: MODEL_CV or MODEL_CT for new tracks
+            capacity: Initial number of track rows
+            dtype: State / covariance precision (float32: millimetre
+                   resolution at 10 km, half the memory traffic of float64)
+        """
+        self.sigma_aer = np.array([
+            np.deg2rad(sigma_azimuth_deg),
+            np.deg2rad(sigma_elevation_deg),
+            sigma_range_m
+        ])
+        self.accel_var = accel_noise_m_s2**2
+        self.turn_rate_var = np.deg2rad(turn_rate_noise_deg_s2)**2
+        self.initial_speed_var = initial_speed_sigma_m_s**2
+        self.max_coast_s = max_coast_s
+        self.default_model = default_model
+        self.dtype = np.dtype(dtype)
+
+        self._x = np.zeros((STATE_DIM, capacity), dtype=self.dtype)
+        self._P = np.zeros((STATE_DIM * STATE_DIM, capacity), dtype=self.dtype)
+        self.last_time = np.zeros(capacity)
+        self.last_update = np.zeros(capacity)
+        self.num_updates = np.zeros(capacity, dtype=np.int64)
+        self.model = np.zeros(capacity, dtype=np.int8)
+        self.label = np.full(capacity, -1, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+
+        self._slot_of = np.full(1024, -1, dtype=np.int64)
+        self._free = []
+        self._num_slots = 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.active))
+
+    @property
+    def x(self):
+        """(capacity, 7) states (view of the component-major storage)."""
+        return self._x.T
+
+    @property
+    def P(self):
+        """(capacity, 7, 7) covariances (view of the component-major storage)."""
+        return _blocks(self._P).transpose(2, 0, 1)
+
+    # ------------------------------------------------------------------
+    # Slot management
+    # ------------------------------------------------------------------
+
+    def _grow(self, capacity):
+        for name in ('_x', '_P'):
+            old = getattr(self, name)
+            new = np.zeros(old.shape[:-1] + (capacity,), dtype=old.dtype)
+            new[:, :old.shape[-1]] = old
+            setattr(self, name, new)
+        for name in ('last_time', 'last_update', 'num_updates', 'model', 'label', 'active'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            if name == 'label':
+                new[len(old):] = -1
+            setattr(self, name, new)
+
+    def _allocate(self, labels):
+        """Assign rows to new track labels."""
+        count = len(labels)
+        reuse = min(count, len(self._free))
+        slots = [self._free.pop() for _ in range(reuse)]
+        fresh = count - reuse
+        slots = np.array(slots + list(range(self._num_slots, self._num_slots + fresh)), dtype=np.int64)
+        self._num_slots += fresh
+        if self._num_slots > len(self.label):
+            self._grow(max(2 * len(self.label), self._num_slots))
+
+        if labels.max() >= len(self._slot_of):
+            table = np.full(max(2 * len(self._slot_of), int(labels.max()) + 1), -1, dtype=np.int64)
+            table[:len(self._slot_of)] = self._slot_of
+            self._slot_of = table
+        self._slot_of[labels] = slots
+        self.label[slots] = labels
+        return slots
+
+    def slots_for(self, labels):
+        """Rows for existing track labels (-1 where unknown)."""
+        labels = np.asarray(labels, dtype=np.int64)
+        slots = np.full(len(labels), -1, dtype=np.int64)
+        known = labels < len(self._slot_of)
+        slots[known] = self._slot_of[labels[known]]
+        return slots
+
+    @staticmethod
+    def _rows(slots):
+        """
+        Index for a set of rows: a slice when they are contiguous and
+        ascending (the common case of a full scan), so the stacked arrays are
+        updated through views instead of gather/scatter copies.
+        """
+        if len(slots) and slots[-1] - slots[0] == len(slots) - 1 and np.all(np.diff(slots) == 1):
+            return slice(int(slots[0]), int(slots[-1]) + 1)
+        return slots
+
+    def drop_stale(self, time_s):
+        """Deactivate tracks not updated within `max_coast_s`."""
+        stale = np.flatnonzero(self.active & (time_s - self.last_update > self.max_coast_s))
+        if len(stale):
+            self.active[stale] = False
+            self._slot_of[self.label[stale]] = -1
+            self.label[stale] = -1
+            self._free.extend(stale.tolist())
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    # Filter steps
+    # ------------------------------------------------------------------
+
+    def _measurement(self, azimuth_deg, elevation_deg, range_m, dtype):
+        """
+        Converted ENU positions (3, M) and packed covariances (6, M).
+
+        The polar noise is diagonal in the (range, azimuth, elevation) unit
+        vectors at the plot, so R is a sum of three scaled outer products;
+        its six unique entries are written out directly.
+        """
+        az = np.deg2rad(np.asarray(azimuth_deg, dtype=dtype))
+        el = np.deg2rad(np.asarray(elevation_deg, dtype=dtype))
+        r = np.asarray(range_m, dtype=dtype)
+        sa, ca, se, ce = np.sin(az), np.cos(az), np.sin(el), np.cos(el)
+
+        horizontal = r * ce
+        z = np.stack([horizontal * sa, horizontal * ca, r * se])
+        var_range = float(self.sigma_aer[2])**2
+        var_az = (horizontal * float(self.sigma_aer[0]))**2
+        var_el = (r * float(self.sigma_aer[1]))**2
+
+        # Range/elevation variance along the horizontal, and their cross term
+        horizontal_var = var_range * ce * ce + var_el * se * se
+        cross = (var_range - var_el) * se * ce
+        R = np.stack([
+            horizontal_var * sa * sa + var_az * ca * ca,
+            (horizontal_var - var_az) * sa * ca,
+            cross * sa,
+            horizontal_var * ca * ca + var_az * sa * sa,
+            cross * ca,
+            var_range * se * se + var_el * ce * ce,
+        ])
+        return z, R
+
+    def measurement(self, azimuth_deg, elevation_deg, range_m):
+        """
+        Converted ENU position and covariance for a set of plots.
+
+        Returns:
+            z: (M, 3) ENU positions
+            R: (M, 3, 3) ENU measurement covariances
+        """
+        z, R = self._measurement(azimuth_deg, elevation_deg, range_m, np.float64)
+        return z.T, unpack_sym3(R)
+
+    def _initiate(self, slots, time_s, z, R, model):
+        self._x[:, slots] = 0.0
+        self._x[:3, slots] = z
+        self._P[:, slots] = 0.0
+        P = _blocks(self._P)
+        for k, (i, j) in enumerate(SYM3_INDEX):
+            P[i, j, slots] = P[j, i, slots] = R[k]
+        P[3, 3, slots] = P[4, 4, slots] = self.initial_speed_var
+        P[5, 5, slots] = self.initial_speed_var / 4
+        P[6, 6, slots] = np.where(model == MODEL_CT, np.deg2rad(10.0)**2, 0.0)
+        self.last_time[slots] = time_s
+        self.last_update[slots] = time_s
+        self.num_updates[slots] = 1
+        self.model[slots] = model
+        self.active[slots] = True
+
+    def _new_tracks(self, labels, time_s, z, R, model):
+        labels = np.asarray(labels, dtype=np.int64)
+        if model is None:
+            model = np.full(len(labels), self.default_model, dtype=np.int8)
+        slots = self._allocate(labels)
+        self._initiate(slots, time_s, z, R, np.asarray(model, dtype=np.int8))
+        return slots
+
+    def initiate(self, labels, time_s, z, R, model=None):
+        """
+        Start new tracks from single ENU measurements.
+
+        Args:
+            labels: (M,) new integer track labels
+            time_s: Measurement time (seconds)
+            z: (M, 3) ENU positions
+            R: (M, 3, 3) ENU measurement covariances
+            model: Optional (M,) motion model (default: `default_model`)
+
+        Returns:
+            slots: (M,) rows of the new tracks
+        """
+        return self._new_tracks(labels, time_s, np.asarray(z).T, pack_sym3(R), model)
+
+    @staticmethod
+    def _by_model(is_ct, step, arrays):
+        """
+        Run `step(arrays..., is_ct)` on component-major `arrays` (sliced on
+        their last axis) per motion model, in place; mixed sets go through
+        gathered copies written back afterwards.
+        """
+        if not np.any(is_ct) or np.all(is_ct):
+            step(*arrays, bool(np.any(is_ct)))
+            return
+        for ct in (False, True):
+            index = np.flatnonzero(is_ct == ct)
+            parts = [a[..., index] for a in arrays]
+            step(*parts, ct)
+            for a, part in zip(arrays, parts):
+                a[..., index] = part
+
+    def _propagate(self, x, flat, dt, is_ct):
+        """
+        Propagate component-major states `x` (7, M) and covariances `flat`
+        (49, M) by `dt` (M,) in place.
+        """
+        def step(x, flat, dt, ct):
+            if ct:
+                _predict_ct(x, flat, dt, self.accel_var, self.turn_rate_var)
+            else:
+                _predict_cv(x, flat, dt.astype(self.dtype), self.accel_var)
+        self._by_model(is_ct, step, (x, flat, dt))
+
+    def predict(self, slots, time_s):
+        """
+        Propagate the given tracks to `time_s` in place.
+
+        Args:
+            slots: Track rows
+            time_s: Target time (scalar or per-slot array, seconds)
+        """
+        rows = self._rows(slots)
+        dt = np.broadcast_to(np.asarray(time_s, dtype=np.float64), slots.shape) - self.last_time[rows]
+        x = self._x[:, rows]
+        flat = self._P[:, rows]
+        self._propagate(x, flat, dt, self.model[rows] == MODEL_CT)
+
+        if not isinstance(rows, slice):
+            self._P[:, rows] = flat
+            self._x[:, rows] = x
+        self.last_time[rows] = time_s
+
+    def extrapolate(self, time_s, slots=None):
+        """
+        Predicted kinematics at `time_s` without touching the filter state
+        (e.g. where a target will be when the turret finishes slewing).
+
+        Args:
+            time_s: Target time (scalar or per-slot array, seconds)
+            slots: Track rows (default: all active)
+
+        Returns:
+            position_enu: (N, 3) predicted positions
+            velocity_enu: (N, 3) predicted velocities
+            position_cov_enu: (N, 3, 3) predicted position covariances
+        """
+        if slots is None:
+            slots = np.flatnonzero(self.active)
+        slots = np.asarray(slots, dtype=np.int64)
+        dt = np.broadcast_to(np.asarray(time_s, dtype=np.float64), slots.shape) - self.last_time[slots]
+        x = self._x[:, slots]
+        flat = self._P[:, slots]
+        self._propagate(x, flat, dt, self.model[slots] == MODEL_CT)
+        P = _blocks(flat)
+        return x[:3].T, x[3:6].T, P[:3, :3].transpose(2, 0, 1)
+
+    def _update(self, slots, z, R):
+        """`update` with component-major z (3, M) and packed R (6, M)."""
+        rows = self._rows(slots)
+        x = self._x[:, rows]
+        flat = self._P[:, rows]
+
+        def step(x, flat, z, R, ct):
+            _correct(x, flat, z, R, STATE_DIM if ct else CV_STATE_DIM)
+        self._by_model(self.model[rows] == MODEL_CT, step, (x, flat, z, R))
+
+        if not isinstance(rows, slice):
+            self._P[:, rows] = flat
+            self._x[:, rows] = x
+        self.last_update[rows] = self.last_time[rows]
+        self.num_updates[rows] += 1
+
+    def update(self, slots, z, R):
+        """
+        Kalman update of predicted tracks with ENU position measurements.
+
+        Args:
+            slots: Track rows (already predicted to the measurement time)
+            z: (M, 3) ENU positions
+            R: (M, 3, 3) ENU measurement covariances
+        """
+        self._update(slots, np.asarray(z, dtype=self.dtype).T, pack_sym3(R).astype(self.dtype))
+
+    def process_scan(self, time_s, track_id, azimuth_deg, elevation_deg, range_m, model=None):
+        """
+        Predict/update all tracks reported in one radar scan.
+
+        Plots with negative track_id (false alarms / unassociated) are
+        ignored; unknown labels start new tracks.
+
+        Args:
+            time_s: Scan time (seconds)
+            track_id: (M,) integer track labels
+            azimuth_deg, elevation_deg, range_m: (M,) measured AER
+            model: Optional (M,) motion model for new tracks
+
+        Returns:
+            slots: (M',) rows updated in this scan
+        """
+        track_id = np.asarray(track_id, dtype=np.int64)
+        valid = track_id >= 0
+        if not np.all(valid):
+            track_id = track_id[valid]
+            azimuth_deg = np.asarray(azimuth_deg)[valid]
+            elevation_deg = np.asarray(elevation_deg)[valid]
+            range_m = np.asarray(range_m)[valid]
+            if model is not None:
+                model = np.asarray(model)[valid]
+
+        z, R = self._measurement(azimuth_deg, elevation_deg, range_m, self.dtype)
+        slots = self.slots_for(track_id)
+        new = slots < 0
+
+        if not np.any(new):
+            self.predict(slots, time_s)
+            self._update(slots, z, R)
+            return slots
+
+        old = ~new
+        if np.any(old):
+            self.predict(slots[old], time_s)
+            self._update(slots[old], z[:, old], R[:, old])
+        slots[new] = self._new_tracks(track_id[new], time_s, z[:, new], R[:, new],
+                                      None if model is None else np.asarray(model)[new])
+        return slots
+
+    def process_batch(self, batch):
+        """
+        Run a whole TrackBatch scan by scan.
+
+        Returns:
+            filtered: TrackBatch of filtered AER per (non false alarm) plot,
+                      truth columns carried over
+            uncertainty_m: (M,) 1-sigma position uncertainty per row
+        """
+        batches, uncertainty = [], []
+        for scan_time, scan in batch.sort_by_time().iter_scans():
+            self.drop_stale(scan_time)
+            slots = self.process_scan(scan_time, scan.track_id, scan.azimuth_deg,
+                                      scan.elevation_deg, scan.range_m)
+            estimate = self.estimates(slots)
+            columns = scan.select(scan.track_id >= 0).columns()
+            columns.update({k: estimate[k] for k in ('azimuth_deg', 'elevation_deg', 'range_m')})
+            batches.append(TrackBatch(columns, start_time=batch.start_ns, track_names=batch.track_names))
+            uncertainty.append(estimate['uncertainty_m'])
+
+        if not batches:
+            return batch, np.zeros(0)
+        return TrackBatch.concatenate(batches), np.concatenate(uncertainty)
+
+    # ------------------------------------------------------------------
+    # Outputs
+    # ------------------------------------------------------------------
+
+    def estimates(self, slots=None):
+        """
+        Filtered AER and uncertainty for tracks.
+
+        Args:
+            slots: Track rows (default: all active tracks)
+
+        Returns:
+            Dict of arrays: track_id, time_s, azimuth_deg, elevation_deg,
+            range_m, sigma_azimuth_deg, sigma_elevation_deg, sigma_range_m,
+            uncertainty_m (1-sigma along the worst position axis),
+            position_cov_enu (N, 3, 3), velocity_enu (N, 3)
+        """
+        if slots is None:
+            slots = np.flatnonzero(self.active)
+        position = self.x[slots, :3].astype(np.float64)
+        cov = self.P[slots, :3, :3].astype(np.float64)
+        azimuth_deg, elevation_deg, range_m = enu_to_aer(*position.T)
+
+        # Polar covariance via inverse Jacobian of AER -> ENU
+        J_inv = np.linalg.inv(aer_jacobian(azimuth_deg, elevation_deg, np.maximum(range_m, 1e-6)))
+        cov_aer = J_inv @ cov @ J_inv.transpose(0, 2, 1)
+        sigma_aer = np.sqrt(np.maximum(np.diagonal(cov_aer, axis1=1, axis2=2), 0.0))
+
+        return {
+            'track_id': self.label[slots],
+            'time_s': self.last_time[slots],
+            'azimuth_deg': azimuth_deg,
+            'elevation_deg': elevation_deg,
+            'range_m': range_m,
+            'sigma_azimuth_deg': np.rad2deg(sigma_aer[:, 0]),
+            'sigma_elevation_deg': np.rad2deg(sigma_aer[:, 1]),
+            'sigma_range_m': sigma_aer[:, 2],
+            'uncertainty_m': np.sqrt(np.linalg.eigvalsh(cov)[:, -1]),
+            'position_cov_enu': cov,
+            'velocity_enu': self.x[slots, 3:6].astype(np.float64),
+        }
+
+
+def main():
+    """
+    Benchmark: 10k tracks at 1 Hz, then report accuracy on a simulated picture.
+
+    Usage:
+        python src/tracking/kalman_bank.py --tracks 10000 --scans 20
+    """
+    from simulate_radar_tracks import RadarTrackSimulator
+    from simulate_air_picture import AirPictureGenerator
+
+    parser = argparse.ArgumentParser(description='Vectorized Kalman track bank')
+    parser.add_argument('--tracks', type=int, default=10_000, help='Tracks per scan (benchmark)')
+    parser.add_argument('--scans', type=int, default=20, help='Scans to time')
+    parser.add_argument('--model', choices=['cv', 'ct'], default='cv', help='Motion model')
+    args = parser.parse_args()
+
+    model = MODEL_CT if args.model == 'ct' else MODEL_CV
+    rng = np.random.default_rng(0)
+    n = args.tracks
+
+    # --- Throughput benchmark on synthetic straight-line targets ---
+    bank = KalmanTrackBank(default_model=model, capacity=n)
+    position = np.column_stack([rng.uniform(-4000, 4000, (n, 2)), rng.uniform(20, 500, n)])
+    velocity = np.column_stack([rng.uniform(-20, 20, (n, 2)), np.zeros(n)])
+    labels = np.arange(n)
+
+    timings = []
+    for scan in range(args.scans):
+        truth = position + velocity * scan
+        az, el, rng_m = enu_to_aer(*truth.T)
+        az = az + rng.normal(0, 1.0, n)
+        el = el + rng.normal(0, 1.5, n)
+        rng_m = rng_m + rng.normal(0, 10.0, n)
+        t0 = time.perf_counter()
+        bank.process_scan(float(scan), labels, az, el, rng_m)
+        timings.append(time.perf_counter() - t0)
+
+    steady = np.array(timings[2:]) * 1e3
+    print(f"[INFO] Kalman bank benchmark ({args.model.upper()}, {n:,} tracks):")
+    print(f"       - Per scan: median {np.median(steady):.2f} ms, max {steady.max():.2f} ms")
+    if model == MODEL_CV and n == SCAN_BUDGET_TRACKS:
+        status = 'within' if np.median(steady) < SCAN_BUDGET_MS else '[WARNING] over'
+        print(f"       - Scan budget: {status} {SCAN_BUDGET_MS:.0f} ms")
+
+    est = bank.estimates()
+    error = np.linalg.norm(bank.x[:n, :3] - (position + velocity * (args.scans - 1)), axis=1)
+    print(f"       - Position error: median {np.median(error):.1f} m "
+          f"(raw plot ~{np.median(rng_m * np.deg2rad(1.0)):.1f} m cross-range)")
+    print(f"       - Median uncertainty_m: {np.median(est['uncertainty_m']):.1f} m")
+
+    # --- Accuracy on a simulated air picture ---
+    radar = RadarTrackSimulator()
+    picture = AirPictureGenerator(radar, seed=1).generate(num_targets=200, duration_sec=120,
+                                                          id_swap_prob=0.0, false_alarms_per_scan=0)
+    filtered, _ = KalmanTrackBank(default_model=model).process_batch(picture.plots)
+    raw = picture.plots
+    raw_err = np.abs(np.asarray(raw.range_m) - np.asarray(raw.true_range_m))
+    filt_err = np.abs(np.asarray(filtered.range_m) - np.asarray(filtered.true_range_m))
+    print(f"\n[SUCCESS] Air picture ({len(raw):,} plots):")
+    print(f"       - Range error RMS: raw {np.sqrt(np.mean(raw_err**2)):.1f} m, "
+          f"filtered {np.sqrt(np.mean(filt_err**2)):.1f} m")
+
+
+if __name__ == '__main__':
+    main()
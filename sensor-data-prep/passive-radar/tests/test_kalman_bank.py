@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the vectorized Kalman track bank
+
+Tests validate that:
+- Converted measurement covariance matches the AER -> ENU Jacobian
+- CV tracks converge on straight-line targets and report shrinking covariance
+- CT tracks estimate the turn rate of a circling target
+- The float32 bank tracks a float64 one and mixed CV/CT scans match per-model
+  banks (the 10k-track scan time budget is checked by the benchmark in
+  kalman_bank.main(), not here: wall-clock asserts are host-dependent)
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-16
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add tracking directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'tracking'))
+
+from kalman_bank import KalmanTrackBank, MODEL_CV, MODEL_CT, aer_jacobian
+from coordinates import enu_to_aer  # common/ is on sys.path via kalman_bank
+
+
+def _straight_targets(rng, n):
+    start = np.column_stack([rng.uniform(-3000, 3000, (n, 2)), rng.uniform(50, 300, n)])
+    velocity = np.column_stack([rng.uniform(-15, 15, (n, 2)), np.zeros(n)])
+    return start, velocity
+
+
+def _noisy_plots(rng, truth, sigma=(1.0, 1.5, 10.0)):
+    az, el, rng_m = enu_to_aer(*truth.T)
+    return (az + rng.normal(0, sigma[0], len(az)),
+            el + rng.normal(0, sigma[1], len(az)),
+            rng_m + rng.normal(0, sigma[2], len(az)))
+
+
+class TestMeasurementModel:
+    """Plot conversion into ENU"""
+
+    def test_covariance_matches_jacobian(self):
+        """Test: R equals J diag(sigma^2) J^T"""
+        bank = KalmanTrackBank()
+        az = np.array([0.0, 45.0, 200.0])
+        el = np.array([2.0, 10.0, 30.0])
+        rng_m = np.array([500.0, 2000.0, 4000.0])
+        z, R = bank.measurement(az, el, rng_m)
+        J = aer_jacobian(az, el, rng_m)
+        expected = (J * bank.sigma_aer**2) @ J.transpose(0, 2, 1)
+        assert np.allclose(R, expected)
+        assert np.allclose(enu_to_aer(*z.T)[2], rng_m)
+
+
+class TestFiltering:
+    """Filter convergence"""
+
+    def test_cv_tracks_converge(self):
+        """Test: CV bank beats raw plots and its covariance shrinks"""
+        rng = np.random.default_rng(0)
+        n = 500
+        start = np.column_stack([rng.uniform(-3000, 3000, (n, 2)), rng.uniform(50, 300, n)])
+        velocity = np.column_stack([rng.uniform(-15, 15, (n, 2)), np.zeros(n)])
+        bank = KalmanTrackBank()
+
+        for scan in range(30):
+            truth = start + velocity * scan
+            bank.process_scan(float(scan), np.arange(n), *_noisy_plots(rng, truth))
+            if scan == 1:
+                early_uncertainty = bank.estimates()['uncertainty_m']
+
+        estimates = bank.estimates()
+        truth = start + velocity * 29
+        raw = enu_to_aer(*truth.T)
+        filtered_error = np.abs(estimates['range_m'] - raw[2])
+        assert np.sqrt(np.mean(filtered_error**2)) < 10.0
+        assert np.median(estimates['uncertainty_m']) < np.median(early_uncertainty)
+        speed_error = np.linalg.norm(bank.x[:n, 3:5] - velocity[:, :2], axis=1)
+        assert np.median(speed_error) < 5.0
+
+    def test_ct_estimates_turn_rate(self):
+        """Test: CT model recovers the turn rate of a circling target"""
+        rng = np.random.default_rng(1)
+        omega = np.deg2rad(6.0)
+        bank = KalmanTrackBank(default_model=MODEL_CT, sigma_azimuth_deg=0.2,
+                               sigma_elevation_deg=0.2, sigma_range_m=2.0)
+        for scan in range(120):
+            t = 0.5 * scan
+            truth = np.array([[1500 + 200 * np.sin(omega * t), 1500 - 200 * np.cos(omega * t), 100.0]])
+            bank.process_scan(t, np.array([0]), *_noisy_plots(rng, truth, (0.2, 0.2, 2.0)))
+
+        assert abs(bank.x[0, 6] - omega) < np.deg2rad(1.5)
+
+    def test_extrapolate_leaves_state_untouched(self):
+        """Test: extrapolate matches predict without mutating the bank"""
+        rng = np.random.default_rng(2)
+        n = 50
+        start = np.column_stack([rng.uniform(-3000, 3000, (n, 2)), rng.uniform(50, 300, n)])
+        velocity = np.column_stack([rng.uniform(-15, 15, (n, 2)), np.zeros(n)])
+        bank = KalmanTrackBank()
+        for scan in range(5):
+            bank.process_scan(float(scan), np.arange(n), *_noisy_plots(rng, start + velocity * scan))
+
+        x_before, P_before = bank.x[:n].copy(), bank.P[:n].copy()
+        slots = bank.slots_for(np.arange(n))
+        position, velocity_est, cov = bank.extrapolate(6.5, slots)
+        assert np.array_equal(bank.x[:n], x_before) and np.array_equal(bank.P[:n], P_before)
+
+        bank.predict(slots, 6.5)
+        assert np.allclose(position, bank.x[:n, :3]) and np.allclose(velocity_est, bank.x[:n, 3:6])
+        assert np.allclose(cov, bank.P[:n, :3, :3])
+        # Position uncertainty grows while coasting
+        assert np.all(np.trace(cov, axis1=1, axis2=2) > np.trace(P_before[:, :3, :3], axis1=1, axis2=2))
+
+
+class TestPerformance:
+    """Precision and scan-time regressions"""
+
+    def test_float32_matches_float64(self):
+        """Test: float32 storage stays within centimetres of a float64 bank"""
+        rng = np.random.default_rng(3)
+        n = 200
+        start, velocity = _straight_targets(rng, n)
+        model = np.where(np.arange(n) % 2, MODEL_CT, MODEL_CV)
+        banks = [KalmanTrackBank(dtype=np.float32), KalmanTrackBank(dtype=np.float64)]
+        for scan in range(20):
+            plots = _noisy_plots(rng, start + velocity * scan)
+            for bank in banks:
+                bank.process_scan(float(scan), np.arange(n), *plots, model=model)
+
+        single, double = banks
+        assert single.x.dtype == np.float32 and double.x.dtype == np.float64
+        assert np.max(np.abs(single.x[:n, :3] - double.x[:n, :3])) < 0.05
+        assert np.allclose(single.P[:n, :3, :3], double.P[:n, :3, :3], rtol=1e-3, atol=1e-3)
+
+    def test_mixed_models_match_separate_banks(self):
+        """Test: A mixed CV/CT scan equals per-model banks; CV rows stay 6-state"""
+        rng = np.random.default_rng(4)
+        n = 100
+        start, velocity = _straight_targets(rng, n)
+        model = np.where(np.arange(n) < n // 2, MODEL_CV, MODEL_CT)
+        mixed = KalmanTrackBank(dtype=np.float64)
+        cv = KalmanTrackBank(default_model=MODEL_CV, dtype=np.float64)
+        ct = KalmanTrackBank(default_model=MODEL_CT, dtype=np.float64)
+        for scan in range(10):
+            az, el, rng_m = _noisy_plots(rng, start + velocity * scan)
+            mixed.process_scan(float(scan), np.arange(n), az, el, rng_m, model=model)
+            half = slice(0, n // 2)
+            cv.process_scan(float(scan), np.arange(n // 2), az[half], el[half], rng_m[half])
+            half = slice(n // 2, n)
+            ct.process_scan(float(scan), np.arange(n // 2), az[half], el[half], rng_m[half])
+
+        assert np.allclose(mixed.x[:n // 2], cv.x[:n // 2])
+        assert np.allclose(mixed.P[n // 2:n], ct.P[:n // 2])
+        assert not np.any(mixed.x[:n // 2, 6]) and not np.any(mixed.P[:n // 2, 6])
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming radar track statistics
+
+Tests validate that:
+- Welford / Chan merges over a chunked stream match np.mean / np.std(ddof=1)
+  per track and globally (bias, sigma, detection rate)
+- Detections and scheduled samples meet under the truth identity, also
+  when the radar reports a target under a swapped label
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-15
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add simulations directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'simulations'))
+
+from track_batch import TrackBatch
+from track_statistics import TrackStatistics, wrap_angle_deg
+
+
+NUM_TARGETS = 5
+
+
+def _stream(rng, n):
+    """Truth samples, detections (20% dropped, labels swapped) and clutter."""
+    truth_id = rng.integers(0, NUM_TARGETS, n)
+    true_az = rng.uniform(0, 360, n)
+    true_el = rng.uniform(0, 30, n)
+    true_rng = rng.uniform(100, 5000, n)
+    names = [f"TRK{i:05d}" for i in range(NUM_TARGETS)]
+    truth = TrackBatch({
+        'time_s': np.arange(n, dtype=np.float64),
+        'track_id': truth_id,
+        'azimuth_deg': true_az,
+        'elevation_deg': true_el,
+        'range_m': true_rng,
+        'true_azimuth_deg': true_az,
+        'true_elevation_deg': true_el,
+        'true_range_m': true_rng,
+    }, start_time=0, track_names=names)
+
+    detections = truth.select(rng.random(n) >= 0.2)
+    m = len(detections)
+    detections.azimuth_deg = np.mod(detections.true_azimuth_deg + rng.normal(0.3, 1.0, m), 360.0)
+    detections.elevation_deg = detections.true_elevation_deg + rng.normal(-0.1, 1.5, m)
+    detections.range_m = detections.true_range_m + rng.normal(2.0, 10.0, m)
+    detections.track_id = (detections.track_id + 1) % NUM_TARGETS  # Reported labels swapped
+
+    clutter = TrackBatch({
+        'time_s': np.arange(10, dtype=np.float64),
+        'track_id': np.full(10, -1),
+        'azimuth_deg': rng.uniform(0, 360, 10),
+        'elevation_deg': rng.uniform(0, 30, 10),
+        'range_m': rng.uniform(100, 5000, 10),
+        'true_track_id': np.full(10, -1),
+    }, start_time=0, track_names=names)
+    return truth, detections, clutter
+
+
+def _errors(batch):
+    return np.column_stack([
+        wrap_angle_deg(batch.azimuth_deg - batch.true_azimuth_deg),
+        batch.elevation_deg - batch.true_elevation_deg,
+        batch.range_m - batch.true_range_m,
+    ])
+
+
+class TestStreamingMoments:
+    """Chunked accumulation against one-shot numpy reductions"""
+
+    def setup_method(self):
+        rng = np.random.default_rng(0)
+        self.truth, self.detections, self.clutter = _stream(rng, 4000)
+        self.stats = TrackStatistics(initial_capacity=2)  # Forces slot growth
+        for start in range(0, len(self.truth), 700):
+            chunk = slice(start, start + 700)
+            in_chunk = (self.detections.time_s >= start) & (self.detections.time_s < start + 700)
+            self.stats.update_batch(self.detections.select(in_chunk),
+                                    expected=self.truth.select(np.arange(len(self.truth))[chunk]))
+        self.stats.update_batch(self.clutter)
+        self.errors = _errors(self.detections)
+
+    def test_per_track_matches_numpy(self):
+        """Test: Per-track bias/sigma equal np.mean/np.std(ddof=1) by truth id"""
+        per_track = self.stats.per_track_stats()
+        assert len(per_track) == NUM_TARGETS
+        for target in range(NUM_TARGETS):
+            stats = per_track[f"TRK{target:05d}"]
+            mine = self.detections.true_track_id == target
+            for f, name in enumerate(('azimuth_deg', 'elevation_deg', 'range_m')):
+                assert np.isclose(stats[f'{name}_bias'], np.mean(self.errors[mine, f]))
+                assert np.isclose(stats[f'{name}_sigma'], np.std(self.errors[mine, f], ddof=1))
+            scheduled = np.count_nonzero(self.truth.track_id == target)
+            assert np.isclose(stats['detection_rate'], np.count_nonzero(mine) / scheduled)
+
+    def test_global_matches_numpy(self):
+        """Test: Global bias, sigma and detection rate over the whole stream"""
+        stats = self.stats.global_stats()
+        assert stats['num_detections'] == len(self.detections)
+        for f, name in enumerate(('azimuth_deg', 'elevation_deg', 'range_m')):
+            assert np.isclose(stats[f'{name}_bias'], np.mean(self.errors[:, f]))
+            assert np.isclose(stats[f'{name}_sigma'], np.std(self.errors[:, f], ddof=1))
+        assert np.isclose(stats['detection_rate'], len(self.detections) / len(self.truth))
+        assert self.stats.num_false_alarms == len(self.clutter)
+        assert self.stats.num_detections == len(self.detections) + len(self.clutter)
+
+    def test_detection_rate_never_exceeds_one(self):
+        """Test: Swapped labels do not move detections onto another target's samples"""
+        rates = [s['detection_rate'] for s in self.stats.per_track_stats().values()]
+        assert all(0.75 < rate < 0.85 for rate in rates)
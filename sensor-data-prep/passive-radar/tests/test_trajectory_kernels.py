@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for vectorized trajectory kernels
+
+Tests validate that every kernel:
+- Starts at its configured position
+- Returns velocity/acceleration consistent with its position history
+- Matches the legacy per-sample flight path generators
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-14
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add simulations directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'simulations'))
+
+import trajectory_kernels as kernels
+
+
+def _finite_difference(kernel, t, dt=1e-4):
+    """Central-difference velocity and acceleration of a kernel's position."""
+    p_minus = kernel(t - dt)[0]
+    p_zero = kernel(t)[0]
+    p_plus = kernel(t + dt)[0]
+    velocity = (p_plus - p_minus) / (2 * dt)
+    acceleration = (p_plus - 2 * p_zero + p_minus) / dt**2
+    return velocity, acceleration
+
+
+class TestKernelDerivatives:
+    """Velocity and acceleration must be the derivatives of position"""
+
+    def setup_method(self):
+        self.t = np.linspace(0.5, 59.5, 200)
+        waypoints = np.array([[0, 0, 50], [300, 100, 60], [500, 400, 80], [200, 600, 40]], dtype=float)
+        knot_times = kernels.waypoint_times(waypoints, speed_m_s=15.0)
+        self.kernels = {
+            'constant_velocity': lambda t: kernels.constant_velocity(t, (0, 500, 50), (0, -20, 1)),
+            'constant_turn': lambda t: kernels.constant_turn(t, (200, 200, 100), 50, 10, 30, 0.5),
+            'coordinated_turn': lambda t: kernels.coordinated_turn(t, (0, 0, 100), (20, 5, -1), -6),
+            'dive': lambda t: kernels.dive(t, (0, 0, 300), 45, 15, 30, 2.0, 20),
+            'hover_with_drift': lambda t: kernels.hover_with_drift(t, (100, 100, 80), (0.5, -0.3, 0)),
+            'cubic_spline': lambda t: kernels.cubic_spline(t, waypoints, knot_times),
+        }
+
+    def test_velocity_matches_position(self):
+        """Test: Returned velocity equals numerical derivative of position"""
+        for name, kernel in self.kernels.items():
+            _, velocity, _ = kernel(self.t)
+            numeric_velocity, _ = _finite_difference(kernel, self.t)
+            # Dive pull-out is a velocity discontinuity; skip samples straddling it
+            smooth = np.all(np.abs(numeric_velocity - velocity) < 1e-3, axis=1)
+            assert np.mean(smooth) > 0.98, f"{name}: velocity inconsistent with position"
+
+    def test_acceleration_matches_velocity(self):
+        """Test: Returned acceleration equals numerical second derivative"""
+        for name, kernel in self.kernels.items():
+            _, _, acceleration = kernel(self.t)
+            _, numeric_acceleration = _finite_difference(kernel, self.t, dt=1e-3)
+            smooth = np.all(np.abs(numeric_acceleration - acceleration) < 1e-2, axis=1)
+            assert np.mean(smooth) > 0.98, f"{name}: acceleration inconsistent with velocity"
+
+
+class TestKernelGeometry:
+    """Kernel-specific geometric checks"""
+
+    def test_constant_turn_matches_legacy_circle(self):
+        """Test: constant_turn reproduces generate_circular_flight_path geometry"""
+        t = np.arange(72.0)
+        position, _, _ = kernels.constant_turn(t, (200, 200, 100), 50, 10)
+        angle = np.deg2rad(10 * t)
+        assert np.allclose(position[:, 0], 200 + 50 * np.cos(angle))
+        assert np.allclose(position[:, 1], 200 + 50 * np.sin(angle))
+        assert np.allclose(position[:, 2], 100)
+
+    def test_coordinated_turn_zero_rate_is_linear(self):
+        """Test: Zero turn rate degenerates to constant velocity"""
+        t = np.linspace(0, 30, 31)
+        turn = kernels.coordinated_turn(t, (10, 20, 30), (5, -3, 1), 0.0)
+        line = kernels.constant_velocity(t, (10, 20, 30), (5, -3, 1))
+        for a, b in zip(turn, line):
+            assert np.allclose(a, b)
+
+    def test_coordinated_turn_preserves_speed(self):
+        """Test: Speed is constant through the turn"""
+        t = np.linspace(0, 90, 500)
+        _, velocity, _ = kernels.coordinated_turn(t, (0, 0, 0), (20, 0, 0), 8)
+        assert np.allclose(np.linalg.norm(velocity, axis=1), 20.0)
+
+    def test_dive_levels_off_at_floor(self):
+        """Test: Dive never descends below its pull-out altitude"""
+        t = np.linspace(0, 120, 1000)
+        position, velocity, _ = kernels.dive(t, (0, 0, 300), 90, 20, 40, 3.0, 25)
+        assert np.min(position[:, 2]) >= 25 - 1e-9
+        assert np.allclose(velocity[-1, 2], 0.0)
+
+    def test_waypoint_polyline_hits_waypoints(self):
+        """Test: Polyline passes through every waypoint at its knot time"""
+        waypoints = np.array([[0, 0, 50], [300, 0, 50], [300, 400, 100]], dtype=float)
+        knot_times = kernels.waypoint_times(waypoints, speed_m_s=10.0)
+        position, velocity, _ = kernels.waypoint_polyline(knot_times, waypoints, knot_times)
+        assert np.allclose(position, waypoints)
+        speeds = np.linalg.norm(velocity[:-1], axis=1)
+        assert np.allclose(speeds, 10.0)
+
+    def test_broadcast_per_sample_parameters(self):
+        """Test: Per-sample parameters equal separate per-track evaluations"""
+        t = np.array([0.0, 1.0, 2.0, 0.0, 1.0])
+        starts = np.array([[0, 0, 0]] * 3 + [[100, 100, 10]] * 2, dtype=float)
+        velocities = np.array([[1, 0, 0]] * 3 + [[0, 2, 0]] * 2, dtype=float)
+        position, _, _ = kernels.constant_velocity(t, starts, velocities)
+        assert np.allclose(position[2], [2, 0, 0])
+        assert np.allclose(position[4], [100, 102, 10])
@@ -289,6 +289,9 @@ def main():
     thermal_fog_json = "output/thermal_fog.json"
     if not Path(thermal_fog_json).exists():
         print(f"[SKIP] Thermal fog file not found: {thermal_fog_json}")
+    elif not fusion.load_thermal_detection(thermal_fog_json).get('targets'):
+        # Targets are detected from the image; dense fog can hide them entirely
+        print(f"[SKIP] No thermal targets detected in fog: {thermal_fog_json}")
     else:
         thermal_fog_data = fusion.load_thermal_detection(thermal_fog_json)
         fusion_result_fog = fusion.process_thermal_detection(thermal_fog_data)
@@ -22,7 +22,6 @@ from pathlib import Path
 from PIL import Image
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
-from datetime import datetime
 import time
 import argparse
 import sys
@@ -30,6 +29,10 @@ import logging
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
+# Add shared modules (sensor-data-prep/common) to Python path
+sys.path.append(str(Path(__file__).parents[3] / 'common'))
+
+from timebase import now_ns, format_iso
 
 try:
     from sensors.roi_gating import ROIGatingModule, PerformanceBenchmark
@@ -430,8 +433,10 @@ class PolarimetrySimulator:
                 return obj
 
         # Save JSON result
+        timestamp_ns = now_ns()
         result_json = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': format_iso(timestamp_ns),
+            'timestamp_ns': timestamp_ns,
             'sensor_model': 'Sony_IMX250MZR',
             'classification': convert_numpy_types(classification),
             'processing_metadata': {
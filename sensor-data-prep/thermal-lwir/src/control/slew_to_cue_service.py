@@ -0,0 +1,650 @@
+#!/usr/bin/env python3
+"""
+Streaming Slew-to-Cue Service
+
+Purpose: Long-running cue loop: consume live radar plot feeds, keep per-track
+         cue state and emit turret commands continuously, instead of
+         converting two hand-written track dicts.
+JIRA: VRD-30 (Slew-to-Cue Logic Module)
+Epic: VRD-26 (Thermal Infrared & Night-Time Tracking)
+
+Pipeline (one asyncio event loop):
+
+    sources --> input queue --> processor --> output queue --> sink
+                (bounded)       (vectorized    (bounded)       (jsonl /
+                                 per scan)                      binary)
+
+Sources:
+- UdpPlotSource: VRDP datagrams from `radar_live_emitter.py` (or a real
+  plot extractor speaking the same format)
+- FilePlotSource: VRD-32 CSV plot log, optionally tailed while it grows
+- QueuePlotSource: (header, plots) items from an in-process asyncio.Queue
+
+Backpressure: both queues are bounded. File and in-process sources await a
+free slot, so a slow sink stalls them; UDP cannot be slowed down, so the
+receiver drops the oldest scan and counts it.
+
+Every command carries the radar scan time (`cue_timestamp_ns`); the
+end-to-end cue latency (scan time -> command written) and the service
+latency (plot received -> command written) are kept in log-binned
+histograms and reported as percentiles.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-17
+"""
+
+import sys
+import numpy as np
+import asyncio
+import argparse
+import struct
+from pathlib import Path
+
+# Add shared modules (sensor-data-prep/common) and radar simulations to Python path
+sys.path.append(str(Path(__file__).parents[3] / 'common'))
+sys.path.append(str(Path(__file__).parents[3] / 'passive-radar' / 'src' / 'simulations'))
+
+from timebase import now_ns, parse_iso, NS_PER_SECOND
+from coordinates import LocalFrame
+from radar_live_emitter import (
+    PLOT_DTYPE, LatencyHistogram, RadarPlotReceiver, RadarLiveEmitter, batch_to_plots
+)
+from track_io import FALSE_ALARM_NAME
+from slew_to_cue import SlewToCueController
+
+
+COMMAND_DTYPE = np.dtype([
+    ('timestamp_ns', '<i8'),        # Command issue time (UTC ns)
+    ('cue_timestamp_ns', '<i8'),    # Radar scan time the cue is based on (UTC ns)
+    ('radar_id', '<u2'),
+    ('is_new_track', 'u1'),
+    ('reserved', 'u1'),
+    ('target_id', '<i4'),
+    ('pan_deg', '<f4'),
+    ('tilt_deg', '<f4'),
+    ('range_m', '<f4'),
+    ('search_radius_deg', '<f4'),
+    ('num_updates', '<u4'),
+])
+
+# Binary frame header: magic, num_commands, sequence, issue time (ns)
+FRAME_HEADER = struct.Struct('<4sIIq')
+FRAME_MAGIC = b'VRDC'
+
+LINE_FORMAT = ('{"timestamp_ns": %d, "cue_timestamp_ns": %d, "radar_id": %d, '
+               '"target_id": %d, "pan_deg": %.4f, "tilt_deg": %.4f, "range_m": %.2f, '
+               '"search_radius_deg": %.4f, "num_updates": %d, "is_new_track": %s}\n')
+LINE_FIELDS = ['timestamp_ns', 'cue_timestamp_ns', 'radar_id', 'target_id', 'pan_deg',
+               'tilt_deg', 'range_m', 'search_radius_deg', 'num_updates']
+
+
+def decode_command_frame(data, offset=0):
+    """
+    Unpack one binary command frame.
+
+    Returns:
+        header: Dict with num_commands, sequence, timestamp_ns
+        commands: Structured array (COMMAND_DTYPE), zero-copy view of `data`
+        next_offset: Offset of the following frame
+    """
+    magic, num_commands, sequence, timestamp_ns = FRAME_HEADER.unpack_from(data, offset)
+    if magic != FRAME_MAGIC:
+        raise ValueError("Not a turret command frame")
+    start = offset + FRAME_HEADER.size
+    commands = np.frombuffer(data, dtype=COMMAND_DTYPE, count=num_commands, offset=start)
+    header = {'num_commands': num_commands, 'sequence': sequence, 'timestamp_ns': timestamp_ns}
+    return header, commands, start + num_commands * COMMAND_DTYPE.itemsize
+
+
+class TrackStateTable:
+    """
+    Per-track cue state in stacked arrays, keyed by (radar_id, track_id).
+
+    Each radar gets a direct lookup table track_id -> row, so a whole scan is
+    mapped to rows with one fancy-index instead of a dict lookup per plot.
+    """
+
+    def __init__(self, capacity=1024, timeout_s=5.0):
+        """
+        Initialize state table.
+
+        Args:
+            capacity: Initial number of rows (grows by doubling)
+            timeout_s: Tracks not updated for this long are released
+        """
+        self.timeout_ns = int(timeout_s * NS_PER_SECOND)
+
+        self.radar_id = np.full(capacity, -1, dtype=np.int32)
+        self.track_id = np.full(capacity, -1, dtype=np.int64)
+        self.first_ns = np.zeros(capacity, dtype=np.int64)
+        self.last_ns = np.zeros(capacity, dtype=np.int64)
+        self.last_cue_ns = np.zeros(capacity, dtype=np.int64)
+        self.pan_deg = np.zeros(capacity)
+        self.tilt_deg = np.zeros(capacity)
+        self.range_m = np.zeros(capacity)
+        self.num_updates = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+
+        self._row_of = {}
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        return int(self.active.sum())
+
+    def _grow(self):
+        old = len(self.active)
+        for name in ('radar_id', 'track_id', 'first_ns', 'last_ns', 'last_cue_ns',
+                     'pan_deg', 'tilt_deg', 'range_m', 'num_updates', 'active'):
+            array = getattr(self, name)
+            grown = np.zeros(2 * old, dtype=array.dtype)
+            grown[:old] = array
+            if name in ('radar_id', 'track_id'):
+                grown[old:] = -1
+            setattr(self, name, grown)
+        self._free.extend(range(2 * old - 1, old - 1, -1))
+
+    def rows_for(self, radar_id, track_ids):
+        """
+        Rows for a scan's tracks, allocating rows for tracks seen first.
+
+        Args:
+            radar_id: Radar the plots came from
+            track_ids: int array of radar track IDs (>= 0)
+
+        Returns:
+            rows: int64 array of state rows
+            is_new: bool array, True where the track was just allocated
+        """
+        track_ids = np.asarray(track_ids, dtype=np.int64)
+        table = self._row_of.get(radar_id)
+        needed = int(track_ids.max()) + 1 if len(track_ids) else 0
+        if table is None or len(table) < needed:
+            grown = np.full(max(needed, 2 * len(table) if table is not None else 64), -1, dtype=np.int64)
+            if table is not None:
+                grown[:len(table)] = table
+            table = grown
+            self._row_of[radar_id] = table
+
+        is_new = table[track_ids] < 0
+        new_ids = np.unique(track_ids[is_new])
+        if len(new_ids):
+            while len(self._free) < len(new_ids):
+                self._grow()
+            new_rows = np.array([self._free.pop() for _ in range(len(new_ids))], dtype=np.int64)
+            table[new_ids] = new_rows
+            self.radar_id[new_rows] = radar_id
+            self.track_id[new_rows] = new_ids
+            self.num_updates[new_rows] = 0
+            self.active[new_rows] = True
+        rows = table[track_ids]
+        return rows, is_new
+
+    def update(self, rows, is_new, time_ns, pan_deg, tilt_deg, range_m):
+        """Record a scan's cue geometry for `rows`."""
+        self.first_ns[rows[is_new]] = time_ns
+        self.last_ns[rows] = time_ns
+        self.pan_deg[rows] = pan_deg
+        self.tilt_deg[rows] = tilt_deg
+        self.range_m[rows] = range_m
+        self.num_updates[rows] += 1
+
+    def expire(self, time_ns):
+        """Release tracks not updated within the timeout; returns the count."""
+        stale = np.flatnonzero(self.active & (time_ns - self.last_ns > self.timeout_ns))
+        for row in stale.tolist():
+            self._row_of[int(self.radar_id[row])][self.track_id[row]] = -1
+        if len(stale):
+            self.active[stale] = False
+            self.radar_id[stale] = -1
+            self.track_id[stale] = -1
+            self._free.extend(stale.tolist())
+        return len(stale)
+
+
+class LineDelimitedSink:
+    """Writes one JSON object per command per line."""
+
+    def __init__(self, stream):
+        """
+        Args:
+            stream: Binary writable stream (file opened 'wb', sys.stdout.buffer)
+        """
+        self.stream = stream
+        self.num_written = 0
+
+    def write(self, commands):
+        table = np.empty((len(commands), len(LINE_FIELDS) + 1), dtype=object)
+        for col, field in enumerate(LINE_FIELDS):
+            table[:, col] = commands[field].tolist()
+        table[:, -1] = np.where(commands['is_new_track'] > 0, 'true', 'false')
+        self.stream.write(((LINE_FORMAT * len(commands)) % tuple(table.ravel().tolist())).encode())
+        self.stream.flush()
+        self.num_written += len(commands)
+
+
+class BinaryCommandSink:
+    """Writes one FRAME_HEADER + COMMAND_DTYPE frame per scan."""
+
+    def __init__(self, stream):
+        """
+        Args:
+            stream: Binary writable stream
+        """
+        self.stream = stream
+        self.num_written = 0
+        self.sequence = 0
+
+    def write(self, commands):
+        header = FRAME_HEADER.pack(FRAME_MAGIC, len(commands), self.sequence,
+                                   int(commands['timestamp_ns'][0]))
+        self.stream.write(header + commands.tobytes())
+        self.stream.flush()
+        self.sequence += 1
+        self.num_written += len(commands)
+
+
+class QueuePlotSource:
+    """In-process feed: (header, plots) items from an asyncio.Queue until None."""
+
+    def __init__(self, queue):
+        self.queue = queue
+
+    async def run(self, service):
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                return
+            await service.submit(*item)
+
+
+class UdpPlotSource:
+    """VRDP datagrams on a local UDP port (see `radar_live_emitter.py`)."""
+
+    def __init__(self, host='127.0.0.1', port=50032, duration_s=None):
+        """
+        Args:
+            host: Local address to bind
+            port: UDP port
+            duration_s: Stop listening after this long (None = until `stop`)
+        """
+        self.host = host
+        self.port = port
+        self.duration_s = duration_s
+        self.receiver = None
+        self.ready = asyncio.Event()
+        self._stop = asyncio.Event()
+
+    def stop(self):
+        """Stop listening; the service then drains and returns."""
+        self._stop.set()
+
+    async def run(self, service):
+        loop = asyncio.get_running_loop()
+        transport, self.receiver = await loop.create_datagram_endpoint(
+            lambda: RadarPlotReceiver(service.input_queue), local_addr=(self.host, self.port)
+        )
+        self.ready.set()
+        try:
+            await asyncio.wait_for(self._stop.wait(), self.duration_s)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            transport.close()
+
+
+class FilePlotSource:
+    """
+    VRD-32 CSV plot log (see `track_io.write_tracks_csv`), optionally tailed.
+
+    Rows are grouped into scans by Timestamp. Track names are mapped to
+    integer IDs in order of first appearance; FALSE_ALARM rows get -1.
+    Scans from a finished log are marked not live, so their (historical)
+    timestamps stay out of the cue latency statistics.
+    """
+
+    def __init__(self, path, radar_id=0, follow=False, poll_s=0.2, idle_timeout_s=None):
+        """
+        Args:
+            path: CSV file to read
+            radar_id: Radar ID to stamp on the scans
+            follow: Keep reading as the file grows (like `tail -f`)
+            poll_s: Poll interval while waiting for new rows
+            idle_timeout_s: Stop following after this long without new rows
+        """
+        self.path = Path(path)
+        self.radar_id = radar_id
+        self.follow = follow
+        self.poll_s = poll_s
+        self.idle_timeout_s = idle_timeout_s
+
+        self.track_ids = {}
+        self.num_scans = 0
+
+    def _track_id(self, name):
+        if name == FALSE_ALARM_NAME:
+            return -1
+        return self.track_ids.setdefault(name, len(self.track_ids))
+
+    async def _submit(self, service, timestamp, rows):
+        scan_time_ns = int(parse_iso(timestamp))
+        header = {
+            'radar_id': self.radar_id,
+            'num_plots': len(rows),
+            'sequence': self.num_scans,
+            'scan_time_ns': scan_time_ns,
+            'send_time_ns': scan_time_ns,
+            'live': self.follow,
+        }
+        await service.submit(header, np.array(rows, dtype=PLOT_DTYPE))
+        self.num_scans += 1
+
+    async def run(self, service):
+        pending_time, pending_rows = None, []
+        idle_s = 0.0
+
+        with open(self.path, 'r', newline='') as f:
+            f.readline()  # Column header
+            while True:
+                position = f.tell()
+                line = f.readline()
+
+                if not line.endswith('\n'):
+                    # End of data (or a row still being written): flush the
+                    # scan in hand, then wait for more if following
+                    f.seek(position)
+                    if pending_rows:
+                        await self._submit(service, pending_time, pending_rows)
+                        pending_time, pending_rows = None, []
+                    if not self.follow:
+                        return
+                    if self.idle_timeout_s is not None and idle_s >= self.idle_timeout_s:
+                        return
+                    await asyncio.sleep(self.poll_s)
+                    idle_s += self.poll_s
+                    continue
+
+                idle_s = 0.0
+                fields = line.rstrip('\r\n').split(',')
+                if fields[0] != pending_time and pending_rows:
+                    await self._submit(service, pending_time, pending_rows)
+                    pending_rows = []
+                pending_time = fields[0]
+                pending_rows.append((self._track_id(fields[1]), float(fields[2]),
+                                     float(fields[3]), float(fields[4]), float(fields[5])))
+
+
+class SlewToCueService:
+    """
+    Asyncio slew-to-cue loop: radar plot scans in, turret commands out.
+    """
+
+    def __init__(self, controller, radar_frames=None, uncertainty_m=10.0,
+                 input_queue_size=256, output_queue_size=256, track_timeout_s=5.0,
+                 min_cue_interval_s=0.0):
+        """
+        Initialize service.
+
+        Args:
+            controller: SlewToCueController for the turret
+            radar_frames: Dict radar_id -> coordinates.LocalFrame of that radar
+                          (radars not listed are assumed co-located with the turret)
+            uncertainty_m: Radar position uncertainty for the search radius (m)
+            input_queue_size: Max queued plot scans
+            output_queue_size: Max queued command batches
+            track_timeout_s: Release track state after this long without plots
+            min_cue_interval_s: Minimum time between cues for the same track
+        """
+        self.controller = controller
+        self.radar_frames = dict(radar_frames or {})
+        self.uncertainty_m = uncertainty_m
+        self.min_cue_interval_ns = int(min_cue_interval_s * NS_PER_SECOND)
+
+        self.input_queue = asyncio.Queue(maxsize=input_queue_size)
+        self.output_queue = asyncio.Queue(maxsize=output_queue_size)
+        self.state = TrackStateTable(timeout_s=track_timeout_s)
+
+        self.cue_latency = LatencyHistogram()
+        self.service_latency = LatencyHistogram()
+        self.num_scans = 0
+        self.num_plots = 0
+        self.num_false_alarms = 0
+        self.num_commands = 0
+
+    async def submit(self, header, plots):
+        """Queue one scan (waits while the input queue is full)."""
+        header.setdefault('receive_time_ns', now_ns())
+        await self.input_queue.put((header, plots))
+
+    def process_scan(self, header, plots):
+        """
+        Convert one scan of plots into turret commands (vectorized).
+
+        Args:
+            header: Scan header (radar_id, scan_time_ns, ...)
+            plots: PLOT_DTYPE array
+
+        Returns:
+            commands: COMMAND_DTYPE array (false alarms and rate-limited
+                      tracks removed)
+        """
+        radar_id = int(header['radar_id'])
+        scan_time_ns = int(header['scan_time_ns'])
+        self.num_scans += 1
+        self.num_plots += len(plots)
+
+        tracked = plots['track_id'] >= 0
+        self.num_false_alarms += int(len(plots) - tracked.sum())
+        plots = plots[tracked]
+
+        self.state.expire(scan_time_ns)
+        if len(plots) == 0:
+            return np.empty(0, dtype=COMMAND_DTYPE)
+
+        frame = self.radar_frames.get(radar_id, self.controller.frame)
+        cue = self.controller.radar_plots_to_turret_commands(
+            frame,
+            plots['azimuth_deg'].astype(np.float64),
+            plots['elevation_deg'].astype(np.float64),
+            plots['range_m'].astype(np.float64),
+            uncertainty_m=self.uncertainty_m,
+        )
+
+        rows, is_new = self.state.rows_for(radar_id, plots['track_id'])
+        self.state.update(rows, is_new, scan_time_ns, cue['pan_deg'], cue['tilt_deg'], cue['range_m'])
+
+        emit = is_new | (scan_time_ns - self.state.last_cue_ns[rows] >= self.min_cue_interval_ns)
+        self.state.last_cue_ns[rows[emit]] = scan_time_ns
+
+        commands = np.zeros(int(emit.sum()), dtype=COMMAND_DTYPE)
+        commands['timestamp_ns'] = now_ns()
+        commands['cue_timestamp_ns'] = scan_time_ns
+        commands['radar_id'] = radar_id
+        commands['is_new_track'] = is_new[emit]
+        commands['target_id'] = plots['track_id'][emit]
+        commands['pan_deg'] = cue['pan_deg'][emit]
+        commands['tilt_deg'] = cue['tilt_deg'][emit]
+        commands['range_m'] = cue['range_m'][emit]
+        commands['search_radius_deg'] = cue['search_radius_deg'][emit]
+        commands['num_updates'] = self.state.num_updates[rows[emit]]
+        return commands
+
+    async def _process(self):
+        while True:
+            item = await self.input_queue.get()
+            if item is None:
+                await self.output_queue.put(None)
+                return
+            header, plots = item
+            commands = self.process_scan(header, plots)
+            if len(commands):
+                # Waits while the sink is behind, which in turn fills the input queue
+                await self.output_queue.put((header, commands))
+
+    async def _write(self, sink):
+        while True:
+            item = await self.output_queue.get()
+            if item is None:
+                return
+            header, commands = item
+            sink.write(commands)
+            written_ns = now_ns()
+            if header.get('live', True):
+                self.cue_latency.record((written_ns - commands['cue_timestamp_ns']) / NS_PER_SECOND)
+            self.service_latency.record((written_ns - header['receive_time_ns']) / NS_PER_SECOND)
+            self.num_commands += len(commands)
+
+    async def run(self, sources, sink):
+        """
+        Serve until every source finishes, then drain both queues.
+
+        Args:
+            sources: Objects with `async run(service)` (plot producers)
+            sink: Object with `write(commands)`
+
+        Returns:
+            report: Dict of counters and latency summaries (see `report`)
+        """
+        processor = asyncio.create_task(self._process())
+        writer = asyncio.create_task(self._write(sink))
+        try:
+            await asyncio.gather(*(source.run(self) for source in sources))
+        finally:
+            await self.input_queue.put(None)
+            await asyncio.gather(processor, writer)
+        return self.report()
+
+    def report(self):
+        """Counters plus cue/service latency summaries (ms)."""
+        return {
+            'scans': self.num_scans,
+            'plots': self.num_plots,
+            'false_alarms_skipped': self.num_false_alarms,
+            'commands': self.num_commands,
+            'active_tracks': len(self.state),
+            'cue_latency': self.cue_latency.summary(),
+            'service_latency': self.service_latency.summary(),
+        }
+
+
+def main():
+    """
+    Main execution: run the service against simulated or recorded radar feeds.
+
+    Usage:
+        python src/control/slew_to_cue_service.py --source udp --radars 2 --duration 10
+        python src/control/slew_to_cue_service.py --source file --input output/radar_tracks.csv
+        python src/control/slew_to_cue_service.py --source queue --format binary
+    """
+    parser = argparse.ArgumentParser(description='Streaming slew-to-cue service (VRD-30)')
+    parser.add_argument('--source', choices=['udp', 'file', 'queue'], default='udp',
+                        help='Plot feed (udp: local emitter replay, file: CSV log, queue: in-process)')
+    parser.add_argument('--input', type=str, default='output/radar_tracks.csv',
+                        help='CSV plot log for --source file')
+    parser.add_argument('--follow', action='store_true', help='Tail the CSV as it grows')
+    parser.add_argument('--port', type=int, default=50032, help='UDP port')
+    parser.add_argument('--radars', type=int, default=2, help='Simulated radars (udp/queue)')
+    parser.add_argument('--targets', type=int, default=200, help='Targets per simulated radar')
+    parser.add_argument('--duration', type=float, default=10.0, help='Simulated feed duration (s)')
+    parser.add_argument('--speed', type=float, default=5.0, help='Replay speed factor (udp/queue)')
+    parser.add_argument('--format', choices=['jsonl', 'binary'], default='jsonl',
+                        help='Command output format')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Command output path (default: output/turret_commands.<fmt>)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  STREAMING SLEW-TO-CUE SERVICE")
+    print("  VRD-30: Slew-to-Cue Logic Module")
+    print("=" * 70)
+    print()
+
+    # Turret site; simulated radars are spread around it
+    controller = SlewToCueController(37.7790, -122.4120, 50.0, fov_deg=50.0)
+    radar_frames = {
+        radar_id: LocalFrame(*controller.mount_frame.enu_to_geodetic(
+            -600.0 + 400.0 * radar_id, -450.0, -40.0))
+        for radar_id in range(args.radars)
+    }
+    service = SlewToCueService(controller, radar_frames=radar_frames)
+
+    output_path = Path(args.output or f"output/turret_commands.{args.format}")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def simulated_plots():
+        from simulate_radar_tracks import RadarTrackSimulator
+        from simulate_air_picture import AirPictureGenerator
+
+        pictures = []
+        for radar_id in range(args.radars):
+            radar = RadarTrackSimulator()
+            picture = AirPictureGenerator(radar, seed=radar_id).generate(
+                num_targets=args.targets, duration_sec=args.duration,
+                mean_lifetime_sec=args.duration
+            )
+            pictures.append(picture.plots.sort_by_time())
+        return pictures
+
+    async def run(sink):
+        if args.source == 'file':
+            source = FilePlotSource(args.input, follow=args.follow,
+                                    idle_timeout_s=5.0 if args.follow else None)
+            return await service.run([source], sink), None
+
+        pictures = simulated_plots()
+        if args.source == 'udp':
+            source = UdpPlotSource(port=args.port)
+            emitter = RadarLiveEmitter(port=args.port)
+            for radar_id, plots in enumerate(pictures):
+                emitter.add_radar(radar_id, plots)
+
+            serving = asyncio.create_task(service.run([source], sink))
+            await source.ready.wait()
+            await emitter.run(speed=args.speed)
+            await asyncio.sleep(0.2)
+            source.stop()
+            return await serving, source.receiver
+
+        # In-process producer paced like the radar
+        feed = asyncio.Queue(maxsize=64)
+
+        async def produce():
+            loop = asyncio.get_running_loop()
+            t0 = loop.time()
+            scans = sorted(((t, radar_id, scan) for radar_id, plots in enumerate(pictures)
+                            for t, scan in plots.iter_scans()), key=lambda item: item[0])
+            for sequence, (scan_time_s, radar_id, scan) in enumerate(scans):
+                delay = t0 + scan_time_s / args.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                stamp = now_ns()
+                header = {'radar_id': radar_id, 'num_plots': len(scan), 'sequence': sequence,
+                          'scan_time_ns': stamp, 'send_time_ns': stamp}
+                await feed.put((header, batch_to_plots(scan)))
+            await feed.put(None)
+
+        producer = asyncio.create_task(produce())
+        report = await service.run([QueuePlotSource(feed)], sink)
+        await producer
+        return report, None
+
+    with open(output_path, 'wb') as f:
+        sink = LineDelimitedSink(f) if args.format == 'jsonl' else BinaryCommandSink(f)
+        report, receiver = asyncio.run(run(sink))
+
+    print(f"\n[INFO] Service summary ({args.source} source):")
+    print(f"       - Scans: {report['scans']}, plots: {report['plots']} "
+          f"({report['false_alarms_skipped']} false alarms skipped)")
+    print(f"       - Commands: {report['commands']}, active tracks: {report['active_tracks']}")
+    if receiver is not None:
+        print(f"       - Datagrams received: {receiver.num_received} (dropped {receiver.num_dropped})")
+    for name in ('cue_latency', 'service_latency'):
+        stats = report[name]
+        if stats['count']:
+            print(f"       - {name.replace('_', ' ').capitalize()}: p50={stats['p50_ms']:.3f} ms, "
+                  f"p95={stats['p95_ms']:.3f} ms, p99={stats['p99_ms']:.3f} ms, "
+                  f"max={stats['max_ms']:.3f} ms")
+    print(f"[SUCCESS] Commands written: {output_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Multi-Target Turret Tasking Scheduler
+
+Purpose: Decide which radar cue the single thermal/visual turret looks at
+         next when many tracks compete for it.
+JIRA: VRD-30 (Slew-to-Cue Logic Module)
+Epic: VRD-26 (Thermal Infrared & Night-Time Tracking)
+
+A look = slew (rate/acceleration-limited, both axes in parallel, plus
+settle) + dwell (spiral search / confirmation). Cue priority combines:
+
+- threat score (0-1, from classification / behaviour upstream)
+- time since the track was last looked at, relative to the revisit goal
+- range (closer is more urgent)
+- cue uncertainty (search radius; larger means the cue is going stale)
+- slew time from the turret's current pan/tilt (penalty)
+
+The slew term depends on where the turret points after every look, so a
+priority heap keyed once would be stale after the first decision. Instead,
+tracks that were just looked at wait out `min_revisit_s` in a heap keyed by
+due time (popped lazily), and the eligible set is scored with one
+vectorized pass per decision.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-17
+"""
+
+import sys
+import heapq
+import numpy as np
+import argparse
+import time
+from pathlib import Path
+
+# Add shared modules (sensor-data-prep/common) and radar simulations to Python path
+sys.path.append(str(Path(__file__).parents[3] / 'common'))
+sys.path.append(str(Path(__file__).parents[3] / 'passive-radar' / 'src' / 'simulations'))
+
+from slew_to_cue import SlewToCueController
+
+
+class TurretSlewModel:
+    """
+    Rate- and acceleration-limited pan/tilt dynamics (trapezoidal profile).
+    """
+
+    def __init__(self, max_rate_pan_deg_s=60.0, max_rate_tilt_deg_s=30.0,
+                 accel_pan_deg_s2=120.0, accel_tilt_deg_s2=90.0, settle_s=0.05):
+        """
+        Initialize slew model.
+
+        Args:
+            max_rate_pan_deg_s: Pan axis rate limit (deg/s)
+            max_rate_tilt_deg_s: Tilt axis rate limit (deg/s)
+            accel_pan_deg_s2: Pan axis acceleration limit (deg/s^2)
+            accel_tilt_deg_s2: Tilt axis acceleration limit (deg/s^2)
+            settle_s: Settling time after the move (s)
+        """
+        self.max_rate = np.array([max_rate_pan_deg_s, max_rate_tilt_deg_s])
+        self.accel = np.array([accel_pan_deg_s2, accel_tilt_deg_s2])
+        self.settle_s = settle_s
+
+        # Moves shorter than v^2/a never reach the rate limit
+        self._ramp_deg = self.max_rate**2 / self.accel
+
+    @staticmethod
+    def _axis_time(distance_deg, max_rate, accel, ramp_deg):
+        triangular = 2.0 * np.sqrt(distance_deg / accel)
+        trapezoidal = distance_deg / max_rate + max_rate / accel
+        return np.where(distance_deg < ramp_deg, triangular, trapezoidal)
+
+    def slew_time(self, pan_from_deg, tilt_from_deg, pan_to_deg, tilt_to_deg):
+        """
+        Time to move between pointing angles (element-wise).
+
+        Pan takes the shorter way round; both axes move simultaneously, so
+        the slower axis sets the time.
+
+        Returns:
+            slew_s: Move + settle time (s)
+        """
+        pan_distance = np.abs(np.mod(np.asarray(pan_to_deg) - pan_from_deg + 180.0, 360.0) - 180.0)
+        tilt_distance = np.abs(np.asarray(tilt_to_deg) - tilt_from_deg)
+        pan_s = self._axis_time(pan_distance, self.max_rate[0], self.accel[0], self._ramp_deg[0])
+        tilt_s = self._axis_time(tilt_distance, self.max_rate[1], self.accel[1], self._ramp_deg[1])
+        return np.maximum(pan_s, tilt_s) + self.settle_s
+
+
+class TurretScheduler:
+    """
+    Chooses the turret's next look among competing cues.
+    """
+
+    DEFAULT_WEIGHTS = {
+        'threat': 3.0,
+        'staleness': 2.0,
+        'range': 1.0,
+        'uncertainty': 1.0,
+        'slew': 1.0,  # per second of slew
+    }
+
+    # Staleness is capped so long-lost tracks do not swamp the other terms;
+    # tracks never looked at rank above the cap so each is acquired once
+    MAX_STALENESS = 3.0
+    NEW_TRACK_STALENESS = 4.0
+
+    def __init__(self, slew_model=None, dwell_s=0.4, revisit_interval_s=4.0,
+                 min_revisit_s=1.0, cue_timeout_s=3.0, max_range_m=5000.0,
+                 max_search_radius_deg=3.0, weights=None, capacity=256):
+        """
+        Initialize scheduler.
+
+        Args:
+            slew_model: TurretSlewModel (default limits if None)
+            dwell_s: Time on target per look (search + confirm)
+            revisit_interval_s: Revisit goal per track (staleness = 1 at the goal)
+            min_revisit_s: A track cannot be looked at again sooner than this
+            cue_timeout_s: Cues older than this are not schedulable
+            max_range_m: Range normalization (radar coverage)
+            max_search_radius_deg: Search radius normalization
+            weights: Priority weights (see DEFAULT_WEIGHTS)
+            capacity: Initial number of track rows (grows by doubling)
+        """
+        self.slew_model = slew_model or TurretSlewModel()
+        self.dwell_s = dwell_s
+        self.revisit_interval_s = revisit_interval_s
+        self.min_revisit_s = min_revisit_s
+        self.cue_timeout_s = cue_timeout_s
+        self.max_range_m = max_range_m
+        self.max_search_radius_deg = max_search_radius_deg
+        self.weights = dict(self.DEFAULT_WEIGHTS, **(weights or {}))
+
+        # Turret pose and clock
+        self.pan_deg = 0.0
+        self.tilt_deg = 0.0
+        self.busy_until_s = 0.0
+
+        # Per-track cue state
+        self.target_id = np.full(capacity, -1, dtype=np.int64)
+        self.cue_pan = np.zeros(capacity)
+        self.cue_tilt = np.zeros(capacity)
+        self.range_m = np.zeros(capacity)
+        self.search_radius_deg = np.zeros(capacity)
+        self.threat = np.zeros(capacity)
+        self.cue_time_s = np.full(capacity, -np.inf)
+        self.last_look_s = np.full(capacity, -np.inf)
+        self.num_looks = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.eligible = np.zeros(capacity, dtype=bool)  # active and not cooling down
+        self._version = np.zeros(capacity, dtype=np.int64)
+
+        # Time-independent part of the priority, refreshed with each cue
+        self.base_priority = np.zeros(capacity)
+        self._new_track_bonus = self.weights['staleness'] * (self.NEW_TRACK_STALENESS - self.MAX_STALENESS)
+
+        self._row_of = np.full(64, -1, dtype=np.int64)
+        self._free = list(range(capacity - 1, -1, -1))
+        self._cooldown = []  # heap of (due_s, row, version)
+
+        # Statistics
+        self.revisit_intervals = []
+        self.looks = []
+        self.slew_time_s = 0.0
+        self.dwell_time_s = 0.0
+        self.decision_time_s = 0.0
+        self.num_decisions = 0
+
+    # ------------------------------------------------------------------
+    # Cue bookkeeping
+    # ------------------------------------------------------------------
+    def _grow(self):
+        old = len(self.active)
+        for name in ('target_id', 'cue_pan', 'cue_tilt', 'range_m', 'search_radius_deg',
+                     'threat', 'cue_time_s', 'last_look_s', 'num_looks', 'active',
+                     'eligible', '_version', 'base_priority'):
+            array = getattr(self, name)
+            grown = np.empty(2 * old, dtype=array.dtype)
+            grown[:old] = array
+            grown[old:] = {'target_id': -1, 'cue_time_s': -np.inf,
+                           'last_look_s': -np.inf}.get(name, 0)
+            setattr(self, name, grown)
+        self._free.extend(range(2 * old - 1, old - 1, -1))
+
+    def _rows_for(self, target_ids):
+        needed = int(target_ids.max()) + 1 if len(target_ids) else 0
+        if needed > len(self._row_of):
+            grown = np.full(max(needed, 2 * len(self._row_of)), -1, dtype=np.int64)
+            grown[:len(self._row_of)] = self._row_of
+            self._row_of = grown
+
+        new_ids = np.unique(target_ids[self._row_of[target_ids] < 0])
+        if len(new_ids):
+            while len(self._free) < len(new_ids):
+                self._grow()
+            new_rows = np.array([self._free.pop() for _ in range(len(new_ids))], dtype=np.int64)
+            self._row_of[new_ids] = new_rows
+            self.target_id[new_rows] = new_ids
+            self.last_look_s[new_rows] = -np.inf
+            self.num_looks[new_rows] = 0
+            self.active[new_rows] = True
+            self.eligible[new_rows] = True
+        return self._row_of[target_ids]
+
+    def update_cues(self, time_s, target_ids, pan_deg, tilt_deg, range_m,
+                    search_radius_deg, threat_score=None):
+        """
+        Insert or refresh cues (one radar scan's turret commands).
+
+        Args:
+            time_s: Cue time (s, same clock as `plan`)
+            target_ids: int array of track IDs (>= 0)
+            pan_deg, tilt_deg, range_m, search_radius_deg: Command columns
+            threat_score: Threat in [0, 1] per cue (default 0.5)
+        """
+        target_ids = np.asarray(target_ids, dtype=np.int64)
+        rows = self._rows_for(target_ids)
+        self.cue_pan[rows] = pan_deg
+        self.cue_tilt[rows] = tilt_deg
+        self.range_m[rows] = range_m
+        self.search_radius_deg[rows] = search_radius_deg
+        self.threat[rows] = 0.5 if threat_score is None else threat_score
+        self.cue_time_s[rows] = time_s
+
+        w = self.weights
+        self.base_priority[rows] = (
+            w['threat'] * self.threat[rows]
+            + w['range'] * (1.0 - np.minimum(self.range_m[rows] / self.max_range_m, 1.0))
+            + w['uncertainty'] * (self.search_radius_deg[rows] / self.max_search_radius_deg)
+            + np.where(self.num_looks[rows] == 0, self._new_track_bonus, 0.0)
+        )
+
+    def expire(self, time_s):
+        """Release tracks whose cue is older than the timeout."""
+        stale = np.flatnonzero(self.active & (time_s - self.cue_time_s > self.cue_timeout_s))
+        if len(stale):
+            self._row_of[self.target_id[stale]] = -1
+            self.active[stale] = False
+            self.eligible[stale] = False
+            self.target_id[stale] = -1
+            self._version[stale] += 1  # Invalidates pending cooldown entries
+            self._free.extend(stale.tolist())
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+    def priorities(self, time_s):
+        """
+        Priority of every row at `time_s` (-inf where not schedulable).
+
+        Cues are assumed fresh (`plan` expires stale ones first).
+
+        Returns:
+            priority: float array (capacity,)
+            slew_s: Slew time from the current pose per row
+        """
+        # Move tracks whose cooldown has ended back into the eligible set
+        while self._cooldown and self._cooldown[0][0] <= time_s:
+            _, row, version = heapq.heappop(self._cooldown)
+            if version == self._version[row]:
+                self.eligible[row] = True
+
+        w = self.weights
+        staleness = np.minimum((time_s - self.last_look_s) / self.revisit_interval_s,
+                               self.MAX_STALENESS)
+        slew_s = self.slew_model.slew_time(self.pan_deg, self.tilt_deg, self.cue_pan, self.cue_tilt)
+
+        priority = self.base_priority + w['staleness'] * staleness - w['slew'] * slew_s
+        return np.where(self.eligible, priority, -np.inf), slew_s
+
+    def next_look(self, time_s):
+        """
+        Commit the turret to the best cue at `time_s`.
+
+        Returns:
+            look: Dict (target_id, start_s, on_target_s, end_s, slew_s, pan_deg,
+                  tilt_deg, priority) or None when nothing is schedulable
+        """
+        t0 = time.perf_counter()
+        time_s = max(time_s, self.busy_until_s)
+        priority, slew_s = self.priorities(time_s)
+        row = int(np.argmax(priority))
+        self.decision_time_s += time.perf_counter() - t0
+        self.num_decisions += 1
+        if not np.isfinite(priority[row]):
+            return None
+
+        slew = float(slew_s[row])
+        on_target_s = time_s + slew
+        end_s = on_target_s + self.dwell_s
+
+        if self.num_looks[row]:
+            self.revisit_intervals.append(on_target_s - self.last_look_s[row])
+        else:
+            self.base_priority[row] -= self._new_track_bonus
+        self.last_look_s[row] = on_target_s
+        self.num_looks[row] += 1
+        self.eligible[row] = False
+        heapq.heappush(self._cooldown, (on_target_s + self.min_revisit_s, row, int(self._version[row])))
+
+        self.pan_deg = float(self.cue_pan[row])
+        self.tilt_deg = float(self.cue_tilt[row])
+        self.busy_until_s = end_s
+        self.slew_time_s += slew
+        self.dwell_time_s += self.dwell_s
+
+        look = {
+            'target_id': int(self.target_id[row]),
+            'start_s': time_s,
+            'on_target_s': on_target_s,
+            'end_s': end_s,
+            'slew_s': slew,
+            'pan_deg': self.pan_deg,
+            'tilt_deg': self.tilt_deg,
+            'priority': float(priority[row]),
+        }
+        self.looks.append(look)
+        return look
+
+    def plan(self, time_s, horizon_s):
+        """
+        Schedule looks until the turret is committed past `time_s + horizon_s`
+        (typically one radar update interval).
+
+        Returns:
+            looks: List of look dicts (see `next_look`)
+        """
+        self.expire(time_s)
+        looks = []
+        end_s = time_s + horizon_s
+        while self.busy_until_s < end_s:
+            look = self.next_look(max(time_s, self.busy_until_s))
+            if look is None:
+                # Idle until the next cooldown ends (or the horizon)
+                if not self._cooldown or self._cooldown[0][0] >= end_s:
+                    break
+                self.busy_until_s = self._cooldown[0][0]
+                continue
+            looks.append(look)
+        return looks
+
+    def report(self, time_s=None):
+        """
+        Achieved revisit performance.
+
+        Args:
+            time_s: Evaluation time for tracks never (re)visited (default: last look)
+
+        Returns:
+            report: Dict of counters, revisit interval percentiles, and turret
+                    time split between slewing and dwelling
+        """
+        intervals = np.asarray(self.revisit_intervals)
+        busy_s = self.slew_time_s + self.dwell_time_s
+        report = {
+            'looks': len(self.looks),
+            'tracks_looked_at': int(np.count_nonzero(self.num_looks[self.active])),
+            'active_tracks': int(self.active.sum()),
+            'slew_fraction': self.slew_time_s / busy_s if busy_s > 0 else 0.0,
+            'mean_decision_us': 1e6 * self.decision_time_s / max(self.num_decisions, 1),
+        }
+        if len(intervals):
+            report.update({
+                'revisit_mean_s': float(intervals.mean()),
+                'revisit_p50_s': float(np.percentile(intervals, 50)),
+                'revisit_p95_s': float(np.percentile(intervals, 95)),
+                'revisit_goal_met': float(np.mean(intervals <= self.revisit_interval_s)),
+            })
+        if len(self.looks):
+            report['looks_per_s'] = len(self.looks) / max(self.looks[-1]['end_s'] - self.looks[0]['start_s'], 1e-9)
+        return report
+
+
+def main():
+    """
+    Main execution: schedule one turret over a simulated multi-target air picture.
+
+    Usage:
+        python src/control/turret_scheduler.py --targets 300 --duration 60
+    """
+    from simulate_radar_tracks import RadarTrackSimulator
+    from simulate_air_picture import AirPictureGenerator
+
+    parser = argparse.ArgumentParser(description='Multi-target turret tasking scheduler (VRD-30)')
+    parser.add_argument('--targets', type=int, default=300, help='Targets in the air picture')
+    parser.add_argument('--duration', type=float, default=60.0, help='Scenario duration (s)')
+    parser.add_argument('--dwell', type=float, default=0.4, help='Dwell per look (s)')
+    parser.add_argument('--revisit', type=float, default=4.0, help='Revisit goal per track (s)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  MULTI-TARGET TURRET TASKING SCHEDULER")
+    print("  VRD-30: Slew-to-Cue Logic Module")
+    print("=" * 70)
+    print()
+
+    radar = RadarTrackSimulator()
+    picture = AirPictureGenerator(radar, seed=args.seed).generate(
+        num_targets=args.targets, duration_sec=args.duration, mean_lifetime_sec=args.duration
+    )
+    plots = picture.plots.sort_by_time()
+
+    # Turret 300 m North-East of the radar
+    controller = SlewToCueController(*radar.frame.enu_to_geodetic(300.0, 300.0, 20.0))
+    scheduler = TurretScheduler(dwell_s=args.dwell, revisit_interval_s=args.revisit,
+                                max_range_m=radar.max_range)
+
+    # Per-target threat score (e.g. from classification); fixed per track here
+    threat = np.random.default_rng(args.seed).uniform(0.0, 1.0, int(plots.track_id.max()) + 1)
+
+    update_interval_s = 1.0 / radar.update_rate_hz
+    plan_times = []
+    for scan_time_s, scan in plots.iter_scans():
+        scan = scan.select(scan.track_id >= 0)
+        if len(scan) == 0:
+            continue
+        cmds = controller.radar_plots_to_turret_commands(
+            radar.frame, scan.azimuth_deg, scan.elevation_deg, scan.range_m
+        )
+        t0 = time.perf_counter()
+        scheduler.update_cues(scan_time_s, scan.track_id, cmds['pan_deg'], cmds['tilt_deg'],
+                              cmds['range_m'], cmds['search_radius_deg'], threat[scan.track_id])
+        scheduler.plan(scan_time_s, update_interval_s)
+        plan_times.append(time.perf_counter() - t0)
+
+    report = scheduler.report()
+    print(f"\n[INFO] Scheduling results ({len(plan_times)} scans):")
+    print(f"       - Active tracks at end: {report['active_tracks']}, "
+          f"looked at: {report['tracks_looked_at']}")
+    print(f"       - Looks: {report['looks']} ({report.get('looks_per_s', 0.0):.2f}/s), "
+          f"slewing {100 * report['slew_fraction']:.1f}% of busy time")
+    if 'revisit_mean_s' in report:
+        print(f"       - Revisit interval: mean={report['revisit_mean_s']:.2f} s, "
+              f"p50={report['revisit_p50_s']:.2f} s, p95={report['revisit_p95_s']:.2f} s, "
+              f"goal (<= {args.revisit:.1f} s) met {100 * report['revisit_goal_met']:.1f}%")
+    print(f"       - Decision time: {report['mean_decision_us']:.1f} us/look, "
+          f"{1e6 * np.mean(plan_times):.1f} us/scan (cue update + plan)")
+    print(f"[SUCCESS] Scheduling complete")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+LWIR Atmospheric Transmission
+
+Purpose: Range-dependent Beer-Lambert transmission for thermal imagery, per
+         pixel (range / depth maps) or per target, from cached tables.
+
+JIRA: VRD-29 (Thermal Simulation & Fog Injection)
+Epic: VRD-26 (Thermal Infrared & Night-Time Tracking)
+
+Physics: tau(d) = exp(-beta_lwir * d), with the LWIR extinction derived from
+meteorological visibility (Koschmieder: beta_visible = 3.912 / V) and a
+per-weather visible/LWIR extinction ratio:
+- haze: sub-micron aerosols barely scatter at 10 um (ratio ~10)
+- fog:  droplets comparable to the wavelength (ratio ~4, the original
+        `ThermalSimulator.apply_fog_attenuation` model)
+- rain: drops much larger than any IR wavelength, grey extinction (ratio ~1)
+
+Transmission vs range is tabulated once per LWIR extinction coefficient on
+a fixed range-bin grid. A range map is quantized to bin indices once per
+scene geometry (`range_bins`); each visibility / preset is then a single
+gather from its cached table, so sweeps over visibility and range (and
+presets that land on the same extinction) reuse tables instead of
+re-evaluating exponentials per pixel and frame.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-18
+"""
+
+import numpy as np
+import argparse
+import time
+
+
+class AtmosphericTransmission:
+    """
+    Cached LWIR transmission tables keyed by extinction coefficient.
+    """
+
+    # Visible / LWIR extinction ratio per weather type
+    PRESETS = {
+        'haze': 10.0,
+        'fog': 4.0,
+        'rain': 1.0,
+    }
+
+    def __init__(self, range_bin_m=1.0, max_range_m=20000.0, max_tables=256):
+        """
+        Initialize transmission cache.
+
+        Args:
+            range_bin_m: Table spacing (meters); nearest-bin relative error is
+                         beta * bin / 2, 0.5% for 100 m visibility fog
+            max_range_m: Longest tabulated path; longer paths (and NaN/inf,
+                         e.g. open sky) use this range
+            max_tables: Cached tables before the cache is cleared
+        """
+        self.range_bin_m = range_bin_m
+        self.max_range_m = max_range_m
+        self.max_tables = max_tables
+        self.ranges_m = np.arange(0.0, max_range_m + range_bin_m / 2, range_bin_m)
+        self._tables = {}
+
+    def extinction_km(self, visibility_m, preset='fog'):
+        """
+        Extinction coefficients for a visibility and weather preset.
+
+        Returns:
+            beta_visible_km, beta_lwir_km: Extinction (km^-1)
+        """
+        if preset not in self.PRESETS:
+            raise ValueError(f"Unknown atmosphere preset: {preset} (expected one of {sorted(self.PRESETS)})")
+        beta_visible = 3.912 / (visibility_m / 1000.0)  # km^-1
+        return beta_visible, beta_visible / self.PRESETS[preset]
+
+    def table(self, beta_lwir_km):
+        """Transmission at `self.ranges_m` for one LWIR extinction (cached)."""
+        key = round(float(beta_lwir_km), 9)
+        table = self._tables.get(key)
+        if table is None:
+            if len(self._tables) >= self.max_tables:
+                self._tables.clear()
+            table = self._tables[key] = np.exp(-key * self.ranges_m / 1000.0)
+        return table
+
+    def range_bins(self, range_m):
+        """
+        Table indices for path length(s) in meters (NaN/inf -> longest path).
+
+        Compute once per range map and pass as `bins` to `transmission`.
+        """
+        range_m = np.nan_to_num(np.asarray(range_m, dtype=np.float64),
+                                nan=self.max_range_m, posinf=self.max_range_m)
+        bins = np.rint(range_m / self.range_bin_m)
+        return np.clip(bins, 0, len(self.ranges_m) - 1).astype(np.intp)
+
+    def transmission(self, range_m, visibility_m, preset='fog', bins=None):
+        """
+        Beer-Lambert transmission along path(s) of `range_m`.
+
+        Args:
+            range_m: Path length(s) in meters: scalar, per-target (N,) or a
+                     per-pixel (H, W) range / depth map; ignored with `bins`
+            visibility_m: Meteorological visibility (meters)
+            preset: 'haze', 'fog' or 'rain'
+            bins: Precomputed `range_bins(range_m)`
+
+        Returns:
+            transmission: Same shape as `range_m` (float for scalars)
+        """
+        _, beta_lwir = self.extinction_km(visibility_m, preset)
+        if bins is None:
+            bins = self.range_bins(range_m)
+        transmission = self.table(beta_lwir).take(bins)
+        return float(transmission) if transmission.ndim == 0 else transmission
+
+    @staticmethod
+    def attenuate(image, transmission, fog_temp_c, out=None):
+        """
+        Attenuate a temperature map toward the fog temperature.
+
+        T' = T * tau + T_fog * (1 - tau); `transmission` is a scalar or
+        broadcasts against `image`.
+        """
+        out = np.multiply(image, transmission, out=out)
+        out += fog_temp_c * (1.0 - np.asarray(transmission))
+        return out
+
+
+def slant_range_map(camera, camera_height_m, max_range_m=np.inf):
+    """
+    Per-pixel path length for a camera above flat ground.
+
+    Pixels looking below the horizon hit the ground at
+    camera_height / sin(depression); the rest see open sky (`max_range_m`,
+    which `AtmosphericTransmission` clamps to its longest path).
+
+    Args:
+        camera: camera_model.PinholeCamera (pointing included)
+        camera_height_m: Camera height above ground (meters)
+        max_range_m: Range reported for sky pixels
+
+    Returns:
+        range_map: (height, width) path lengths (meters)
+    """
+    y_px, x_px = np.mgrid[0:camera.height, 0:camera.width]
+    up = camera.pixel_to_ray(x_px, y_px)[..., 2]
+    with np.errstate(divide='ignore'):
+        ground_m = np.where(up < 0.0, camera_height_m / -up, np.inf)
+    return np.minimum(ground_m, max_range_m)
+
+
+def benchmark(visibilities_m, ranges_m, height=512, width=640, seed=0):
+    """
+    Time per-pixel transmission maps for a visibility sweep: direct exp vs
+    table gathers (cold: tables built in the loop; cached: reused).
+
+    Returns:
+        results: Dict with 'direct_ms' (exp per pixel), 'cold_ms' and
+                 'cached_ms' (table lookups) per map, and 'max_error'
+    """
+    rng = np.random.default_rng(seed)
+    range_map = rng.uniform(ranges_m[0], ranges_m[1], (height, width))
+    atmosphere = AtmosphericTransmission()
+
+    bins = atmosphere.range_bins(range_map)
+
+    timings = {}
+    for label in ('direct', 'cold', 'cached'):
+        t0 = time.perf_counter()
+        for visibility_m in visibilities_m:
+            if label == 'direct':
+                _, beta_lwir = atmosphere.extinction_km(visibility_m)
+                np.exp(-beta_lwir * range_map / 1000.0)
+            else:
+                atmosphere.transmission(None, visibility_m, bins=bins)
+        timings[label] = (time.perf_counter() - t0) * 1e3 / len(visibilities_m)
+
+    max_error = 0.0
+    for visibility_m in visibilities_m:
+        _, beta_lwir = atmosphere.extinction_km(visibility_m)
+        exact = np.exp(-beta_lwir * range_map / 1000.0)
+        max_error = max(max_error, float(np.max(np.abs(
+            atmosphere.transmission(None, visibility_m, bins=bins) - exact))))
+
+    return {
+        'direct_ms': timings['direct'],
+        'cold_ms': timings['cold'],
+        'cached_ms': timings['cached'],
+        'max_error': max_error,
+    }
+
+
+def main():
+    """
+    Main execution: Transmission table summary and visibility sweep benchmark.
+
+    Usage:
+        python src/simulations/atmosphere.py
+    """
+    parser = argparse.ArgumentParser(description='LWIR atmospheric transmission cache')
+    parser.add_argument('--visibilities', type=int, default=20,
+                        help='Visibility samples in the sweep (default: 20)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  LWIR ATMOSPHERIC TRANSMISSION")
+    print("  VRD-29: Thermal Simulation & Fog Injection")
+    print("=" * 70)
+    print()
+
+    atmosphere = AtmosphericTransmission()
+    ranges_m = np.array([100.0, 500.0, 1000.0, 2000.0])
+    print(f"[INFO] Transmission at {', '.join(f'{r:.0f}' for r in ranges_m)} m:")
+    for preset in atmosphere.PRESETS:
+        for visibility_m in (200.0, 1000.0, 5000.0):
+            transmission = atmosphere.transmission(ranges_m, visibility_m, preset)
+            print(f"       - {preset:5s} V={visibility_m:6.0f} m: "
+                  f"{'  '.join(f'{t:6.1%}' for t in transmission)}")
+
+    visibilities_m = np.linspace(100.0, 5000.0, args.visibilities)
+    results = benchmark(visibilities_m, (50.0, 3000.0))
+    print(f"[INFO] 640x512 range map, {args.visibilities} visibilities:")
+    print(f"       - Direct exp:     {results['direct_ms']:6.2f} ms/map")
+    print(f"       - Table (cold):   {results['cold_ms']:6.2f} ms/map")
+    print(f"       - Table (cached): {results['cached_ms']:6.2f} ms/map")
+    print(f"       - Max range-bin error: {results['max_error']:.1e}")
+    print(f"[SUCCESS] Transmission cache ready")
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Slew-to-Cue Acquisition Simulator (Monte-Carlo)
+
+Purpose: Score how quickly radar cues turn into thermal locks, so search
+         patterns and cue parameters can be tuned against time-to-acquire.
+
+JIRA: VRD-30 (Slew-to-Cue Logic Module)
+Epic: VRD-26 (Thermal Infrared & Night-Time Tracking)
+
+One trial = one target:
+1. Noisy radar plot from `RadarTrackSimulator` (VRD-32 noise model)
+2. Cue + search pattern from `SlewToCueController`, the search ellipse
+   sized from the radar's angle/range noise (or a fixed override)
+3. Turret slews to every dwell (`TurretSlewModel`) while the target moves
+4. Each dwell that has the target inside the search footprint detects it
+   with a probability taken from `ThermalSimulator` contrast grades
+   (apparent size at the turret -> target range, optional fog)
+
+All trials run as (trials x dwells) arrays, so thousands of trials cost a
+few tens of milliseconds and parameter sweeps can run in a tight loop.
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-18
+"""
+
+import sys
+import io
+import contextlib
+import numpy as np
+import matplotlib.pyplot as plt
+from pathlib import Path
+import json
+import argparse
+import time
+
+# Add shared modules, turret control and radar simulations to Python path
+sys.path.append(str(Path(__file__).parents[3] / 'common'))
+sys.path.append(str(Path(__file__).parents[1] / 'control'))
+sys.path.append(str(Path(__file__).parents[3] / 'passive-radar' / 'src' / 'simulations'))
+
+from coordinates import enu_to_aer
+from simulate_thermal import ThermalSimulator
+from slew_to_cue import SlewToCueController
+from turret_scheduler import TurretSlewModel
+from simulate_radar_tracks import RadarTrackSimulator
+from track_batch import TrackBatch
+
+
+class AcquisitionSimulator:
+    """
+    Monte-Carlo time-to-acquire harness for radar-cued thermal search.
+    """
+
+    def __init__(self, controller, radar, slew_model=None, thermal=None,
+                 target_size_m=0.5, target_temp_c=50.0):
+        """
+        Initialize acquisition simulator.
+
+        Args:
+            controller: SlewToCueController (turret site, search FOV, patterns)
+            radar: RadarTrackSimulator (radar site and plot noise model)
+            slew_model: TurretSlewModel (default limits if None)
+            thermal: ThermalSimulator rendering a crop of the search FOV for
+                     contrast scoring (default: 96 x 96 crop of a 640 px sensor)
+            target_size_m: Hot-spot extent used for apparent size (meters)
+            target_temp_c: Hot-spot peak temperature (deg C)
+        """
+        self.controller = controller
+        self.radar = radar
+        self.slew_model = slew_model if slew_model is not None else TurretSlewModel()
+        if thermal is None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                thermal = ThermalSimulator(width=96, height=96,
+                                           fov_deg=controller.search_fov_deg * 96 / 640)
+        self.thermal = thermal
+        self.target_size_m = target_size_m
+        self.target_temp_c = target_temp_c
+
+        # Range -> per-dwell detection probability (set by detection_probability_table)
+        self.pd_range_m = np.array([0.0, 1e9])
+        self.pd = np.ones(2)
+
+        print(f"[INFO] Acquisition Simulator initialized")
+        print(f"       - Search FOV: {controller.search_fov_deg} deg "
+              f"(footprint radius {controller.footprint_radius_deg:.2f} deg)")
+        print(f"       - Target: {target_size_m} m at {target_temp_c} deg C")
+
+    def detection_probability_table(self, ranges_m, visibility_m=None, num_frames=3):
+        """
+        Per-dwell detection probability vs range from thermal contrast.
+
+        Renders the target at its apparent size (sub-pixel targets are
+        diluted by their fill factor), optionally through fog, adds sensor
+        noise and uses the mean thermal contrast grade (0-1) as the
+        probability of detecting it in one dwell.
+
+        Args:
+            ranges_m: Range samples (meters, ascending)
+            visibility_m: Fog visibility (meters); None = clear air
+            num_frames: Noise realizations averaged per range
+
+        Returns:
+            pd: Detection probability per range sample
+        """
+        sim = self.thermal
+        ifov_rad = np.radians(sim.fov_deg) / sim.width
+        center = (sim.width // 2, sim.height // 2)
+        y_grid, x_grid = np.mgrid[0:sim.height, 0:sim.width]
+        radius_px = np.hypot(x_grid - center[0], y_grid - center[1])
+        background_mask = radius_px > 0.4 * min(sim.width, sim.height)
+
+        ranges_m = np.asarray(ranges_m, dtype=np.float64)
+        pd = np.empty(len(ranges_m))
+        for i, range_m in enumerate(ranges_m):
+            size_px = self.target_size_m / range_m / ifov_rad
+            target_mask = radius_px <= max(2.0, size_px)
+            grades = []
+            # The simulator narrates every step; only the grades are needed here
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(num_frames):
+                    background = sim.generate_cold_sky_background()
+                    delta_t = (self.target_temp_c - background[center[1], center[0]]) * min(1.0, size_px**2)
+                    image = sim.add_hot_spot(background, center, background[center[1], center[0]] + delta_t,
+                                             max(size_px, 1.0), out=background)
+                    if visibility_m is not None:
+                        image, _ = sim.apply_fog_attenuation(image, visibility_m, range_m)
+                    image = sim.add_thermal_noise(image)
+                    grades.append(sim.calculate_thermal_contrast_grade(image, target_mask, background_mask)[0])
+            pd[i] = np.mean(grades)
+
+        self.pd_range_m = ranges_m
+        self.pd = pd
+        return pd
+
+    def sample_scenarios(self, num_trials, rng, min_range_m=500.0, max_range_m=4000.0,
+                         altitude_m=(30.0, 300.0), speed_m_s=(5.0, 25.0)):
+        """
+        Draw random targets and their radar plots.
+
+        Args:
+            num_trials: Number of targets
+            rng: numpy Generator
+            min_range_m, max_range_m: Ground range from the radar (meters)
+            altitude_m: (min, max) height above the radar (meters)
+            speed_m_s: (min, max) horizontal speed, random heading (m/s)
+
+        Returns:
+            scenarios: Dict of columns for the detected targets: position_enu,
+                       velocity_enu (radar ENU), plot azimuth_deg,
+                       elevation_deg, range_m; plus num_trials (incl. missed)
+        """
+        ground_range = np.sqrt(rng.uniform(min_range_m**2, max_range_m**2, num_trials))
+        bearing = rng.uniform(0.0, 2 * np.pi, num_trials)
+        position = np.column_stack([ground_range * np.sin(bearing), ground_range * np.cos(bearing),
+                                    rng.uniform(*altitude_m, num_trials)])
+        heading = rng.uniform(0.0, 2 * np.pi, num_trials)
+        speed = rng.uniform(*speed_m_s, num_trials)
+        velocity = np.column_stack([speed * np.sin(heading), speed * np.cos(heading),
+                                    np.zeros(num_trials)])
+
+        true_az, true_el, true_range = enu_to_aer(*position.T)
+        truth = TrackBatch({
+            'time_s': np.zeros(num_trials),
+            'track_id': np.arange(num_trials),
+            'true_azimuth_deg': true_az,
+            'true_elevation_deg': true_el,
+            'true_range_m': true_range,
+        })
+        plots = self.radar.inject_measurement_noise_batch(truth, rng)
+        detected = plots.track_id
+
+        return {
+            'num_trials': num_trials,
+            'position_enu': position[detected],
+            'velocity_enu': velocity[detected],
+            'azimuth_deg': plots.azimuth_deg,
+            'elevation_deg': plots.elevation_deg,
+            'range_m': plots.range_m,
+        }
+
+    def plot_covariance(self, azimuth_deg, elevation_deg, range_m):
+        """
+        ENU position covariance of radar plots from the radar's noise model.
+
+        The polar noise (sigma_az, sigma_el, sigma_range) is independent
+        along the plot's range, azimuth and elevation unit vectors, so the
+        covariance is the sum of three scaled outer products.
+
+        Args:
+            azimuth_deg, elevation_deg, range_m: (N,) plots (radar frame)
+
+        Returns:
+            cov: (N, 3, 3) covariance in the radar ENU frame (m^2)
+        """
+        az = np.radians(azimuth_deg)
+        el = np.radians(elevation_deg)
+        sin_az, cos_az, sin_el, cos_el = np.sin(az), np.cos(az), np.sin(el), np.cos(el)
+        u_range = np.stack([cos_el * sin_az, cos_el * cos_az, sin_el], axis=-1)
+        u_az = np.stack([cos_az, -sin_az, np.zeros_like(az)], axis=-1)
+        u_el = np.stack([-sin_el * sin_az, -sin_el * cos_az, cos_el], axis=-1)
+
+        sigma_range = np.full(np.shape(range_m), float(self.radar.sigma_range))
+        sigma_az = range_m * cos_el * np.radians(self.radar.sigma_az)
+        sigma_el = range_m * np.radians(self.radar.sigma_el)
+        cov = np.zeros(np.shape(range_m) + (3, 3))
+        for sigma, u in ((sigma_range, u_range), (sigma_az, u_az), (sigma_el, u_el)):
+            cov += (sigma**2)[:, np.newaxis, np.newaxis] * u[:, :, np.newaxis] * u[:, np.newaxis, :]
+        return cov
+
+    def run(self, scenarios, rng, uncertainty_m=None, sigma_multiplier=2.0, dwell_s=0.1,
+            latency_s=0.5, start_pan_deg=0.0, start_tilt_deg=5.0):
+        """
+        Fly every trial through slew + spiral search.
+
+        Args:
+            scenarios: Output of `sample_scenarios`
+            rng: numpy Generator (detection draws)
+            uncertainty_m: Override: fixed cue position uncertainty (m) for
+                           a circular search radius; None = search ellipse
+                           from the radar's angle/range noise
+            sigma_multiplier: Ellipse semi-axes in standard deviations
+            dwell_s: Integration time per search dwell (s)
+            latency_s: Radar plot -> turret command latency (s)
+            start_pan_deg, start_tilt_deg: Turret pointing when the cue arrives
+
+        Returns:
+            results: Dict of per-trial columns: acquired, time_to_acquire_s
+                     (NaN if not acquired), dwells_to_acquire, num_dwells,
+                     pattern_time_s, in_footprint (target ever inside a
+                     footprint), search_radius_deg (semi-major axis)
+        """
+        controller = self.controller
+        transform = controller._radar_transform(self.radar.frame)
+        commands = controller.radar_plots_to_turret_commands(
+            self.radar.frame, scenarios['azimuth_deg'], scenarios['elevation_deg'],
+            scenarios['range_m'], 10.0 if uncertainty_m is None else uncertainty_m
+        )
+        if uncertainty_m is None:
+            # Plot covariance rotated into the turret frame -> search ellipse
+            cov = transform.rotation @ self.plot_covariance(
+                scenarios['azimuth_deg'], scenarios['elevation_deg'], scenarios['range_m']
+            ) @ transform.rotation.T
+            semi_major_deg, semi_minor_deg, orientation_deg = controller.covariance_search_ellipse(
+                commands['radar_azimuth_deg'], commands['radar_elevation_deg'], commands['range_m'],
+                cov, sigma_multiplier
+            )
+            commands['search_radius_deg'] = semi_major_deg
+        else:
+            semi_minor_deg, orientation_deg = None, 0.0
+        dwells, num_dwells = controller.generate_search_patterns(
+            commands['pan_deg'], commands['tilt_deg'], commands['search_radius_deg'],
+            semi_minor_deg, orientation_deg
+        )
+        num_trials, max_dwells = dwells.shape[:2]
+        valid = np.arange(max_dwells) < num_dwells[:, np.newaxis]
+
+        # Arrival at each dwell: latency, initial slew, then slew + dwell per step
+        step_s = np.empty((num_trials, max_dwells))
+        step_s[:, 0] = latency_s + self.slew_model.slew_time(
+            start_pan_deg, start_tilt_deg, dwells[:, 0, 0], dwells[:, 0, 1])
+        step_s[:, 1:] = dwell_s + self.slew_model.slew_time(
+            dwells[:, :-1, 0], dwells[:, :-1, 1], dwells[:, 1:, 0], dwells[:, 1:, 1])
+        arrival_s = np.cumsum(step_s, axis=1)
+
+        # Target direction mid-dwell (moving target, turret frame)
+        observe_s = arrival_s + 0.5 * dwell_s
+        position = (scenarios['position_enu'][:, np.newaxis, :]
+                    + scenarios['velocity_enu'][:, np.newaxis, :] * observe_s[..., np.newaxis])
+        position = transform.apply(position)
+        truth_az, truth_el, truth_range = enu_to_aer(*np.moveaxis(position, -1, 0))
+        truth_pan, truth_tilt = controller.aer_to_turret_command(truth_az, truth_el)
+        d_pan = np.mod(dwells[..., 0] - truth_pan + 180.0, 360.0) - 180.0
+        offset_deg = np.hypot(d_pan * np.cos(np.radians(truth_tilt)), dwells[..., 1] - truth_tilt)
+        in_footprint = valid & (offset_deg <= controller.footprint_radius_deg)
+
+        # Detection odds follow the turret -> target range at each dwell
+        pd = np.interp(truth_range, self.pd_range_m, self.pd)
+        hit = in_footprint & (rng.random((num_trials, max_dwells)) < pd)
+
+        acquired = hit.any(axis=1)
+        first = np.argmax(hit, axis=1)
+        rows = np.arange(num_trials)
+        time_to_acquire_s = np.where(acquired, arrival_s[rows, first] + dwell_s, np.nan)
+        last = num_dwells - 1
+
+        return {
+            'acquired': acquired,
+            'time_to_acquire_s': time_to_acquire_s,
+            'dwells_to_acquire': np.where(acquired, first + 1, 0),
+            'num_dwells': num_dwells,
+            'pattern_time_s': arrival_s[rows, last] + dwell_s,
+            'in_footprint': in_footprint.any(axis=1),
+            'search_radius_deg': commands['search_radius_deg'],
+        }
+
+    @staticmethod
+    def summarize(results, num_trials=None):
+        """
+        Time-to-acquire statistics.
+
+        Args:
+            results: Output of `run`
+            num_trials: Targets flown incl. those the radar missed (default:
+                        cued trials only)
+
+        Returns:
+            summary: Dict of scalar statistics
+        """
+        acquired = results['acquired']
+        times = results['time_to_acquire_s'][acquired]
+        num_cued = len(acquired)
+        if num_trials is None:
+            num_trials = num_cued
+
+        def percentile(q):
+            return float(np.percentile(times, q)) if len(times) else float('nan')
+
+        return {
+            'num_trials': int(num_trials),
+            'num_cued': int(num_cued),
+            'p_acquire': float(np.mean(acquired)) if num_cued else 0.0,
+            'p_outside_pattern': float(np.mean(~results['in_footprint'])) if num_cued else 0.0,
+            'p_missed_in_footprint': float(np.mean(results['in_footprint'] & ~acquired)) if num_cued else 0.0,
+            'time_to_acquire_median_s': percentile(50),
+            'time_to_acquire_p90_s': percentile(90),
+            'time_to_acquire_p95_s': percentile(95),
+            'dwells_to_acquire_mean': float(np.mean(results['dwells_to_acquire'][acquired])) if len(times) else float('nan'),
+            'dwells_per_pattern_mean': float(np.mean(results['num_dwells'])) if num_cued else float('nan'),
+            'pattern_time_mean_s': float(np.mean(results['pattern_time_s'])) if num_cued else float('nan'),
+            'search_radius_mean_deg': float(np.mean(results['search_radius_deg'])) if num_cued else float('nan'),
+        }
+
+
+def main():
+    """
+    Main execution: Monte-Carlo time-to-acquire for radar-cued thermal search.
+
+    Usage:
+        python src/simulations/simulate_acquisition.py
+        python src/simulations/simulate_acquisition.py --trials 20000 --visibility 1000
+    """
+    parser = argparse.ArgumentParser(description='Slew-to-Cue Acquisition Simulator')
+    parser.add_argument('--trials', type=int, default=5000, help='Monte-Carlo trials per setting')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--search-fov', type=float, default=1.0, help='Search FOV (degrees)')
+    parser.add_argument('--dwell', type=float, default=0.1, help='Dwell per search point (s)')
+    parser.add_argument('--latency', type=float, default=0.5, help='Plot -> command latency (s)')
+    parser.add_argument('--visibility', type=float, default=None, help='Fog visibility (m); default clear')
+    parser.add_argument('--output-dir', type=str, default='output', help='Output directory')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  SLEW-TO-CUE ACQUISITION SIMULATOR")
+    print("  VRD-30: Slew-to-Cue Logic Module")
+    print("=" * 70)
+    print()
+
+    rng = np.random.default_rng(args.seed)
+    np.random.seed(args.seed)  # ThermalSimulator draws from the global generator
+
+    radar = RadarTrackSimulator()
+    turret_lat, turret_lon, turret_alt_m = radar.frame.enu_to_geodetic(400.0, -300.0, 40.0)
+    controller = SlewToCueController(turret_lat, turret_lon, turret_alt_m, fov_deg=50.0,
+                                     search_fov_deg=args.search_fov)
+    simulator = AcquisitionSimulator(controller, radar)
+
+    # =========================================================================
+    # Detection probability per dwell (thermal contrast)
+    # =========================================================================
+    print("\n" + "=" * 70)
+    weather = 'clear' if args.visibility is None else f"fog, visibility {args.visibility:.0f} m"
+    print(f"DETECTION PROBABILITY PER DWELL ({weather})")
+    print("=" * 70)
+    ranges_m = np.array([250.0, 500.0, 1000.0, 1500.0, 2000.0, 3000.0, 4000.0, 5000.0])
+    pd = simulator.detection_probability_table(ranges_m, visibility_m=args.visibility)
+    for range_m, p in zip(ranges_m, pd):
+        print(f"       - {range_m:6.0f} m: Pd = {p:.2f}")
+
+    # =========================================================================
+    # Baseline cue parameters
+    # =========================================================================
+    print("\n" + "=" * 70)
+    print(f"BASELINE: {args.trials} trials, search ellipse from radar noise "
+          f"(az {radar.sigma_az} deg, el {radar.sigma_el} deg, range {radar.sigma_range} m, 2 sigma)")
+    print("=" * 70)
+    scenarios = simulator.sample_scenarios(args.trials, rng)
+    start = time.perf_counter()
+    results = simulator.run(scenarios, rng, dwell_s=args.dwell, latency_s=args.latency)
+    elapsed_ms = (time.perf_counter() - start) * 1e3
+    baseline = simulator.summarize(results, scenarios['num_trials'])
+
+    print(f"[INFO] {baseline['num_cued']} cued trials in {elapsed_ms:.1f} ms "
+          f"({elapsed_ms * 1e3 / max(baseline['num_cued'], 1):.1f} us/trial)")
+    print(f"       - Search radius: mean {baseline['search_radius_mean_deg']:.2f} deg, "
+          f"{baseline['dwells_per_pattern_mean']:.1f} dwells")
+    print(f"       - P(acquire): {baseline['p_acquire']:.1%} "
+          f"(outside pattern {baseline['p_outside_pattern']:.1%}, "
+          f"not detected {baseline['p_missed_in_footprint']:.1%})")
+    print(f"       - Time to acquire: median {baseline['time_to_acquire_median_s']:.2f} s, "
+          f"p90 {baseline['time_to_acquire_p90_s']:.2f} s")
+
+    # =========================================================================
+    # Tuning sweep: search ellipse size (or fixed uncertainty) x dwell time
+    # =========================================================================
+    print("\n" + "=" * 70)
+    print("TUNING SWEEP: cue uncertainty x dwell")
+    print("=" * 70)
+    print(f"  {'cue':>10} {'dwell_s':>8} {'radius':>7} {'dwells':>7} {'P(acq)':>7} "
+          f"{'median_s':>9} {'p90_s':>7}")
+
+    def cue_label(summary):
+        if summary['uncertainty_m'] is None:
+            return f"{summary['sigma_multiplier']:.0f} sigma"
+        return f"{summary['uncertainty_m']:.0f} m"
+
+    sweep = []
+    start = time.perf_counter()
+    for uncertainty_m, sigma_multiplier in ((None, 1.0), (None, 2.0), (None, 3.0), (10.0, None), (100.0, None)):
+        for dwell_s in (0.05, 0.1, 0.2):
+            summary = simulator.summarize(
+                simulator.run(scenarios, rng, uncertainty_m=uncertainty_m,
+                              sigma_multiplier=sigma_multiplier, dwell_s=dwell_s,
+                              latency_s=args.latency),
+                scenarios['num_trials'])
+            summary.update({'uncertainty_m': uncertainty_m, 'sigma_multiplier': sigma_multiplier,
+                            'dwell_s': dwell_s})
+            sweep.append(summary)
+            print(f"  {cue_label(summary):>10} {dwell_s:8.2f} {summary['search_radius_mean_deg']:7.2f} "
+                  f"{summary['dwells_per_pattern_mean']:7.1f} {summary['p_acquire']:7.1%} "
+                  f"{summary['time_to_acquire_median_s']:9.2f} {summary['time_to_acquire_p90_s']:7.2f}")
+    sweep_ms = (time.perf_counter() - start) * 1e3
+    best = max(sweep, key=lambda s: (round(s['p_acquire'], 2), -s['time_to_acquire_p90_s']))
+    print(f"\n[INFO] Sweep of {len(sweep)} settings in {sweep_ms:.0f} ms")
+    print(f"[SUCCESS] Best: cue {cue_label(best)}, dwell {best['dwell_s']:.2f} s -> "
+          f"P(acquire) {best['p_acquire']:.1%}, p90 {best['time_to_acquire_p90_s']:.2f} s")
+
+    # =========================================================================
+    # Save outputs
+    # =========================================================================
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(output_dir / 'acquisition_summary.json', 'w', encoding='utf-8') as f:
+        json.dump({
+            'config': {'trials': args.trials, 'seed': args.seed, 'search_fov_deg': args.search_fov,
+                       'latency_s': args.latency, 'visibility_m': args.visibility},
+            'detection_probability': {'range_m': ranges_m.tolist(), 'pd': pd.tolist()},
+            'baseline': baseline,
+            'sweep': sweep,
+        }, f, indent=2)
+    print(f"[SUCCESS] Summary saved: {output_dir / 'acquisition_summary.json'}")
+
+    best_results = simulator.run(scenarios, rng, uncertainty_m=best['uncertainty_m'],
+                                 sigma_multiplier=best['sigma_multiplier'],
+                                 dwell_s=best['dwell_s'], latency_s=args.latency)
+    fig, ax = plt.subplots(figsize=(10, 6))
+    bins = np.linspace(0.0, np.nanpercentile(best_results['time_to_acquire_s'], 99) + 0.5, 50)
+    ax.hist(results['time_to_acquire_s'][results['acquired']], bins=bins, alpha=0.6,
+            label=f"Baseline (2 sigma, {args.dwell:.2f} s) - P(acq) {baseline['p_acquire']:.0%}")
+    ax.hist(best_results['time_to_acquire_s'][best_results['acquired']], bins=bins, alpha=0.6,
+            label=f"Best ({cue_label(best)}, {best['dwell_s']:.2f} s) - "
+                  f"P(acq) {best['p_acquire']:.0%}")
+    ax.set_xlabel('Time to Acquire (s)', fontsize=12)
+    ax.set_ylabel('Trials', fontsize=12)
+    ax.set_title('Slew-to-Cue Time-to-Acquire Distribution', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=10)
+    plt.tight_layout()
+    fig.savefig(output_dir / 'acquisition_time_histogram.png', dpi=150, bbox_inches='tight')
+    print(f"[SUCCESS] Histogram saved: {output_dir / 'acquisition_time_histogram.png'}")
+    print()
+
+
+if __name__ == '__main__':
+    main()
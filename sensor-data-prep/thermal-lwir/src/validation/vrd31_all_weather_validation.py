@@ -260,7 +260,8 @@ class AllWeatherValidator:
             position=(self.width//2, self.height//2),
             temp_celsius=50.0,
             size_pixels=20,
-            shape='gaussian'
+            shape='gaussian',
+            out=background
         )
         thermal_image = self.thermal_sim.add_thermal_noise(thermal_image)
 
@@ -330,7 +331,8 @@ class AllWeatherValidator:
             position=(self.width//2, self.height//2),
             temp_celsius=50.0,
             size_pixels=20,
-            shape='gaussian'
+            shape='gaussian',
+            out=background
         )
         thermal_image = self.thermal_sim.add_thermal_noise(thermal_image)
 
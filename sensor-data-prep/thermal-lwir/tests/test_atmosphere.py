@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for LWIR atmospheric transmission
+
+Tests validate that:
+- Binned transmission matches exp(-beta * d) within the documented
+  nearest-bin error for every preset
+- NaN / inf ranges (open sky in slant_range_map) clamp to max_range_m
+- The fog preset reproduces the original scalar apply_fog_attenuation result
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-18
+"""
+
+import sys
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Add simulations and common directories to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'simulations'))
+sys.path.insert(0, str(Path(__file__).parents[2] / 'common'))
+
+from atmosphere import AtmosphericTransmission, slant_range_map
+from simulate_thermal import ThermalSimulator
+from camera_model import PinholeCamera
+
+
+def _exact_transmission(range_m, visibility_m, ratio):
+    """Beer-Lambert transmission evaluated directly."""
+    beta_lwir_km = 3.912 / (visibility_m / 1000.0) / ratio
+    return np.exp(-beta_lwir_km * np.asarray(range_m) / 1000.0)
+
+
+class TestTransmission:
+    """Binned tables against the exact exponential"""
+
+    def setup_method(self):
+        self.atmosphere = AtmosphericTransmission(range_bin_m=2.0, max_range_m=5000.0)
+        self.rng = np.random.default_rng(48)
+
+    @pytest.mark.parametrize('preset', ['haze', 'fog', 'rain'])
+    @pytest.mark.parametrize('visibility_m', [100.0, 1000.0, 10000.0])
+    def test_matches_beer_lambert(self, preset, visibility_m):
+        """Test: Relative error stays within beta * bin / 2 over random ranges"""
+        range_map = self.rng.uniform(0.0, 5000.0, (64, 80))
+        transmission = self.atmosphere.transmission(range_map, visibility_m, preset)
+        exact = _exact_transmission(range_map, visibility_m, AtmosphericTransmission.PRESETS[preset])
+
+        assert transmission.shape == range_map.shape
+        _, beta_lwir_km = self.atmosphere.extinction_km(visibility_m, preset)
+        bound = np.expm1(beta_lwir_km * self.atmosphere.range_bin_m / 2 / 1000.0)
+        assert np.max(np.abs(transmission / exact - 1.0)) <= bound * (1 + 1e-9)
+
+        # Precomputed bins give the same gather; on-grid ranges are exact
+        bins = self.atmosphere.range_bins(range_map)
+        assert np.array_equal(self.atmosphere.transmission(None, visibility_m, preset, bins=bins),
+                              transmission)
+        on_grid = np.array([0.0, 2.0, 1000.0, 5000.0])
+        assert np.allclose(self.atmosphere.transmission(on_grid, visibility_m, preset),
+                           _exact_transmission(on_grid, visibility_m,
+                                               AtmosphericTransmission.PRESETS[preset]),
+                           rtol=1e-12)
+
+    def test_scalar_and_unknown_preset(self):
+        """Test: Scalar range returns a float, unknown presets raise ValueError"""
+        assert isinstance(self.atmosphere.transmission(500.0, 1000.0), float)
+        with pytest.raises(ValueError):
+            self.atmosphere.transmission(500.0, 1000.0, preset='snow')
+
+    def test_presets_share_tables(self):
+        """Test: Presets landing on the same LWIR extinction reuse one table"""
+        self.atmosphere.transmission(100.0, 400.0, 'fog')
+        self.atmosphere.transmission(100.0, 160.0, 'haze')  # 3.912 / 0.4 / 4 == 3.912 / 0.16 / 10
+        assert len(self.atmosphere._tables) == 1
+
+
+class TestOpenSky:
+    """Non-finite and out-of-table ranges"""
+
+    def setup_method(self):
+        self.atmosphere = AtmosphericTransmission(range_bin_m=1.0, max_range_m=3000.0)
+
+    def test_non_finite_ranges_clamp(self):
+        """Test: NaN, inf and over-long paths all use max_range_m"""
+        range_m = np.array([np.nan, np.inf, 3000.0, 1e7, -np.inf, -5.0])
+        transmission = self.atmosphere.transmission(range_m, 500.0)
+        longest = _exact_transmission(3000.0, 500.0, AtmosphericTransmission.PRESETS['fog'])
+        assert np.all(np.isfinite(transmission))
+        assert np.allclose(transmission[:4], longest, rtol=1e-12)
+        assert np.all(transmission[4:] == 1.0)  # Negative paths clip to zero range
+
+    def test_slant_range_map_sky(self):
+        """Test: Sky pixels of a slant range map get the longest-path transmission"""
+        camera = PinholeCamera(160, 120, fov_deg=40.0, tilt_deg=0.0)
+        range_map = slant_range_map(camera, camera_height_m=5.0)
+        sky = ~np.isfinite(range_map)
+        assert sky.any() and (~sky).any()
+        assert np.all(range_map[~sky] > 0.0)
+
+        transmission = self.atmosphere.transmission(range_map, 500.0)
+        longest = _exact_transmission(3000.0, 500.0, AtmosphericTransmission.PRESETS['fog'])
+        assert np.allclose(transmission[sky], longest, rtol=1e-12)
+        assert np.all(transmission[~sky] >= transmission[sky].max())
+
+        # A finite sky range behaves the same once it exceeds the table
+        capped = slant_range_map(camera, camera_height_m=5.0, max_range_m=1e6)
+        assert np.all(capped[sky] == 1e6)
+        assert np.array_equal(self.atmosphere.transmission(capped, 500.0), transmission)
+
+
+class TestFogAttenuation:
+    """ThermalSimulator.apply_fog_attenuation with the fog preset"""
+
+    def setup_method(self):
+        self.sim = ThermalSimulator(width=64, height=48)
+        self.image = np.random.default_rng(1).uniform(0.0, 40.0, (48, 64))
+
+    @staticmethod
+    def _scalar_fog(image, visibility_m, target_range_m):
+        """The original scalar model: beta_lwir = beta_visible / 4."""
+        beta_lwir = 3.912 / (visibility_m / 1000.0) / 4.0
+        transmission = np.exp(-beta_lwir * target_range_m / 1000.0)
+        fog_temp = float(np.mean(image))
+        return image * transmission + fog_temp * (1 - transmission), transmission
+
+    @pytest.mark.parametrize('visibility_m, target_range_m', [(100, 500), (50, 200), (1000, 2000)])
+    def test_matches_scalar_model(self, visibility_m, target_range_m):
+        """Test: Default (fog) attenuation equals the old closed-form result"""
+        expected, expected_tau = self._scalar_fog(self.image, visibility_m, target_range_m)
+        attenuated, metadata = self.sim.apply_fog_attenuation(self.image, visibility_m,
+                                                              target_range_m, verbose=False)
+
+        assert metadata['preset'] == 'fog'
+        assert metadata['transmission'] == pytest.approx(expected_tau, rel=1e-12)
+        assert np.allclose(attenuated, expected, rtol=1e-12, atol=1e-12)
+
+        out = self.image.copy()
+        self.sim.apply_fog_attenuation(out, visibility_m, target_range_m, out=out, verbose=False)
+        assert np.allclose(out, expected, rtol=1e-12, atol=1e-12)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the thermal hot-spot detector
+
+Tests validate that:
+- Synthetic hot spots are found hottest first at their centroid and peak
+- Isolated dead / hot pixels are rejected by min_area_px
+- detect_stack equals per-frame detect and never links across frames
+- Detector output feeds ThermalPolarimetricFusion.process_thermal_detection
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-18
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add detection directory and the polarimetric pipeline to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'detection'))
+POLARIMETRIC_DIR = Path(__file__).parents[2] / 'polarimetric-eo'
+sys.path.insert(0, str(POLARIMETRIC_DIR / 'src'))
+
+from hot_spot_detector import HotSpotDetector
+
+FRAME_SHAPE = (240, 320)
+BACKGROUND_C = 5.0
+NOISE_C = 0.05
+
+# (x, y, peak excess deg C), hottest first
+HOT_SPOTS = [(200.3, 60.6, 30.0), (80.7, 170.2, 12.0), (260.0, 200.2, 6.0)]
+
+
+def _frame(rng, hot_spots=HOT_SPOTS, sigma_px=1.5):
+    """Sky background with noise plus Gaussian hot spots at sub-pixel positions."""
+    frame = BACKGROUND_C + NOISE_C * rng.standard_normal(FRAME_SHAPE)
+    y, x = np.mgrid[0:FRAME_SHAPE[0], 0:FRAME_SHAPE[1]]
+    for cx, cy, peak in hot_spots:
+        frame += peak * np.exp(-((x - cx) ** 2 + (y - cy) ** 2) / (2 * sigma_px ** 2))
+    return frame
+
+
+class TestDetect:
+    """Single-frame detection"""
+
+    def setup_method(self):
+        self.rng = np.random.default_rng(29)
+        self.detector = HotSpotDetector()
+
+    def test_known_hot_spots(self):
+        """Test: Each hot spot is found once, hottest first, at its centroid and peak"""
+        targets = self.detector.detect(_frame(self.rng))
+
+        assert len(targets) == len(HOT_SPOTS)
+        assert [t['target_id'] for t in targets] == ['TGT001', 'TGT002', 'TGT003']
+        for target, (cx, cy, peak) in zip(targets, HOT_SPOTS):
+            u, v = target['centroid_subpixel']
+            assert abs(u - cx) < 0.2 and abs(v - cy) < 0.2
+            assert np.all(np.abs(np.subtract(target['centroid'], [u, v])) <= 0.5)
+            # Peak pixel is at most half a pixel off the sub-pixel centre
+            assert BACKGROUND_C + 0.8 * peak < target['max_temp_c'] < BACKGROUND_C + peak + 0.3
+            assert abs(target['contrast_c'] - (target['max_temp_c'] - BACKGROUND_C)) < 0.1
+            assert target['area_px'] >= 2
+            assert target['classification'] == 'hot_spot'
+
+    def test_dead_pixels_rejected(self):
+        """Test: Single stuck-hot pixels are not reported, a 2-pixel blob is"""
+        frame = _frame(self.rng, hot_spots=[])
+        frame[[20, 100, 200], [30, 150, 300]] = 60.0
+        assert self.detector.detect(frame) == []
+
+        frame[120, 40:42] = 40.0
+        targets = self.detector.detect(frame)
+        assert len(targets) == 1
+        assert targets[0]['area_px'] == 2
+        assert targets[0]['centroid_subpixel'] == [40.5, 120.0]
+
+        # Turning the area gate off reports the stuck pixels as well
+        assert len(HotSpotDetector(min_area_px=1).detect(frame)) == 4
+
+    def test_empty_frame(self):
+        """Test: Background noise alone yields no targets"""
+        assert self.detector.detect(_frame(self.rng, hot_spots=[])) == []
+
+
+class TestDetectStack:
+    """Stacks of frames"""
+
+    def test_stack_matches_per_frame(self):
+        """Test: Chunked stack detection equals per-frame detect, no cross-frame linking"""
+        rng = np.random.default_rng(30)
+        frames = []
+        for i in range(7):
+            # The first spot sits still so its blobs overlap in consecutive frames
+            spots = [HOT_SPOTS[0], (40.0 + 25.0 * i, 120.0, 10.0)]
+            frames.append(_frame(rng, hot_spots=spots[:1 + i % 2]))
+        frames = np.stack(frames)
+
+        detector = HotSpotDetector(chunk_frames=3)
+        stacked = detector.detect_stack(frames)
+        assert len(stacked) == len(frames)
+        assert stacked == [detector.detect(frame) for frame in frames]
+
+        # The still spot is reported in every frame with its single-frame area
+        single = detector.detect(frames[0])[0]
+        for i, targets in enumerate(stacked):
+            assert len(targets) == 1 + i % 2
+            assert targets[0]['centroid'] == single['centroid']
+            assert abs(targets[0]['area_px'] - single['area_px']) <= 2
+
+
+class TestFusionFeed:
+    """Detector output into the thermal-to-polarimetric pipeline"""
+
+    def test_process_thermal_detection(self):
+        """Test: The targets list drives parallax correction and the fusion decision"""
+        from integration.thermal_to_polarimetric import ThermalPolarimetricFusion
+
+        targets = HotSpotDetector().detect(_frame(np.random.default_rng(31)))
+        fusion = ThermalPolarimetricFusion(
+            calibration_file=str(POLARIMETRIC_DIR / 'config' / 'sensor_calibration.json'))
+
+        width, height = fusion.roi_gater.full_resolution
+        image = np.full((height, width), 0.05)
+        result = fusion.process_thermal_detection({'targets': targets},
+                                                  full_polarimetric_image=image,
+                                                  roi_size=128)
+
+        detection = result['thermal_detection']
+        assert detection['target_id'] == targets[0]['target_id']
+        u, v = targets[0]['centroid']
+        assert detection['thermal_centroid'] == {'u': u, 'v': v}
+        expected = fusion.roi_gater.apply_parallax_correction(u, v)
+        mapping = result['coordinate_mapping']
+        assert (mapping['polarimetric_frame']['u'],
+                mapping['polarimetric_frame']['v']) == tuple(expected)
+        assert 'veto' in result['fusion_decision']
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Unit tests for radiometric calibration
+
+Tests validate that:
+- Every code decodes through the LUT and re-encodes to itself, for the
+  linear and Planck models, float64 and float32 tables, with and without
+  a preallocated output
+- Linear encoding keeps the (T - offset) / scale truncation
+- Metadata round-trips and the base class cannot be instantiated
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-18
+"""
+
+import sys
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Add simulations directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'simulations'))
+
+from radiometry import LinearCalibration, PlanckCalibration, RadiometricCalibration
+
+
+CALIBRATIONS = [
+    LinearCalibration(scale_factor=0.036, offset=-40.0, bit_depth=14),
+    PlanckCalibration.from_span(-20.0, 150.0),
+    PlanckCalibration.from_span(-40.0, 550.0, bit_depth=12),
+]
+
+
+class TestRoundTrip:
+    """counts -> LUT -> counts"""
+
+    @pytest.mark.parametrize('calibration', CALIBRATIONS, ids=repr)
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32])
+    def test_codes_survive_decode_encode(self, calibration, dtype):
+        """Test: Decoding a stored frame and re-encoding it changes no pixel"""
+        codes = np.arange(calibration.max_count + 1, dtype=np.uint16)
+        frame = np.tile(codes, (3, 1))
+        decoded = calibration.counts_to_temperature(frame, dtype=dtype)
+        assert decoded.dtype == dtype
+
+        assert np.array_equal(calibration.temperature_to_counts(decoded), frame)
+        out = np.empty_like(frame)
+        assert calibration.temperature_to_counts(decoded, out=out) is out
+        assert np.array_equal(out, frame)
+
+    def test_linear_truncates(self):
+        """Test: Temperatures between codes round down, out-of-range values clip"""
+        calibration = CALIBRATIONS[0]
+        temps = np.array([-50.0, -40.0, -39.99, 20.0, 20.035, 549.8, 600.0])
+        expected = np.clip(np.floor((temps + 40.0) / 0.036), 0, calibration.max_count)
+        assert np.array_equal(calibration.temperature_to_counts(temps), expected)
+
+    @pytest.mark.parametrize('calibration', CALIBRATIONS, ids=repr)
+    def test_metadata_round_trip(self, calibration):
+        """Test: from_metadata(to_metadata()) rebuilds the same LUT"""
+        rebuilt = RadiometricCalibration.from_metadata(calibration.to_metadata())
+        assert type(rebuilt) is type(calibration)
+        assert np.array_equal(rebuilt.lut, calibration.lut)
+
+    def test_base_class_is_abstract(self):
+        """Test: The model-less base calibration cannot be built"""
+        with pytest.raises(TypeError):
+            RadiometricCalibration()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the microbolometer non-uniformity model
+
+Tests validate that:
+- The same seed and parameters reload identical maps from the .npz cache
+- Changing a map parameter writes a different cache file
+- apply(out=image) works in place and keeps dead pixels at their stuck values
+- The 1/f drift is stationary at the configured standard deviations
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-18
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add simulations directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'simulations'))
+
+from sensor_nonuniformity import SensorNonUniformity
+
+
+class TestMapCache:
+    """Static map generation and the on-disk cache"""
+
+    def test_same_sensor_reloads_identical_maps(self, tmp_path):
+        """Test: A second instance with the same seed and params loads the cached maps"""
+        first = SensorNonUniformity(width=64, height=48, sensor_seed=7, cache_dir=tmp_path,
+                                    dead_pixel_fraction=0.01)
+        second = SensorNonUniformity(width=64, height=48, sensor_seed=7, cache_dir=tmp_path,
+                                     dead_pixel_fraction=0.01)
+
+        assert not first.loaded_from_cache
+        assert second.loaded_from_cache
+        assert second.cache_path == first.cache_path
+        assert [p.name for p in tmp_path.iterdir()] == [first.cache_path.name]
+        for name in ('gain', 'offset', 'dead_index', 'dead_value_c'):
+            assert np.array_equal(getattr(second, name), getattr(first, name))
+
+        # Drift settings are not part of the maps and share the cache entry
+        third = SensorNonUniformity(width=64, height=48, sensor_seed=7, cache_dir=tmp_path,
+                                    dead_pixel_fraction=0.01, drift_std_c=0.5)
+        assert third.loaded_from_cache
+
+    def test_changed_params_use_new_file(self, tmp_path):
+        """Test: A different seed or map parameter misses the cache and writes its own file"""
+        base = SensorNonUniformity(width=64, height=48, sensor_seed=7, cache_dir=tmp_path)
+        other_seed = SensorNonUniformity(width=64, height=48, sensor_seed=8, cache_dir=tmp_path)
+        other_gain = SensorNonUniformity(width=64, height=48, sensor_seed=7, cache_dir=tmp_path,
+                                         gain_std=0.02)
+
+        assert not other_seed.loaded_from_cache and not other_gain.loaded_from_cache
+        paths = {base.cache_path, other_seed.cache_path, other_gain.cache_path}
+        assert len(paths) == 3
+        assert set(tmp_path.iterdir()) == paths  # No temp files left behind
+        assert not np.array_equal(other_gain.gain, base.gain)
+
+    def test_in_memory_only(self, tmp_path):
+        """Test: cache_dir=None draws the same maps without touching the disk"""
+        cached = SensorNonUniformity(width=64, height=48, sensor_seed=3, cache_dir=tmp_path)
+        memory = SensorNonUniformity(width=64, height=48, sensor_seed=3, cache_dir=None)
+        assert memory.cache_path is None and not memory.loaded_from_cache
+        assert np.array_equal(memory.offset, cached.offset)
+
+
+class TestApply:
+    """Applying the sensor to a temperature map"""
+
+    def setup_method(self):
+        np.random.seed(11)
+        self.sensor = SensorNonUniformity(width=80, height=60, sensor_seed=5, cache_dir=None,
+                                          dead_pixel_fraction=0.02)
+
+    def test_in_place_keeps_dead_pixels(self):
+        """Test: apply(out=image) overwrites the scene and pins dead pixels every frame"""
+        rng = np.random.default_rng(0)
+        for _ in range(3):
+            scene = rng.uniform(-10.0, 40.0, (60, 80)).astype(np.float32)
+            expected = (scene * self.sensor.gain + self.sensor.offset)
+            image = scene.copy()
+
+            result = self.sensor.apply(image, out=image)
+            assert result is image
+            assert np.array_equal(image.flat[self.sensor.dead_index], self.sensor.dead_value_c)
+
+            expected += self.sensor.column_drift_c
+            expected += self.sensor.global_drift_c
+            live = np.ones(image.size, dtype=bool)
+            live[self.sensor.dead_index] = False
+            assert np.allclose(image.reshape(-1)[live], expected.reshape(-1)[live], atol=1e-4)
+
+    def test_step_false_reuses_drift(self):
+        """Test: step=False applies the current drift without advancing it"""
+        scene = np.full((60, 80), 20.0, dtype=np.float32)
+        first = self.sensor.apply(scene)
+        again = self.sensor.apply(scene, step=False)
+        assert np.array_equal(first, again)
+        assert np.array_equal(scene, np.full((60, 80), 20.0, dtype=np.float32))
+
+
+class TestDrift:
+    """1/f offset drift statistics"""
+
+    def test_stationary_std(self):
+        """Test: Column and global drift hold the configured std from the first frame on"""
+        np.random.seed(21)
+        sensor = SensorNonUniformity(width=4000, height=2, cache_dir=None, frame_rate_hz=30.0,
+                                     drift_std_c=0.15, column_drift_std_c=0.03,
+                                     drift_time_constants_s=(0.1, 1.0))
+
+        column_std = []
+        global_drift = np.empty(3000)
+        for index in range(len(global_drift)):
+            sensor.step_drift()
+            global_drift[index] = sensor.global_drift_c
+            if index in (0, 100, 2999):
+                column_std.append(np.std(sensor.column_drift_c))
+
+        # No warm-up: the spread across columns is already stationary on frame 0
+        assert np.allclose(column_std, 0.03, rtol=0.05)
+        # ~100 independent samples of the slowest pole: allow ~2.5 standard errors
+        assert abs(np.std(global_drift) - 0.15) < 0.15 * 0.2
+        assert abs(np.mean(global_drift)) < 0.15 * 0.3
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit tests for thermal hot-spot rendering
+
+Tests validate that:
+- Windowed Gaussian stamps match a full-frame Gaussian at the exact sub-pixel
+  centre for small (1-2 px FWHM) and large spots
+- Uniform discs cover exactly the pixels within the radius
+- The batch API equals stamping the spots one by one
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-11
+"""
+
+import sys
+import numpy as np
+from pathlib import Path
+
+# Add simulations directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'simulations'))
+
+from simulate_thermal import ThermalSimulator
+
+
+def _full_frame_gaussian(shape, x_center, y_center, size_pixels):
+    """Reference Gaussian evaluated over the whole frame."""
+    sigma = size_pixels / 2.355
+    yy, xx = np.mgrid[0:shape[0], 0:shape[1]]
+    return np.exp(-((xx - x_center)**2 + (yy - y_center)**2) / (2 * sigma**2))
+
+
+class TestHotSpotStamps:
+    """Local-window stamps against full-frame references"""
+
+    def setup_method(self):
+        self.sim = ThermalSimulator(width=160, height=128)
+        self.background = np.full((128, 160), 5.0)
+        self.rng = np.random.default_rng(0)
+
+    def test_gaussian_matches_full_frame(self):
+        """Test: Stamps of 1-40 px FWHM at random sub-pixel centres match the reference"""
+        for size in (1.0, 1.3, 1.7, 2.0, 3.1, 8.6, 17.0, 40.0):
+            for _ in range(10):
+                x, y = self.rng.uniform([60, 50], [100, 78])
+                image = self.sim.add_hot_spot(self.background, (x, y), 50.0, size)
+                expected = 45.0 * _full_frame_gaussian(image.shape, x, y, size)
+                # Only the +/-4 sigma window truncation remains (exp(-8) of the peak)
+                assert np.abs((image - self.background) - expected).max() < 45.0 * 4e-4, size
+
+    def test_uniform_disc_pixels(self):
+        """Test: A uniform spot sets exactly the pixels within size / 2 of the centre"""
+        for size in (1.0, 2.5, 7.0):
+            x, y = self.rng.uniform([60, 50], [100, 78])
+            image = self.sim.add_hot_spot(self.background, (x, y), 50.0, size, shape='uniform')
+            yy, xx = np.mgrid[0:128, 0:160]
+            disc = (xx - x)**2 + (yy - y)**2 <= (size / 2)**2
+            assert np.array_equal(image == 50.0, disc), size
+
+    def test_clipped_at_border_and_batch(self):
+        """Test: Spots over the border clip; add_hot_spots equals sequential add_hot_spot"""
+        positions = np.array([[-2.3, 40.6], [158.8, 127.2], [80.4, 64.9], [81.1, 66.2]])
+        sizes = np.array([6.0, 3.0, 1.4, 12.0])
+        batch = self.sim.add_hot_spots(self.background, positions, 30.0, sizes)
+
+        expected = self.background.copy()
+        for position, size in zip(positions, sizes):
+            expected += 25.0 * _full_frame_gaussian(expected.shape, *position, size)
+        assert np.abs(batch - expected).max() < 25.0 * 4e-4 * len(sizes)
+
+        # Peaks are relative to the background, so sequential stamping agrees
+        sequential = self.background.copy()
+        for position, size in zip(positions, sizes):
+            self.sim.add_hot_spot(self.background, position, 30.0, size, out=sequential)
+        assert np.allclose(batch, sequential)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for slew-to-cue search patterns
+
+Tests validate that:
+- Hexagonal-lattice dwells cover every point of the search ellipse within
+  one footprint radius (circles and ellipses, small to large)
+- Placed patterns cover the ellipse on the sky (pan widened by 1 / cos(tilt))
+- The batch `generate_search_patterns` equals per-cue
+  `generate_spiral_search_pattern`
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-11
+"""
+
+import sys
+import numpy as np
+import pytest
+from pathlib import Path
+from scipy.spatial import cKDTree
+
+# Add control directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'control'))
+
+from slew_to_cue import SlewToCueController, _unit_search_pattern
+
+
+def _ellipse_points(semi_major, semi_minor, num=20000, seed=0):
+    """Uniform interior samples plus a dense rim of an axis-aligned ellipse."""
+    rng = np.random.default_rng(seed)
+    radius = np.sqrt(rng.random(num))
+    angle = rng.uniform(0.0, 2 * np.pi, num)
+    rim = np.linspace(0.0, 2 * np.pi, 4000, endpoint=False)
+    x = np.concatenate([semi_major * radius * np.cos(angle), semi_major * np.cos(rim)])
+    y = np.concatenate([semi_minor * radius * np.sin(angle), semi_minor * np.sin(rim)])
+    return np.column_stack([x, y])
+
+
+def _unit_vectors(pan_deg, tilt_deg):
+    pan, tilt = np.radians(pan_deg), np.radians(tilt_deg)
+    return np.stack([np.cos(tilt) * np.sin(pan), np.cos(tilt) * np.cos(pan), np.sin(tilt)], axis=-1)
+
+
+class TestUnitPattern:
+    """Footprint coverage in footprint radii"""
+
+    @pytest.mark.parametrize('semi_major, semi_minor', [
+        (0.25, 0.25), (1.0, 1.0), (2.5, 2.5), (6.0, 6.0), (12.0, 12.0),
+        (3.0, 1.0), (7.5, 2.25), (12.0, 4.0), (5.0, 0.25),
+    ])
+    def test_no_gaps(self, semi_major, semi_minor):
+        """Test: Every ellipse point lies within one footprint radius of a dwell"""
+        dwells = _unit_search_pattern(semi_major, semi_minor)
+        distance, _ = cKDTree(dwells).query(_ellipse_points(semi_major, semi_minor))
+        assert distance.max() <= 1.0 + 1e-3
+        assert np.allclose(dwells[0], 0.0)  # Centre first
+
+    def test_small_ellipse_is_one_dwell(self):
+        """Test: An ellipse inside one footprint needs a single dwell"""
+        assert len(_unit_search_pattern(0.9, 0.5)) == 1
+
+    def test_dwell_count_scales_with_area(self):
+        """Test: Pruned patterns stay close to area / hexagon-cell area"""
+        cell_area = 1.5 * np.sqrt(3.0)  # Hexagon of circumradius 1
+        for radius in (6.0, 12.0):
+            num = len(_unit_search_pattern(radius, radius))
+            assert num < 1.5 * np.pi * radius**2 / cell_area
+
+
+class TestPlacedPatterns:
+    """Patterns in pan/tilt degrees"""
+
+    def setup_method(self):
+        self.controller = SlewToCueController(37.7749, -122.4194, 50.0, fov_deg=50.0,
+                                              search_fov_deg=1.0)
+
+    @pytest.mark.parametrize('tilt_deg', [0.0, 40.0])
+    def test_sky_coverage(self, tilt_deg):
+        """Test: A rotated search ellipse is covered on the sky at low and high tilt"""
+        semi_major, semi_minor, orientation = 2.2, 0.9, 35.0
+        dwells = self.controller.generate_spiral_search_pattern(
+            120.0, tilt_deg, semi_major, semi_minor, orientation)
+
+        # Ellipse points as (cross-elevation, tilt) offsets, rotated like the pattern
+        points = _ellipse_points(semi_major, semi_minor, num=5000)
+        angle = np.radians(orientation)
+        d_cross = np.cos(angle) * points[:, 0] - np.sin(angle) * points[:, 1]
+        d_tilt = np.sin(angle) * points[:, 0] + np.cos(angle) * points[:, 1]
+        point_tilt = tilt_deg + d_tilt
+        point_pan = 120.0 + d_cross / np.cos(np.radians(point_tilt))
+
+        cosine = _unit_vectors(point_pan, point_tilt) @ _unit_vectors(dwells[:, 0], dwells[:, 1]).T
+        nearest_deg = np.degrees(np.arccos(np.clip(cosine.max(axis=1), -1.0, 1.0)))
+        assert nearest_deg.max() <= (1.0 + 1e-3) * self.controller.footprint_radius_deg
+
+    def test_batch_matches_per_cue(self):
+        """Test: generate_search_patterns rows equal generate_spiral_search_pattern"""
+        rng = np.random.default_rng(4)
+        n = 40
+        pan = rng.uniform(0.0, 360.0, n)
+        tilt = rng.uniform(-5.0, 60.0, n)
+        major = rng.uniform(0.5, 3.0, n)
+        minor = major * rng.uniform(0.2, 1.0, n)
+        orientation = rng.uniform(-90.0, 90.0, n)
+
+        for semi_minor in (minor, None):
+            points, num_points = self.controller.generate_search_patterns(
+                pan, tilt, major, semi_minor, orientation)
+            assert points.shape == (n, num_points.max(), 2)
+            for i in range(n):
+                single = self.controller.generate_spiral_search_pattern(
+                    pan[i], tilt[i], major[i], None if semi_minor is None else semi_minor[i],
+                    orientation[i])
+                assert num_points[i] == len(single)
+                assert np.allclose(points[i, :len(single)], single)
+                assert np.all(np.isnan(points[i, len(single):]))
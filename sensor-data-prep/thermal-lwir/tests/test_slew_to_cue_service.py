@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming slew-to-cue service
+
+Tests validate that:
+- TrackStateTable keeps a track on its row and hands expired rows to new tracks
+- Binary command frames written by BinaryCommandSink decode back in sequence
+- min_cue_interval_s holds back repeat cues but never a new track's first cue
+- The UDP receiver drops the oldest scan when the input queue is full
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-17
+"""
+
+import io
+import sys
+import asyncio
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Add control directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'control'))
+
+from slew_to_cue_service import (
+    COMMAND_DTYPE, BinaryCommandSink, SlewToCueService, TrackStateTable, decode_command_frame
+)
+from radar_live_emitter import PLOT_DTYPE, RadarPlotReceiver, encode_datagram
+from timebase import NS_PER_SECOND
+from slew_to_cue import SlewToCueController
+
+
+def _plots(track_ids):
+    """One scan of plots ~1 km north of the turret."""
+    plots = np.zeros(len(track_ids), dtype=PLOT_DTYPE)
+    plots['track_id'] = track_ids
+    plots['azimuth_deg'] = 10.0 * np.arange(len(track_ids))
+    plots['elevation_deg'] = 5.0
+    plots['range_m'] = 1000.0
+    plots['confidence'] = 0.9
+    return plots
+
+
+class TestTrackStateTable:
+    """Row allocation, expiry and reuse"""
+
+    def setup_method(self):
+        self.table = TrackStateTable(capacity=4, timeout_s=5.0)
+
+    def _touch(self, radar_id, track_ids, time_ns):
+        rows, is_new = self.table.rows_for(radar_id, track_ids)
+        n = len(rows)
+        self.table.update(rows, is_new, time_ns, np.zeros(n), np.zeros(n), np.zeros(n))
+        return rows, is_new
+
+    def test_known_tracks_keep_their_rows(self):
+        """Test: Repeat IDs map to the same rows, duplicates within a scan share one row"""
+        rows, is_new = self._touch(0, [3, 7], 0)
+        assert is_new.all() and len(set(rows.tolist())) == 2
+
+        again, is_new = self._touch(0, [7, 3, 7], NS_PER_SECOND)
+        assert not is_new.any()
+        assert list(again) == [rows[1], rows[0], rows[1]]
+        assert self.table.num_updates[rows[1]] == 2  # Fancy-index add counts once per scan
+
+        # Same track ID on another radar is another track
+        other, is_new = self.table.rows_for(1, [3])
+        assert is_new[0] and other[0] not in rows
+
+    def test_expired_rows_are_reused(self):
+        """Test: Stale tracks are released and their rows go to the next new track"""
+        stale_rows, _ = self._touch(0, [3, 7], 0)
+        kept_rows, _ = self._touch(0, [9], 4 * NS_PER_SECOND)
+
+        assert self.table.expire(5 * NS_PER_SECOND) == 0  # Exactly at the timeout
+        assert self.table.expire(5 * NS_PER_SECOND + 1) == 2
+        assert len(self.table) == 1
+        assert not self.table.active[stale_rows].any()
+        assert np.all(self.table.track_id[stale_rows] == -1)
+
+        rows, is_new = self._touch(0, [11, 3], 6 * NS_PER_SECOND)
+        assert is_new.all()  # The old ID 3 starts over as a new track
+        assert set(rows.tolist()) == set(stale_rows.tolist())
+        assert self.table.num_updates[rows].tolist() == [1, 1]
+        assert self.table.rows_for(0, [9])[0][0] == kept_rows[0]
+        assert len(self.table.active) == 4  # No growth needed
+
+    def test_grows_past_capacity(self):
+        """Test: More live tracks than rows doubles the table and keeps old state"""
+        first, _ = self._touch(0, [0, 1, 2], 0)
+        self.table.pan_deg[first] = [1.0, 2.0, 3.0]
+        rows, is_new = self._touch(0, [0, 1, 2, 3, 4, 5], NS_PER_SECOND)
+
+        assert len(self.table.active) == 8
+        assert list(is_new) == [False] * 3 + [True] * 3
+        assert list(rows[:3]) == list(first)
+        assert len(set(rows.tolist())) == 6
+        assert np.all(self.table.track_id[rows[3:]] == [3, 4, 5])
+
+
+class TestCommandFrames:
+    """BinaryCommandSink -> decode_command_frame"""
+
+    def _commands(self, n, time_ns):
+        commands = np.zeros(n, dtype=COMMAND_DTYPE)
+        commands['timestamp_ns'] = time_ns
+        commands['cue_timestamp_ns'] = time_ns - 1000
+        commands['radar_id'] = 2
+        commands['is_new_track'] = np.arange(n) % 2
+        commands['target_id'] = np.arange(n) + 100
+        commands['pan_deg'] = np.linspace(-90.0, 90.0, n)
+        commands['tilt_deg'] = 4.5
+        commands['range_m'] = 1234.5
+        commands['search_radius_deg'] = 0.75
+        commands['num_updates'] = np.arange(n)
+        return commands
+
+    def test_frames_round_trip(self):
+        """Test: Consecutive frames decode with header, sequence and commands intact"""
+        stream = io.BytesIO()
+        sink = BinaryCommandSink(stream)
+        batches = [self._commands(5, 1_768_564_800 * NS_PER_SECOND), self._commands(1, 42)]
+        for commands in batches:
+            sink.write(commands)
+        data = stream.getvalue()
+
+        offset = 0
+        for sequence, commands in enumerate(batches):
+            header, decoded, offset = decode_command_frame(data, offset)
+            assert header == {'num_commands': len(commands), 'sequence': sequence,
+                              'timestamp_ns': int(commands['timestamp_ns'][0])}
+            assert decoded.dtype == COMMAND_DTYPE
+            assert np.array_equal(decoded, commands)
+        assert offset == len(data)
+        assert sink.num_written == 6 and sink.sequence == 2
+
+    def test_bad_magic_rejected(self):
+        """Test: A buffer that is not a command frame raises ValueError"""
+        stream = io.BytesIO()
+        BinaryCommandSink(stream).write(self._commands(2, 1))
+        data = b'XXXX' + stream.getvalue()[4:]
+        with pytest.raises(ValueError):
+            decode_command_frame(data)
+
+
+class TestCueGating:
+    """SlewToCueService.process_scan rate limiting"""
+
+    def setup_method(self):
+        controller = SlewToCueController(37.7790, -122.4120, 50.0, fov_deg=50.0)
+        self.service = SlewToCueService(controller, min_cue_interval_s=1.0)
+
+    def _scan(self, time_s, track_ids):
+        header = {'radar_id': 0, 'scan_time_ns': int(time_s * NS_PER_SECOND)}
+        return self.service.process_scan(header, _plots(track_ids))
+
+    def test_min_cue_interval(self):
+        """Test: Repeat cues wait min_cue_interval_s, new tracks cue at once"""
+        commands = self._scan(0.0, [1, 2, -1])
+        assert list(commands['target_id']) == [1, 2]
+        assert commands['is_new_track'].all()
+        assert self.service.num_false_alarms == 1
+
+        commands = self._scan(0.5, [1, 2, 3])
+        assert list(commands['target_id']) == [3]  # Only the new track
+        assert commands['is_new_track'].all()
+
+        commands = self._scan(1.0, [1, 2, 3])
+        assert list(commands['target_id']) == [1, 2]  # Track 3 was cued 0.5 s ago
+        assert not commands['is_new_track'].any()
+        assert list(commands['num_updates']) == [3, 3]
+        assert np.all(commands['cue_timestamp_ns'] == NS_PER_SECOND)
+
+        commands = self._scan(1.5, [1, 2, 3])
+        assert list(commands['target_id']) == [3]
+
+    def test_zero_interval_cues_every_scan(self):
+        """Test: Without rate limiting every tracked plot yields a command"""
+        self.service.min_cue_interval_ns = 0
+        for time_s in (0.0, 0.1, 0.2):
+            assert list(self._scan(time_s, [4, -1, 5])['target_id']) == [4, 5]
+        assert self.service.num_false_alarms == 3
+
+
+class TestBackpressure:
+    """UDP receiver with a full input queue"""
+
+    def test_drops_oldest_scan(self):
+        """Test: A full queue loses its oldest scan, newest scans are kept in order"""
+        async def receive():
+            queue = asyncio.Queue(maxsize=2)
+            receiver = RadarPlotReceiver(queue)
+            for sequence in range(5):
+                data = encode_datagram(7, sequence, sequence * NS_PER_SECOND, 0,
+                                       _plots([sequence]))
+                receiver.datagram_received(data, ('127.0.0.1', 50032))
+            items = [queue.get_nowait() for _ in range(queue.qsize())]
+            return receiver, items
+
+        receiver, items = asyncio.run(receive())
+        assert receiver.num_received == 5
+        assert receiver.num_dropped == 3
+        assert [header['sequence'] for header, _ in items] == [3, 4]
+        for header, plots in items:
+            assert header['radar_id'] == 7
+            assert list(plots['track_id']) == [header['sequence']]
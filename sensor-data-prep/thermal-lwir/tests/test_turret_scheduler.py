@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the multi-target turret tasking scheduler
+
+Tests validate that:
+- Slew times follow the triangular (short move) and trapezoidal (rate
+  limited) profiles, pan the short way round, slower axis wins
+- A looked-at track waits min_revisit_s; plan() idles until the next
+  cooldown ends instead of stopping
+- Cooldown entries left by an expired track never release the track that
+  reuses its row
+- The new-track bonus applies until the first look only
+
+Author: Veridical Perception - Sensor Team
+Date: 2026-01-17
+"""
+
+import sys
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Add control directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'control'))
+
+from turret_scheduler import TurretScheduler, TurretSlewModel
+
+
+class TestSlewModel:
+    """Trapezoidal / triangular move times"""
+
+    def setup_method(self):
+        # Pan ramps over 60^2 / 120 = 30 deg, tilt over 30^2 / 90 = 10 deg
+        self.model = TurretSlewModel(max_rate_pan_deg_s=60.0, max_rate_tilt_deg_s=30.0,
+                                     accel_pan_deg_s2=120.0, accel_tilt_deg_s2=90.0, settle_s=0.05)
+
+    def test_triangular_and_trapezoidal(self):
+        """Test: Short moves never reach the rate limit, long moves cruise"""
+        pan_to = np.array([10.0, 30.0, 90.0])
+        slew_s = self.model.slew_time(0.0, 0.0, pan_to, 0.0)
+        expected = [2.0 * np.sqrt(10.0 / 120.0),  # Triangular
+                    1.0,                          # Both profiles agree at the ramp length
+                    90.0 / 60.0 + 60.0 / 120.0]   # Trapezoidal
+        assert np.allclose(slew_s, np.array(expected) + 0.05)
+
+    def test_short_way_round_and_slower_axis(self):
+        """Test: 350 -> 10 deg pans 20 deg; a long tilt sets the time"""
+        assert np.isclose(self.model.slew_time(350.0, 0.0, 10.0, 0.0),
+                          self.model.slew_time(0.0, 0.0, 20.0, 0.0))
+        # Tilt 20 deg (trapezoidal, 1.0 s) outlasts pan 5 deg (triangular, ~0.41 s)
+        assert np.isclose(self.model.slew_time(0.0, 0.0, 5.0, 20.0), 20.0 / 30.0 + 30.0 / 90.0 + 0.05)
+        assert np.isclose(self.model.slew_time(45.0, 5.0, 45.0, 5.0), 0.05)
+
+
+class TestScheduler:
+    """Cooldown gating, expiry, priorities"""
+
+    def setup_method(self):
+        self.scheduler = TurretScheduler(dwell_s=0.4, min_revisit_s=1.0, cue_timeout_s=3.0)
+
+    def _cue(self, time_s, target_ids, pan_deg=0.0, threat=None):
+        n = len(target_ids)
+        self.scheduler.update_cues(time_s, target_ids, np.full(n, pan_deg), np.zeros(n),
+                                   np.full(n, 1000.0), np.full(n, 1.0), threat)
+
+    def test_min_revisit_and_idle_until_cooldown(self):
+        """Test: One track is revisited every min_revisit_s, the turret idles in between"""
+        self._cue(0.0, [7])
+        looks = self.scheduler.plan(0.0, 3.0)
+
+        # Slew is the settle time only; dwell 0.4 s, cooldown 1.0 s from on-target
+        assert [look['target_id'] for look in looks] == [7, 7, 7]
+        assert np.allclose([look['on_target_s'] for look in looks], [0.05, 1.10, 2.15])
+        assert np.allclose([look['start_s'] for look in looks[1:]], [1.05, 2.10])
+        assert np.allclose(self.scheduler.revisit_intervals, [1.05, 1.05])
+        # Next cooldown ends past the horizon: plan stops
+        assert self.scheduler.busy_until_s == pytest.approx(2.55)
+
+    def test_cooling_track_is_not_schedulable(self):
+        """Test: next_look returns None while the only track cools down"""
+        self._cue(0.0, [1])
+        assert self.scheduler.next_look(0.0)['target_id'] == 1
+        assert self.scheduler.next_look(0.5) is None
+        assert self.scheduler.next_look(1.05)['target_id'] == 1
+
+    def test_stale_cooldown_entry_after_expire(self):
+        """Test: An expired track's pending cooldown does not release the row's new track"""
+        scheduler = TurretScheduler(dwell_s=0.4, min_revisit_s=5.0, cue_timeout_s=0.5)
+        self.scheduler = scheduler
+        self._cue(0.0, [5])
+        first = scheduler.next_look(0.0)            # Cooldown entry due at 5.05
+        row = scheduler._row_of[5]
+
+        assert scheduler.expire(1.0) == 1
+        assert scheduler._row_of[5] == -1 and scheduler.target_id[row] == -1
+        self._cue(1.0, [9])
+        assert scheduler._row_of[9] == row          # Freed row is reused
+        assert scheduler.num_looks[row] == 0
+        second = scheduler.next_look(1.0)           # Cooldown entry due at 6.05
+        assert (first['target_id'], second['target_id']) == (5, 9)
+
+        self._cue(5.1, [9])
+        assert scheduler.next_look(5.1) is None     # Entry for track 5 is ignored
+        self._cue(6.0, [9])
+        assert scheduler.next_look(6.05)['target_id'] == 9
+        assert scheduler.revisit_intervals == [pytest.approx(5.05)]
+
+    def test_new_track_bonus_once(self):
+        """Test: Unlooked tracks outrank looked ones; the bonus goes with the first look"""
+        self._cue(0.0, [1, 2], threat=np.array([0.9, 0.1]))
+        bonus = self.scheduler._new_track_bonus
+        rows = self.scheduler._row_of[[1, 2]]
+        with_bonus = self.scheduler.base_priority[rows].copy()
+
+        looks = self.scheduler.plan(0.0, 0.5)
+        assert [look['target_id'] for look in looks] == [1, 2]  # Higher threat first
+        assert np.allclose(self.scheduler.base_priority[rows], with_bonus - bonus)
+
+        # Refreshed cues keep the bonus off
+        self._cue(1.0, [1, 2], threat=np.array([0.9, 0.1]))
+        assert np.allclose(self.scheduler.base_priority[rows], with_bonus - bonus)
+
+    def test_slew_penalty_prefers_nearby_cue(self):
+        """Test: Between equal cues the one closer to the current pose goes first"""
+        self._cue(0.0, [3], pan_deg=170.0)
+        self._cue(0.0, [4], pan_deg=10.0)
+        assert self.scheduler.next_look(0.0)['target_id'] == 4